@@ -2,48 +2,202 @@
 
 from typing import TYPE_CHECKING
 
-from homeassistant.const import CONF_NAME, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
-
-from .const import DOMAIN, LOGGER
-from .coordinator import SamsungTVCoordinator
+import voluptuous as vol
+
+from .const import (
+    CONF_FAST_PATH,
+    CONF_MAX_CONCURRENT_POLLS,
+    CONF_SHARED_POLLING,
+    CONF_SLIM_MODEL,
+    CONF_WEBSOCKET_REMOTE,
+    DATA_FAST_PATH,
+    DATA_HUB,
+    DATA_RENEWALS,
+    DATA_SLIM_MODEL,
+    DATA_WEBSOCKET_REMOTE,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DOMAIN,
+    LOGGER,
+    OPTION_MAX_VOLUME_LEVEL,
+    OPTION_MIN_VOLUME_LEVEL,
+    OPTION_MIRROR_CURVE,
+    OPTION_MIRROR_TARGETS,
+)
 
 if TYPE_CHECKING:
-    pass
-
-PLATFORMS: list[Platform] = [
-    Platform.MEDIA_PLAYER,
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
+
+# Home Assistant is imported lazily so that the standalone CLI
+# (python -m custom_components.samsung_tv_volume) can run without it.
+# The platform names are the values of homeassistant.const.Platform.
+PLATFORMS: list[str] = [
+    "media_player",
 ]
 
+# Optional YAML under samsung_tv_volume:, every flag off by default.
+# shared_polling polls all TVs from one shared timer, running at most
+# max_concurrent_polls polls at once. websocket_remote sets volume over the
+# 2016+ remote channel too, fast_path uses precompiled Get/SetVolume requests
+# and slim_model keeps only RenderingControl of each TV's description.
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                vol.Optional(CONF_SHARED_POLLING, default=False): bool,
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_POLLS, default=DEFAULT_MAX_CONCURRENT_POLLS
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional(CONF_WEBSOCKET_REMOTE, default=False): bool,
+                vol.Optional(CONF_FAST_PATH, default=False): bool,
+                vol.Optional(CONF_SLIM_MODEL, default=False): bool,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: "HomeAssistant", config: "ConfigType") -> bool:
+    """Set up shared state from the optional YAML configuration."""
+    from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+    from .renewal import SubscriptionRenewalScheduler
+
+    renewals = hass.data[DATA_RENEWALS] = SubscriptionRenewalScheduler()
+
+    async def _async_stop(_event: "Event") -> None:
+        # Entities still listen, so no timer may poll a TV being shut down
+        if hub := hass.data.get(DATA_HUB):
+            hub.async_stop()
+        entries = hass.data.get(DOMAIN, {}).values()
+        try:
+            if coordinators := [data["coordinator"] for data in entries]:
+                from .coordinator import async_shutdown_coordinators
+
+                # All TVs at once, so one unreachable TV cannot hold up the rest
+                await async_shutdown_coordinators(coordinators)
+        finally:
+            await renewals.async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+
+    conf = config.get(DOMAIN)
+    if conf and conf[CONF_SHARED_POLLING]:
+        from .hub import SamsungTVHub
+
+        hass.data[DATA_HUB] = SamsungTVHub(hass, conf[CONF_MAX_CONCURRENT_POLLS])
+        LOGGER.debug("Polling all Samsung TVs from a shared hub")
+    if conf and conf[CONF_WEBSOCKET_REMOTE]:
+        hass.data[DATA_WEBSOCKET_REMOTE] = True
+    if conf and conf[CONF_FAST_PATH]:
+        hass.data[DATA_FAST_PATH] = True
+    if conf and conf[CONF_SLIM_MODEL]:
+        hass.data[DATA_SLIM_MODEL] = True
+
+    return True
+
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: "HomeAssistant", entry: "ConfigEntry") -> bool:
     """Set up Samsung TV Volume Control from a config entry."""
+    from homeassistant.const import CONF_NAME
+    from homeassistant.helpers.importlib import async_import_module
+
+    # The coordinator and the UPnP client are only needed once a TV is set
+    # up; the first entry loads them in the import executor, off the loop
+    await async_import_module(hass, f"{__name__}.coordinator")
+    from .coordinator import SamsungTVCoordinator
+
     LOGGER.debug("Setting up Samsung TV Volume Control: %s", entry.data)
 
     # Create coordinator
     coordinator = SamsungTVCoordinator(
         hass, entry.data["location"], entry.data[CONF_NAME], entry.data["udn"]
     )
+    coordinator.websocket_remote = hass.data.get(DATA_WEBSOCKET_REMOTE, False)
+    coordinator.fast_path = hass.data.get(DATA_FAST_PATH, False)
+    coordinator.slim = hass.data.get(DATA_SLIM_MODEL, False)
+    coordinator.renewal_scheduler = hass.data.get(DATA_RENEWALS)
+    coordinator.async_set_volume_limits(
+        entry.options.get(OPTION_MIN_VOLUME_LEVEL),
+        entry.options.get(OPTION_MAX_VOLUME_LEVEL),
+    )
+    if targets := entry.options.get(OPTION_MIRROR_TARGETS):
+        await coordinator.async_set_volume_mirror(
+            targets, entry.options.get(OPTION_MIRROR_CURVE)
+        )
 
     # Store coordinator in hass.data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator}
 
+    # Let the shared hub poll this TV instead of a per-entry timer
+    if hub := hass.data.get(DATA_HUB):
+        hub.async_add(coordinator)
+
     # Initial refresh
     try:
         await coordinator.async_config_entry_first_refresh()
     except Exception as err:
         LOGGER.error("Error setting up Samsung TV coordinator: %s", err)
+        if hub:
+            hub.async_remove(coordinator)
         return False
 
+    # Watch announcements for reboots (BOOTID) of this TV
+    if "ssdp" in hass.config.components:
+        from homeassistant.components import ssdp
+
+        entry.async_on_unload(
+            await ssdp.async_register_callback(
+                hass, coordinator.handle_ssdp_announcement, {"_udn": entry.data["udn"]}
+            )
+        )
+
+    # A TV found at a new address is moved in place instead of reloaded
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    await _async_migrate_unique_id(hass, entry)
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def _async_migrate_unique_id(hass: "HomeAssistant", entry: "ConfigEntry") -> None:
+    """Key the entity and its device on the UDN instead of the first location."""
+    from homeassistant.core import callback
+    from homeassistant.helpers import device_registry as dr
+    from homeassistant.helpers import entity_registry as er
+
+    unique_id = f"{DOMAIN}_{entry.data['udn']}"
+    device_registry = dr.async_get(hass)
+
+    @callback
+    def _async_migrate(entity_entry: er.RegistryEntry) -> dict[str, str] | None:
+        if entity_entry.unique_id == unique_id:
+            return None
+        LOGGER.debug("Migrating unique id %s to %s", entity_entry.unique_id, unique_id)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, entity_entry.unique_id)}
+        ):
+            device_registry.async_update_device(
+                device.id, new_identifiers={(DOMAIN, unique_id)}
+            )
+        return {"new_unique_id": unique_id}
+
+    await er.async_migrate_entries(hass, entry.entry_id, _async_migrate)
+
+
+async def _async_update_listener(hass: "HomeAssistant", entry: "ConfigEntry") -> None:
+    """Push a changed TV location into the running coordinator."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator.async_update_location(entry.data["location"])
+
+
+async def async_unload_entry(hass: "HomeAssistant", entry: "ConfigEntry") -> bool:
     """Unload Samsung TV Volume Control config entry."""
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -53,7 +207,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry_data = hass.data[DOMAIN].get(entry.entry_id, {})
         coordinator = entry_data.get("coordinator")
         if coordinator:
-            await coordinator.async_shutdown()
+            if hub := hass.data.get(DATA_HUB):
+                hub.async_remove(coordinator)
+            from .coordinator import SHUTDOWN_TIMEOUT
+
+            await coordinator.async_shutdown(hass.loop.time() + SHUTDOWN_TIMEOUT)
 
         # Remove stored data
         hass.data[DOMAIN].pop(entry.entry_id, None)
@@ -0,0 +1,7 @@
+"""Run the Samsung TV Volume Control command line interface."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
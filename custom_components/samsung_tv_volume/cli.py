@@ -0,0 +1,277 @@
+"""
+Standalone command line interface for Samsung TV Volume Control.
+
+Runs SamsungTVUPnPDevice directly, without Home Assistant, for debugging
+and load testing TVs from a laptop:
+
+    python -m custom_components.samsung_tv_volume discover
+    python -m custom_components.samsung_tv_volume get http://192.168.1.219:7676/smp_14_
+    python -m custom_components.samsung_tv_volume bench -n 200 -c 8 LOCATION...
+    python -m custom_components.samsung_tv_volume record LOCATION tv.json
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from async_upnp_client.aiohttp import AiohttpNotifyServer, AiohttpRequester
+from async_upnp_client.search import async_search
+from async_upnp_client.utils import CaseInsensitiveDict, get_local_ip
+
+from .traffic import async_record_session
+from .upnp_device import RENDERING_CONTROL, SamsungTVUPnPDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class BenchResult:
+    """Latencies and errors collected for one operation type."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        """Return the number of attempted operations."""
+        return len(self.latencies) + self.errors
+
+    @property
+    def error_rate(self) -> float:
+        """Return the fraction of failed operations."""
+        return self.errors / self.count if self.count else 0.0
+
+    def percentile(self, percent: int) -> float | None:
+        """Return a latency percentile in seconds, None without samples."""
+        if not self.latencies:
+            return None
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[
+            percent - 1
+        ]
+
+
+async def async_discover(search_time: int) -> list[CaseInsensitiveDict]:
+    """Search for Samsung TVs exposing RenderingControl for search_time seconds."""
+    found: dict[str, CaseInsensitiveDict] = {}
+
+    async def _on_response(headers: CaseInsensitiveDict) -> None:
+        if "Samsung" in headers.get("SERVER", ""):
+            found.setdefault(headers.get("LOCATION", ""), headers)
+
+    await async_search(
+        _on_response, timeout=search_time, search_target=RENDERING_CONTROL
+    )
+    return list(found.values())
+
+
+async def async_bench(
+    locations: Sequence[str],
+    operations: int,
+    concurrency: int,
+    *,
+    fast_path: bool = False,
+    slim: bool = False,
+) -> dict[str, BenchResult]:
+    """Drive concurrent get/set operations against TVs and collect latencies."""
+    results = {"get": BenchResult(), "set": BenchResult()}
+    devices = [
+        SamsungTVUPnPDevice(location, fast_path=fast_path, slim=slim)
+        for location in locations
+    ]
+    try:
+        await asyncio.gather(*(device.async_setup() for device in devices))
+
+        # Write back the volume each TV already has, so the bench is inaudible
+        volumes = await asyncio.gather(
+            *(device.async_get_volume() for device in devices)
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(index: int) -> None:
+            device_index = index % len(devices)
+            device = devices[device_index]
+            kind = "set" if index % 2 else "get"
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    if kind == "set":
+                        await device.async_set_volume(volumes[device_index])
+                    else:
+                        await device.async_get_volume()
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.debug(
+                        "Bench %s failed on %s: %s", kind, device.location, err
+                    )
+                    results[kind].errors += 1
+                else:
+                    results[kind].latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(_run(index) for index in range(operations)))
+    finally:
+        await asyncio.gather(
+            *(device.async_close() for device in devices), return_exceptions=True
+        )
+
+    return results
+
+
+def _format_ms(seconds: float | None) -> str:
+    """Format a latency for display."""
+    return "-" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+
+def _print_bench(results: dict[str, BenchResult]) -> None:
+    """Print latency percentiles and error rates."""
+    print(f"{'op':<4} {'count':>6} {'errors':>7} {'p50':>9} {'p90':>9} {'p99':>9}")
+    for kind, result in results.items():
+        print(
+            f"{kind:<4} {result.count:>6} {result.error_rate:>7.1%} "
+            f"{_format_ms(result.percentile(50)):>9} "
+            f"{_format_ms(result.percentile(90)):>9} "
+            f"{_format_ms(result.percentile(99)):>9}"
+        )
+
+
+async def _async_watch(location: str, duration: float | None) -> None:
+    """Print volume events from a TV until interrupted or duration passes."""
+    requester = AiohttpRequester(timeout=10)
+    server = AiohttpNotifyServer(requester, source=(get_local_ip(location), 0))
+    await server.async_start_server()
+    device = SamsungTVUPnPDevice(
+        location, requester=requester, event_handler=server.event_handler
+    )
+    try:
+        await device.async_setup()
+        print(f"volume {await device.async_get_volume()}")
+        if not await device.async_subscribe_events(
+            lambda volume: print(f"volume {volume}", flush=True)
+        ):
+            msg = "Event subscription failed"
+            raise RuntimeError(msg)
+        await asyncio.sleep(duration if duration else float("inf"))
+    finally:
+        await device.async_close()
+        await server.async_stop_server()
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    """Run the selected subcommand."""
+    if args.command == "discover":
+        for headers in await async_discover(args.timeout):
+            print(f"{headers.get('LOCATION')}  {headers.get('USN')}")
+        return 0
+
+    if args.command == "bench":
+        _print_bench(
+            await async_bench(
+                args.locations,
+                args.count,
+                args.concurrency,
+                fast_path=args.fast_path,
+                slim=args.slim,
+            )
+        )
+        return 0
+
+    if args.command == "watch":
+        await _async_watch(args.location, args.duration)
+        return 0
+
+    if args.command == "record":
+        records = await async_record_session(
+            args.location,
+            args.output,
+            polls=args.polls,
+            interval=args.interval,
+            events=not args.no_events,
+        )
+        print(f"recorded {len(records)} exchanges to {args.output}")
+        return 0
+
+    device = SamsungTVUPnPDevice(
+        args.location, fast_path=args.fast_path, slim=args.slim
+    )
+    try:
+        await device.async_setup()
+        if args.command == "set":
+            await device.async_set_volume(args.volume)
+        print(await device.async_get_volume())
+    finally:
+        await device.async_close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.samsung_tv_volume",
+        description="Control and benchmark Samsung TV volume over UPnP.",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    parser.add_argument(
+        "--fast-path",
+        action="store_true",
+        help="use precompiled Get/SetVolume envelopes instead of the generic client",
+    )
+    parser.add_argument(
+        "--slim",
+        action="store_true",
+        help="keep only the RenderingControl part of the device model",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    discover = commands.add_parser("discover", help="find TVs via SSDP")
+    discover.add_argument("--timeout", type=int, default=5, help="seconds to listen")
+
+    get = commands.add_parser("get", help="print current volume")
+    get.add_argument("location", help="device description URL")
+
+    set_ = commands.add_parser("set", help="set volume")
+    set_.add_argument("location", help="device description URL")
+    set_.add_argument("volume", type=int, help="volume 0-100")
+
+    watch = commands.add_parser("watch", help="print volume events")
+    watch.add_argument("location", help="device description URL")
+    watch.add_argument("--duration", type=float, help="seconds to watch")
+
+    record = commands.add_parser(
+        "record", help="capture UPnP traffic and events to a replay fixture"
+    )
+    record.add_argument("location", help="device description URL")
+    record.add_argument("output", help="fixture file to write")
+    record.add_argument("--polls", type=int, default=10, help="volume polls")
+    record.add_argument(
+        "--interval", type=float, default=1.0, help="seconds between polls"
+    )
+    record.add_argument(
+        "--no-events", action="store_true", help="do not subscribe to events"
+    )
+
+    bench = commands.add_parser("bench", help="measure get/set latency")
+    bench.add_argument("locations", nargs="+", help="device description URLs")
+    bench.add_argument("-n", "--count", type=int, default=100, help="operations")
+    bench.add_argument(
+        "-c", "--concurrency", type=int, default=4, help="operations in flight"
+    )
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for the command line interface."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    try:
+        return asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        return 130
+    except Exception as err:  # noqa: BLE001
+        print(f"error: {err}", file=sys.stderr)
+        return 1
@@ -1,15 +1,74 @@
 """Config flow for Samsung TV Volume Control integration."""
 
+import time
 from urllib.parse import urlparse
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.importlib import async_import_module
 from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 
-from async_upnp_client.aiohttp import AiohttpRequester
-from async_upnp_client.client_factory import UpnpFactory
+from .const import DATA_PROBES, DOMAIN, LOGGER
+
+# Seconds a failed probe is remembered, so announcement storms are not re-probed
+PROBE_FAILURE_TTL = 60
+
+
+class DeviceProbeCache:
+    """Remembers failed description probes of discovered devices."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        # (UDN, location) -> (monotonic expiry, abort reason)
+        self._failures: dict[tuple[str, str], tuple[float, str]] = {}
+        self.probes = 0
+
+    async def async_probe(self, udn: str, location: str) -> str | None:
+        """Probe a device unless it failed recently; return an abort reason."""
+        key = (udn, location)
+        if failure := self._failures.get(key):
+            if failure[0] > time.monotonic():
+                LOGGER.debug(
+                    "Skipping probe of %s at %s, failed recently", udn, location
+                )
+                return failure[1]
+            del self._failures[key]
+        return await self._async_probe(key, location)
+
+    async def _async_probe(self, key: tuple[str, str], location: str) -> str | None:
+        """Fetch the device description and remember failures."""
+        self.probes += 1
+        # The UPnP client is loaded by the first probe, in the import executor
+        upnp_aiohttp = await async_import_module(self.hass, "async_upnp_client.aiohttp")
+        client_factory = await async_import_module(
+            self.hass, "async_upnp_client.client_factory"
+        )
+        try:
+            # Verify device is accessible via async-upnp-client
+            requester = upnp_aiohttp.AiohttpRequester(timeout=10)
+            factory = client_factory.UpnpFactory(requester)
+            await factory.async_create_device(location)
+        except ConnectionError:
+            LOGGER.error("Cannot connect to Samsung TV at %s", location)
+            reason: str | None = "cannot_connect"
+        except Exception as err:
+            LOGGER.error("Invalid UPnP device at %s: %s", location, err)
+            reason = "invalid_device"
+        else:
+            reason = None
+
+        if reason:
+            self._failures[key] = (time.monotonic() + PROBE_FAILURE_TTL, reason)
+        return reason
 
-from .const import DOMAIN, LOGGER
+
+def _probe_cache(hass: HomeAssistant) -> DeviceProbeCache:
+    """Return the probe cache shared by all flows."""
+    if (cache := hass.data.get(DATA_PROBES)) is None:
+        cache = hass.data[DATA_PROBES] = DeviceProbeCache(hass)
+    return cache
 
 
 class SamsungTVVolumeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -40,26 +99,17 @@ class SamsungTVVolumeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         host = parsed_url.hostname
         friendly_name = discovery_info.upnp.get("friendlyName", f"Samsung TV ({host})")
 
-        # Check if already configured and update location if it changed
+        # Check if already configured and update location if it changed; the
+        # entry's update listener moves the running coordinator, no reload
         await self.async_set_unique_id(udn)
         self._abort_if_unique_id_configured(
-            updates={"location": location, "host": host}
+            updates={"location": location, "host": host}, reload_on_update=False
         )
 
-        try:
-            # Verify device is accessible via async-upnp-client
-            requester = AiohttpRequester(timeout=10)
-            factory = UpnpFactory(requester)
-            device = await factory.async_create_device(location)
-
-            LOGGER.debug("Successfully connected to Samsung TV: %s", friendly_name)
+        if reason := await _probe_cache(self.hass).async_probe(udn, location):
+            return self.async_abort(reason=reason)
 
-        except ConnectionError:
-            LOGGER.error("Cannot connect to Samsung TV at %s", location)
-            return self.async_abort(reason="cannot_connect")
-        except Exception as err:
-            LOGGER.error("Invalid UPnP device at %s: %s", location, err)
-            return self.async_abort(reason="invalid_device")
+        LOGGER.debug("Successfully connected to Samsung TV: %s", friendly_name)
 
         # Create config entry
         return self.async_create_entry(
@@ -1,7 +1,41 @@
 """Constants for Samsung TV Volume Control."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "samsung_tv_volume"
+
+# Use polling for health checks, UPnP events for real-time updates
+HEALTH_CHECK_INTERVAL = timedelta(seconds=15)
+
+# YAML options of the samsung_tv_volume: section
+CONF_SHARED_POLLING = "shared_polling"
+CONF_MAX_CONCURRENT_POLLS = "max_concurrent_polls"
+CONF_WEBSOCKET_REMOTE = "websocket_remote"
+CONF_FAST_PATH = "fast_path"
+CONF_SLIM_MODEL = "slim_model"
+
+# Polls the shared hub runs at once unless max_concurrent_polls is set
+DEFAULT_MAX_CONCURRENT_POLLS = 8
+
+# Config entry options holding the volume guard limits (0..1)
+OPTION_MIN_VOLUME_LEVEL = "min_volume_level"
+OPTION_MAX_VOLUME_LEVEL = "max_volume_level"
+# Config entry options holding the mirrored entities and volume curve
+OPTION_MIRROR_TARGETS = "mirror_targets"
+OPTION_MIRROR_CURVE = "mirror_curve"
+
+# hass.data key of the shared polling hub
+DATA_HUB = f"{DOMAIN}_hub"
+# hass.data key of the scheduler renewing all event subscriptions
+DATA_RENEWALS = f"{DOMAIN}_renewals"
+# hass.data key of the description probes shared by discovery flows
+DATA_PROBES = f"{DOMAIN}_probes"
+# hass.data key set when TVs should also be driven over the WebSocket remote
+DATA_WEBSOCKET_REMOTE = f"{DOMAIN}_websocket_remote"
+# hass.data keys set when volume goes via precompiled SOAP envelopes and
+# when only the RenderingControl part of device models is kept
+DATA_FAST_PATH = f"{DOMAIN}_fast_path"
+DATA_SLIM_MODEL = f"{DOMAIN}_slim_model"
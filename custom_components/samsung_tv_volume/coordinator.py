@@ -1,21 +1,89 @@
 """Data update coordinator for Samsung TV Volume Control."""
 
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.components import ssdp
+from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 from aiohttp import ClientError
-from async_upnp_client.exceptions import UpnpError
+from async_upnp_client.aiohttp import AiohttpNotifyServer, AiohttpRequester
+from async_upnp_client.client import UpnpRequester
+from async_upnp_client.const import HttpRequest, HttpResponse
+from async_upnp_client.event_handler import UpnpEventHandler
+from async_upnp_client.exceptions import UpnpConnectionError, UpnpError
+from async_upnp_client.utils import get_local_ip
 
-from .upnp_device import SamsungTVUPnPDevice, DeviceInfo
+from .const import HEALTH_CHECK_INTERVAL
+from .history import VolumeHistory
+from .mirror import VolumeCurve, VolumeMirror
+from .stats import summarize_latencies
+from .transport import SamsungTVWebSocketRemote, VolumeTransportSelector
+from .upnp_device import (
+    HEADER_BOOT_ID,
+    HEADER_CONFIG_ID,
+    DeviceInfo,
+    SamsungTVUPnPDevice,
+)
+
+if TYPE_CHECKING:
+    from .renewal import SubscriptionRenewalScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
-# Use polling for health checks, UPnP events for real-time updates
-HEALTH_CHECK_INTERVAL = timedelta(seconds=15)
+# Volume guard corrections whose reaction time is kept for statistics
+GUARD_REACTION_SAMPLES = 200
+
+# Seconds all TVs together get to drop their subscriptions on shutdown
+SHUTDOWN_TIMEOUT = 5.0
+
+
+class EventRequester(UpnpRequester):
+    """
+    Requester for the SUBSCRIBE/UNSUBSCRIBE calls of the NOTIFY server.
+
+    Once offline is set, requests fail at once instead of waiting for an
+    unreachable TV to time out.
+    """
+
+    def __init__(self, requester: UpnpRequester) -> None:
+        """Initialize around the requester doing the actual calls."""
+        self._requester = requester
+        self.offline = False
+
+    async def async_http_request(self, http_request: HttpRequest) -> HttpResponse:
+        """Do a request unless the TV is known to be unreachable."""
+        if self.offline:
+            msg = f"{http_request.url} is unreachable"
+            raise UpnpConnectionError(msg)
+        return await self._requester.async_http_request(http_request)
+
+
+async def async_shutdown_coordinators(
+    coordinators: "list[SamsungTVCoordinator]",
+    timeout: float = SHUTDOWN_TIMEOUT,  # noqa: ASYNC109
+) -> dict[str, float]:
+    """Shut down TVs concurrently under one deadline; return seconds per TV."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    results = await asyncio.gather(
+        *(coordinator.async_shutdown(deadline) for coordinator in coordinators),
+        return_exceptions=True,
+    )
+    for coordinator, result in zip(coordinators, results, strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.error(
+                "Error shutting down Samsung TV %s: %s", coordinator.name, result
+            )
+    durations = {
+        coordinator.name: coordinator.shutdown_duration for coordinator in coordinators
+    }
+    _LOGGER.debug("Shut down Samsung TVs in seconds: %s", durations)
+    return durations
 
 
 class SamsungTVCoordinator(DataUpdateCoordinator):
@@ -38,13 +106,70 @@ class SamsungTVCoordinator(DataUpdateCoordinator):
         self.location = location
         self.udn = udn
         self._device: SamsungTVUPnPDevice | None = None
+        # Description of the last device set up; kept while it is unreachable
+        self._device_info: DeviceInfo | None = None
+        # Also try the WebSocket remote channel; TVs ask to allow it once
+        self.websocket_remote = False
+        self._remote: SamsungTVWebSocketRemote | None = None
+        # Precompiled Get/SetVolume requests and a RenderingControl-only model
+        self.fast_path = False
+        self.slim = False
+        self._transport: VolumeTransportSelector | None = None
+        # Shared scheduler renewing event subscriptions of all TVs
+        self.renewal_scheduler: SubscriptionRenewalScheduler | None = None
+        self._notify_server: AiohttpNotifyServer | None = None
+        self._event_requester: EventRequester | None = None
+        self._resync_task: asyncio.Task | None = None
+        # UDA 1.1 BOOTID/CONFIGID last announced or sent in a NOTIFY by the TV
+        self._boot_id: str | None = None
+        self._config_id: str | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        # Held while the device is set up or reconnected, so a reconnect
+        # never works on a device whose setup is still in progress
+        self._connect_lock = asyncio.Lock()
+        # Event losses of all devices set up so far, kept across reconnects
+        self.event_gaps = 0
+        self.missed_events = 0
+        # Duration in seconds of the last reconnect, per path
+        self.reconnect_durations: dict[str, float] = {}
+        # Seconds the last shutdown took, including any wait on the TV
+        self.shutdown_duration: float | None = None
+        # Volume guard limits (0-100), enforced on every event and poll
+        self.min_volume: int | None = None
+        self.max_volume: int | None = None
+        self._guard_task: asyncio.Task | None = None
+        # Last out-of-range volume seen while a correction was in flight
+        self._guard_missed: tuple[int, float] | None = None
+        # Seconds from seeing an out-of-range volume to the corrected SetVolume
+        self.guard_reaction_times: deque[float] = deque(maxlen=GUARD_REACTION_SAMPLES)
+        # Forwards volume events to other media players
+        self.volume_mirror: VolumeMirror | None = None
+        # Recent volume changes, for statistics on demand
+        self.volume_history = VolumeHistory()
+
+    @property
+    def subscription_expires_in(self) -> float | None:
+        """Return seconds until the event subscription expires, if known."""
+        return self._device.subscription_expires_in if self._device else None
+
+    @property
+    def renewal_latency(self) -> float | None:
+        """Return the duration of the last subscription renewal in seconds."""
+        return self._device.renewal_latency if self._device else None
+
+    @property
+    def transport_latency(self) -> dict[tuple[str, str], float]:
+        """Return smoothed latency per (transport, operation) in seconds."""
+        return dict(self._transport.latency) if self._transport else {}
 
+    @property
+    def guard_reaction_stats(self) -> dict[str, float] | None:
+        """Return the volume guard reaction-time distribution in seconds."""
+        return summarize_latencies(self.guard_reaction_times)
 
     def get_device_info(self) -> DeviceInfo | None:
         """Return device info from UPnP device."""
-        if self._device:
-            return self._device.get_device_info()
-        return None
+        return self._device_info
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the device."""
@@ -53,7 +178,10 @@ class SamsungTVCoordinator(DataUpdateCoordinator):
 
         try:
             # Get current volume from device
-            volume = await self._device.async_get_volume()
+            volume = await self._transport.async_get_volume()
+            # Not eager: the correction must land after this poll's data
+            self._async_guard_volume(volume, time.perf_counter(), eager=False)
+            self.volume_history.record(volume)
             return {
                 "volume_level": volume / 100.0,  # Convert to 0.0-1.0 range
                 "is_volume_muted": False,  # TODO: Add mute support later
@@ -63,16 +191,71 @@ class SamsungTVCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error updating Samsung TV data: %s", err)
             raise UpdateFailed(f"Error updating Samsung TV: {err}") from err
 
+    async def _async_event_handler(self) -> UpnpEventHandler | None:
+        """Return the handler for UPnP NOTIFYs, starting its server if needed."""
+        if self._notify_server is None:
+            try:
+                requester = EventRequester(AiohttpRequester(timeout=10))
+                server = AiohttpNotifyServer(
+                    requester, source=(get_local_ip(self.location), 0)
+                )
+                await server.async_start_server()
+            except OSError as err:
+                _LOGGER.warning("Cannot receive UPnP events, polling only: %s", err)
+                return None
+            self._notify_server = server
+            self._event_requester = requester
+        return self._notify_server.event_handler
+
+    async def _async_connect(self) -> None:
+        """Create the device at the current location and subscribe to events."""
+        self._transport = None
+        device = SamsungTVUPnPDevice(
+            self.location,
+            event_handler=await self._async_event_handler(),
+            fast_path=self.fast_path,
+            slim=self.slim,
+            renewal_scheduler=self.renewal_scheduler,
+            on_event_gap=self._handle_event_gap,
+            on_boot_ids=self._handle_notify_ids,
+            config_id=self._config_id,
+        )
+        await device.async_setup()
+        self._device = device
+        self._device_info = device.get_device_info()
+
+        transports = [device]
+        if self.websocket_remote:
+            # The host may have changed since the last connection
+            if self._remote:
+                await self._remote.async_close()
+            self._remote = SamsungTVWebSocketRemote(urlparse(self.location).hostname)
+            try:
+                await self._remote.async_connect()
+            except (ClientError, OSError, TimeoutError) as err:
+                _LOGGER.warning("WebSocket remote unavailable, using UPnP: %s", err)
+            else:
+                transports.append(self._remote)
+        self._transport = VolumeTransportSelector(transports)
+
+        # Subscribe to volume events for real-time updates
+        await self._transport.async_subscribe_events(
+            self.handle_volume_event, self.handle_event_resync
+        )
+
     async def _setup_device(self) -> None:
         """Set up the UPnP device."""
+        async with self._connect_lock:
+            # A reconnect may have set it up while this one waited
+            if not self._device:
+                await self._async_setup_device()
+
+    async def _async_setup_device(self) -> None:
+        """Set up the UPnP device, rediscovering it if its location is stale."""
         _LOGGER.debug("Setting up Samsung TV device at %s", self.location)
 
         try:
-            self._device = SamsungTVUPnPDevice(self.location)
-            await self._device.async_setup()
-
-            # Subscribe to volume events for real-time updates
-            await self._device.async_subscribe_events(self.handle_volume_event)
+            await self._async_connect()
 
             _LOGGER.debug("Successfully set up Samsung TV device")
 
@@ -92,11 +275,7 @@ class SamsungTVCoordinator(DataUpdateCoordinator):
                     self.location = new_location
                     # Retry setup with new location
                     try:
-                        self._device = SamsungTVUPnPDevice(self.location)
-                        await self._device.async_setup()
-                        await self._device.async_subscribe_events(
-                            self.handle_volume_event
-                        )
+                        await self._async_connect()
                         _LOGGER.info(
                             "Successfully reconnected to Samsung TV at %s",
                             self.location,
@@ -106,6 +285,7 @@ class SamsungTVCoordinator(DataUpdateCoordinator):
                         _LOGGER.error(
                             "Failed to reconnect even with new location: %s", retry_err
                         )
+                        self._device = None
 
             raise
 
@@ -134,41 +314,377 @@ class SamsungTVCoordinator(DataUpdateCoordinator):
     @callback
     def handle_volume_event(self, volume: int) -> None:
         """Handle volume change events from Samsung TV."""
+        received = time.perf_counter()
         _LOGGER.debug("Received volume event: %s", volume)
+        if self._transport:
+            self._transport.note_volume(volume)
 
         # Update data without triggering device refresh
         new_data = self.data.copy() if self.data else {}
         new_data["volume_level"] = volume / 100.0
+        self.volume_history.record(volume)
 
         # Trigger coordinator update
         self.async_set_updated_data(new_data)
+        self._async_guard_volume(volume, received)
+        if self.volume_mirror:
+            # Targets follow the level the guard is about to enforce
+            self.volume_mirror.async_forward(
+                self._clamp_volume(volume) / 100.0, received
+            )
+
+    async def async_set_volume_mirror(
+        self,
+        entity_ids: list[str],
+        curve: list[tuple[float, float]] | None = None,
+    ) -> None:
+        """Mirror volume events to other media players; no entities stops it."""
+        # Validate before touching the running mirror
+        volume_curve = VolumeCurve(curve)
+        if self.volume_mirror:
+            await self.volume_mirror.async_stop()
+            self.volume_mirror = None
+        if entity_ids:
+            self.volume_mirror = VolumeMirror(self.hass, entity_ids, volume_curve)
+
+    @callback
+    def async_set_volume_limits(
+        self, min_level: float | None = None, max_level: float | None = None
+    ) -> None:
+        """Set volume limits (0..1, None for no limit) and enforce them now."""
+        min_volume = None if min_level is None else round(min_level * 100)
+        max_volume = None if max_level is None else round(max_level * 100)
+        if (
+            min_volume is not None
+            and max_volume is not None
+            and min_volume > max_volume
+        ):
+            msg = f"Minimum volume {min_level} exceeds maximum {max_level}"
+            raise ValueError(msg)
+
+        self.min_volume, self.max_volume = min_volume, max_volume
+        if self.data and self.data.get("volume_level") is not None:
+            self._async_guard_volume(
+                round(self.data["volume_level"] * 100), time.perf_counter()
+            )
+
+    def _clamp_volume(self, volume: int) -> int:
+        """Return a volume within the configured limits."""
+        if self.max_volume is not None and volume > self.max_volume:
+            return self.max_volume
+        if self.min_volume is not None and volume < self.min_volume:
+            return self.min_volume
+        return volume
+
+    @callback
+    def _async_guard_volume(
+        self, volume: int, observed: float, *, eager: bool = True
+    ) -> None:
+        """Correct a volume outside the limits right away."""
+        target = self._clamp_volume(volume)
+        if target == volume:
+            self._guard_missed = None
+            return
+        if self._guard_task and not self._guard_task.done():
+            # Checked again once the correction in flight has completed
+            self._guard_missed = (volume, observed)
+            return
+
+        # Start eagerly so the SetVolume leaves before this callback returns
+        self._guard_task = self.hass.async_create_background_task(
+            self._async_correct_volume(volume, target, observed),
+            name=f"{self.name} volume guard",
+            eager_start=eager,
+        )
+
+    async def _async_correct_volume(
+        self, volume: int, target: int, observed: float
+    ) -> None:
+        """Send the corrective SetVolume and record the reaction time."""
+        try:
+            await self._async_set_volume_int(target)
+        except UpdateFailed:
+            pass
+        else:
+            reaction = time.perf_counter() - observed
+            self.guard_reaction_times.append(reaction)
+            _LOGGER.info(
+                "Volume guard on %s corrected %s to %s in %.1f ms",
+                self.name,
+                volume,
+                target,
+                reaction * 1000,
+            )
+
+        # The TV may have moved out of range again while this one was sent
+        self._guard_task = None
+        if missed := self._guard_missed:
+            self._guard_missed = None
+            self._async_guard_volume(*missed, eager=False)
+
+    @callback
+    def _handle_event_gap(self, missed: int) -> None:
+        """Count NOTIFYs lost by any device of this TV."""
+        self.event_gaps += 1
+        self.missed_events += missed
+
+    @callback
+    def handle_event_resync(self, reason: str) -> None:
+        """Refresh volume out of band after events may have been lost."""
+        if self._resync_task and not self._resync_task.done():
+            return
+
+        _LOGGER.debug("Resyncing Samsung TV %s: %s", self.name, reason)
+        self._resync_task = self.hass.async_create_background_task(
+            self._async_resync(), name=f"{self.name} event resync"
+        )
+
+    async def _async_resync(self) -> None:
+        """Fetch the current volume and resubscribe if the subscription is gone."""
+        device = self._device
+        if not device:
+            return
+
+        try:
+            volume = await device.async_get_volume()
+            if device is self._device:
+                self.handle_volume_event(volume)
+            if not device.is_subscribed:
+                await device.async_resubscribe_events()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Failed to resync Samsung TV %s: %s", self.name, err)
+
+    @callback
+    def handle_ssdp_announcement(
+        self, discovery_info: SsdpServiceInfo, change: ssdp.SsdpChange
+    ) -> None:
+        """Reconnect when an announcement shows the TV rebooted."""
+        if change == ssdp.SsdpChange.BYEBYE:
+            return
+
+        headers = discovery_info.ssdp_headers
+        self._handle_boot_ids(
+            headers.get(HEADER_BOOT_ID),
+            headers.get(HEADER_CONFIG_ID),
+            discovery_info.ssdp_location,
+        )
+
+    @callback
+    def _handle_notify_ids(self, boot_id: str | None, config_id: str | None) -> None:
+        """Reconnect when an event NOTIFY shows the TV rebooted or changed."""
+        self._handle_boot_ids(boot_id, config_id, self.location)
+
+    @callback
+    def _handle_boot_ids(
+        self, boot_id: str | None, config_id: str | None, location: str
+    ) -> None:
+        """Reconnect when BOOTID or CONFIGID changed from the last seen."""
+        previous_boot_id, previous_config_id = self._boot_id, self._config_id
+        self._boot_id = boot_id or previous_boot_id
+        self._config_id = config_id or previous_config_id
+        if self._device and self._device.config_id is None:
+            # The first CONFIGID seen describes the model already parsed
+            self._device.config_id = self._config_id
+        rebooted = boot_id is not None and previous_boot_id not in (None, boot_id)
+        reconfigured = config_id is not None and previous_config_id not in (
+            None,
+            config_id,
+        )
+        if not (rebooted or reconfigured) or not self._device:
+            return
+
+        # The parsed model stays valid while the description is unchanged
+        rebuild = (
+            config_id is None
+            or config_id != previous_config_id
+            or location != self.location
+        )
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+        _LOGGER.info(
+            "Samsung TV %s %s (BOOTID %s -> %s, CONFIGID %s -> %s), %s",
+            self.name,
+            "rebooted" if rebooted else "changed its description",
+            previous_boot_id,
+            self._boot_id,
+            previous_config_id,
+            self._config_id,
+            "rebuilding device" if rebuild else "resubscribing",
+        )
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._async_reconnect("rebuild" if rebuild else "resubscribe", location),
+            name=f"{self.name} reconnect",
+        )
+
+    @callback
+    def async_update_location(self, location: str) -> None:
+        """Move to a new location of the TV in place, without an entry reload."""
+        if location == self.location:
+            return
+
+        _LOGGER.info(
+            "Samsung TV %s moved from %s to %s", self.name, self.location, location
+        )
+        if not self._device and not self._connect_lock.locked():
+            # The next poll sets the device up at the new location
+            self.location = location
+            return
+        # A connect in progress finishes first, then the device is moved
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._async_reconnect("relocate", location),
+            name=f"{self.name} reconnect",
+        )
+
+    async def _async_relocate_remote(self) -> None:
+        """Point the WebSocket remote at the new host; it connects on first use."""
+        if not self._remote:
+            return
+        remote = SamsungTVWebSocketRemote(urlparse(self.location).hostname)
+        remote.known_volume = self._remote.known_volume
+        remote.events_available = self._remote.events_available
+        if self._transport and self._remote in self._transport.transports:
+            transports = self._transport.transports
+            transports[transports.index(self._remote)] = remote
+        previous, self._remote = self._remote, remote
+        await previous.async_close()
+
+    async def _async_reconnect(self, path: str, location: str | None) -> None:
+        """
+        Take the cheapest path back to a working device.
+
+        The path is "resubscribe" after a reboot with an unchanged
+        description, "rebuild" when it changed and "relocate" when the
+        TV moved to a new address.
+        """
+        async with self._connect_lock:
+            started = time.perf_counter()
+            if location:
+                self.location = location
+            try:
+                if path == "rebuild" or not self._device:
+                    if self._device:
+                        await self._device.async_close()
+                        self._device = None
+                    await self._async_connect()
+                elif path == "relocate":
+                    if not await self._device.async_relocate(
+                        self.location, self._config_id
+                    ):
+                        self._device_info = self._device.get_device_info()
+                    await self._async_relocate_remote()
+                else:
+                    await self._device.async_restore_subscription()
+            except Exception as err:  # noqa: BLE001
+                # The next poll sets the device up from scratch
+                _LOGGER.warning(
+                    "Failed to reconnect to Samsung TV %s: %s", self.name, err
+                )
+                if self._device and path != "rebuild":
+                    await self._device.async_close()
+                self._device = None
+                return
+
+        self.reconnect_durations[path] = time.perf_counter() - started
+        _LOGGER.debug(
+            "Reconnected to Samsung TV %s via %s in %.3fs",
+            self.name,
+            path,
+            self.reconnect_durations[path],
+        )
+        await self.async_refresh()
 
     async def async_set_volume(self, volume_level: float) -> None:
         """Set volume on Samsung TV."""
-        if not self._device:
+        # Convert to 0-100 range
+        await self._async_set_volume_int(int(volume_level * 100))
+
+    async def _async_set_volume_int(self, volume: int) -> None:
+        """Set volume (0-100) on Samsung TV, within the volume guard limits."""
+        if not self._transport:
             raise UpdateFailed("Device not available")
 
         try:
-            volume = int(volume_level * 100)  # Convert to 0-100 range
-            await self._device.async_set_volume(volume)
+            volume = self._clamp_volume(volume)
+            await self._transport.async_set_volume(volume)
 
             # Update local data immediately
             new_data = self.data.copy() if self.data else {}
-            new_data["volume_level"] = volume_level
+            new_data["volume_level"] = volume / 100.0
             self.async_set_updated_data(new_data)
 
         except Exception as err:
             _LOGGER.error("Failed to set volume: %s", err)
             raise UpdateFailed(f"Failed to set volume: {err}") from err
 
-    async def async_shutdown(self) -> None:
-        """Shutdown coordinator and cleanup device."""
+    async def async_shutdown(self, deadline: float | None = None) -> None:  # noqa: PLR0912
+        """
+        Shutdown coordinator and cleanup device.
+
+        A TV that failed its last poll is not contacted, and the TV is given
+        up on at the deadline (loop time); sockets and tasks are released
+        either way. The time taken is kept in shutdown_duration.
+        """
+        started = time.perf_counter()
+        # Stop the refresh timer and debouncer first, so no poll sets the
+        # device up again while it is being closed
+        await super().async_shutdown()
+        if self._resync_task and not self._resync_task.done():
+            self._resync_task.cancel()
+        self._resync_task = None
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+        self._reconnect_task = None
+        if self._guard_task and not self._guard_task.done():
+            self._guard_task.cancel()
+        self._guard_task = None
+        self._guard_missed = None
+        if self.volume_mirror:
+            await self.volume_mirror.async_stop()
+
+        # A TV that is off would make each request wait out its timeout
+        reachable = self.last_update_success
+        if not reachable and self._event_requester:
+            self._event_requester.offline = True
+
+        self._transport = None
+        closing = []
+        if self._remote:
+            closing.append(self._remote.async_close(graceful=reachable))
+            self._remote = None
         if self._device:
+            closing.append(self._device.async_close())
+            self._device = None
+        try:
+            async with asyncio.timeout_at(deadline):
+                results = await asyncio.gather(*closing, return_exceptions=True)
+        except TimeoutError:
+            _LOGGER.warning(
+                "Samsung TV %s did not answer before the shutdown deadline", self.name
+            )
+            if self._event_requester:
+                self._event_requester.offline = True
+        else:
+            for result in results:
+                if isinstance(result, Exception):
+                    _LOGGER.error("Error closing Samsung TV %s: %s", self.name, result)
+
+        if self._notify_server:
             try:
-                await self._device.async_close()
+                # Subscriptions still left are dropped without the TV when offline
+                await self._notify_server.async_stop_server()
             except Exception as err:
-                _LOGGER.error("Error closing Samsung TV device: %s", err)
+                _LOGGER.error("Error stopping UPnP notify server: %s", err)
             finally:
-                self._device = None
+                self._notify_server = None
+                self._event_requester = None
 
         self._available = False
+        self.shutdown_duration = time.perf_counter() - started
+        _LOGGER.debug(
+            "Shut down Samsung TV %s in %.3fs%s",
+            self.name,
+            self.shutdown_duration,
+            "" if reachable else " (unreachable, not contacted)",
+        )
@@ -0,0 +1,46 @@
+"""Diagnostics support for Samsung TV Volume Control."""
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import SamsungTVCoordinator
+
+TO_REDACT = {CONF_HOST, "location", "udn"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SamsungTVCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "available": coordinator.last_update_success,
+        "events": {
+            # Kept across reconnects, so they show how lossy the TV is
+            "gaps": coordinator.event_gaps,
+            "missed": coordinator.missed_events,
+        },
+        "subscription": {
+            "expires_in": coordinator.subscription_expires_in,
+            "renewal_latency": coordinator.renewal_latency,
+        },
+        # Seconds the last reconnect took, per path
+        "reconnect_durations": coordinator.reconnect_durations,
+        "guard_reaction": coordinator.guard_reaction_stats,
+        "mirror": (
+            {
+                "latency": mirror.latency_stats,
+                "echoes_suppressed": mirror.echoes_suppressed,
+            }
+            if (mirror := coordinator.volume_mirror)
+            else None
+        ),
+    }
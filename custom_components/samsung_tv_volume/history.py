@@ -0,0 +1,132 @@
+"""Fixed-size volume history of one TV, kept in compact typed arrays."""
+
+import time
+from array import array
+from typing import Any
+
+# Samples kept per TV; 9 bytes each
+VOLUME_HISTORY_SIZE = 4096
+
+
+class VolumeHistory:
+    """
+    Ring buffer of (monotonic time, volume) samples.
+
+    Samples repeating the latest volume are dropped, so the
+    buffer holds changes only and a poll confirming the level costs
+    nothing. The volume is taken to hold from one sample to the next.
+    """
+
+    __slots__ = ("_count", "_next", "_times", "_volumes")
+
+    def __init__(self, size: int = VOLUME_HISTORY_SIZE) -> None:
+        """Initialize an empty history holding up to size samples."""
+        if size < 1:
+            msg = "A volume history needs room for at least one sample"
+            raise ValueError(msg)
+        self._times = array("d", bytes(8 * size))
+        self._volumes = array("B", bytes(size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the sample arrays."""
+        return sum(
+            values.itemsize * len(values) for values in (self._times, self._volumes)
+        )
+
+    def _index(self, position: int) -> int:
+        """Return the array index of the sample at a position, oldest first."""
+        size = len(self._times)
+        return (self._next - self._count + position) % size
+
+    def record(self, volume: int, timestamp: float | None = None) -> bool:
+        """Add a sample (volume 0-100) unless nothing changed; return if added."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._count:
+            last = self._index(self._count - 1)
+            if self._volumes[last] == volume:
+                return False
+            # Keep the buffer ordered even if a caller's clock lags
+            timestamp = max(timestamp, self._times[last])
+
+        self._times[self._next] = timestamp
+        self._volumes[self._next] = volume
+        self._next = (self._next + 1) % len(self._times)
+        self._count = min(self._count + 1, len(self._times))
+        return True
+
+    def samples(self) -> list[tuple[float, int]]:
+        """Return all samples, oldest first."""
+        return [
+            (self._times[index], self._volumes[index])
+            for index in map(self._index, range(self._count))
+        ]
+
+    def statistics(
+        self, window: float, above: int | None = None, now: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Return volume statistics over the last window seconds.
+
+        The volume at the start of the window is carried in from the last
+        sample before it. Durations are in seconds, volumes 0-100; time
+        above a volume is only reported when one is given. Returns None
+        while no volume has been recorded.
+        """
+        if not self._count:
+            return None
+        if now is None:
+            now = time.monotonic()
+        start = now - window
+        times, volumes = self._times, self._volumes
+
+        # First position inside the window; times are ascending by position
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if times[self._index(middle)] <= start:
+                low = middle + 1
+            else:
+                high = middle
+        first_inside = low
+
+        covered = weighted = time_above = 0.0
+        changes = 0
+        minimum = maximum = previous = None
+        for position in range(max(first_inside - 1, 0), self._count):
+            index = self._index(position)
+            volume = volumes[index]
+            if position >= first_inside and previous is not None and volume != previous:
+                changes += 1
+            previous = volume
+            if position + 1 < self._count:
+                until = times[self._index(position + 1)]
+            else:
+                until = now
+            duration = max(0.0, min(until, now) - max(times[index], start))
+            minimum = volume if minimum is None else min(minimum, volume)
+            maximum = volume if maximum is None else max(maximum, volume)
+            covered += duration
+            weighted += volume * duration
+            if above is not None and volume > above:
+                time_above += duration
+
+        return {
+            "window": window,
+            "covered": covered,
+            "samples": self._count - first_inside,
+            "changes": changes,
+            "changes_per_minute": changes * 60 / covered if covered else 0.0,
+            "min": minimum,
+            "max": maximum,
+            "mean": weighted / covered if covered else float(previous),
+            "last": previous,
+            "time_above": time_above if above is not None else None,
+        }
@@ -0,0 +1,107 @@
+"""Shared polling of all Samsung TVs from a single timer."""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DEFAULT_MAX_CONCURRENT_POLLS, HEALTH_CHECK_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .coordinator import SamsungTVCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Devices are spread over HEALTH_CHECK_INTERVAL / HUB_TICK_INTERVAL slots
+HUB_TICK_INTERVAL = timedelta(seconds=5)
+
+
+class SamsungTVHub:
+    """Polls every registered coordinator from one timer, in staggered slots."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent_polls: int = DEFAULT_MAX_CONCURRENT_POLLS,
+        interval: timedelta = HEALTH_CHECK_INTERVAL,
+        tick: timedelta = HUB_TICK_INTERVAL,
+    ) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._tick = tick
+        self._slot_count = max(1, round(interval / tick))
+        self._next_slot = 0
+        self._slots: dict[SamsungTVCoordinator, int] = {}
+        self._in_flight: set[SamsungTVCoordinator] = set()
+        self._semaphore = asyncio.Semaphore(max_concurrent_polls)
+        self._unsub_timer: Callable[[], None] | None = None
+
+    @property
+    def coordinators(self) -> "list[SamsungTVCoordinator]":
+        """Return the coordinators polled by this hub."""
+        return list(self._slots)
+
+    @callback
+    def async_add(self, coordinator: "SamsungTVCoordinator") -> None:
+        """Take over polling of a coordinator."""
+        # The hub's timer replaces the coordinator's own
+        coordinator.update_interval = None
+
+        # Put the device into the least busy slot to avoid bursts
+        load = Counter(self._slots.values())
+        self._slots[coordinator] = min(
+            range(self._slot_count), key=lambda slot: load[slot]
+        )
+
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self.hass, self._async_tick, self._tick, name="Samsung TV hub poll"
+            )
+
+    @callback
+    def async_remove(self, coordinator: "SamsungTVCoordinator") -> None:
+        """Stop polling a coordinator."""
+        self._slots.pop(coordinator, None)
+        if not self._slots and self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling all coordinators."""
+        self._slots.clear()
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def _async_tick(self, _now: datetime | None = None) -> None:
+        """Poll the devices whose slot is due."""
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self._slot_count
+
+        due = [
+            coordinator
+            for coordinator, coordinator_slot in self._slots.items()
+            if coordinator_slot == slot and coordinator not in self._in_flight
+        ]
+        if due:
+            _LOGGER.debug("Polling %s Samsung TVs in slot %s", len(due), slot)
+            await asyncio.gather(
+                *(self._async_poll(coordinator) for coordinator in due)
+            )
+
+    async def _async_poll(self, coordinator: "SamsungTVCoordinator") -> None:
+        """Refresh one coordinator under the global concurrency limit."""
+        self._in_flight.add(coordinator)
+        try:
+            async with self._semaphore:
+                # async_refresh catches errors and notifies the entities
+                await coordinator.async_refresh()
+        finally:
+            self._in_flight.discard(coordinator)
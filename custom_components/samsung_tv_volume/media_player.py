@@ -1,23 +1,55 @@
 """Samsung TV Volume Control MediaPlayer entity."""
 
 import logging
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
 )
 from homeassistant.const import STATE_ON, STATE_OFF
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import (
+    callback,
+    HomeAssistant,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity_platform import (
+    AddEntitiesCallback,
+    async_get_current_platform,
+)
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import SamsungTVCoordinator
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    OPTION_MAX_VOLUME_LEVEL,
+    OPTION_MIN_VOLUME_LEVEL,
+    OPTION_MIRROR_CURVE,
+    OPTION_MIRROR_TARGETS,
+)
+
+if TYPE_CHECKING:
+    from .upnp_device import DeviceInfo as UPnPDeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_SET_VOLUME_LIMITS = "set_volume_limits"
+SERVICE_SET_VOLUME_MIRROR = "set_volume_mirror"
+SERVICE_GET_VOLUME_STATISTICS = "get_volume_statistics"
+ATTR_MIN_VOLUME_LEVEL = "min_volume_level"
+ATTR_MAX_VOLUME_LEVEL = "max_volume_level"
+ATTR_MIRROR_TARGETS = "targets"
+ATTR_MIRROR_CURVE = "curve"
+ATTR_WINDOW = "window"
+ATTR_THRESHOLD = "threshold"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,6 +64,44 @@ async def async_setup_entry(
 
     async_add_entities([entity], True)
 
+    platform = async_get_current_platform()
+
+    # Omitted limits are lifted
+    platform.async_register_entity_service(
+        SERVICE_SET_VOLUME_LIMITS,
+        {
+            vol.Optional(ATTR_MIN_VOLUME_LEVEL): cv.small_float,
+            vol.Optional(ATTR_MAX_VOLUME_LEVEL): cv.small_float,
+        },
+        "async_set_volume_limits",
+    )
+
+    # No targets stops mirroring
+    platform.async_register_entity_service(
+        SERVICE_SET_VOLUME_MIRROR,
+        {
+            vol.Optional(ATTR_MIRROR_TARGETS, default=[]): cv.entity_ids,
+            vol.Optional(ATTR_MIRROR_CURVE): vol.All(
+                cv.ensure_list,
+                [vol.ExactSequence([cv.small_float, cv.small_float])],
+            ),
+        },
+        "async_set_volume_mirror",
+    )
+
+    # Window in seconds; time above is reported for a threshold level
+    platform.async_register_entity_service(
+        SERVICE_GET_VOLUME_STATISTICS,
+        {
+            vol.Optional(ATTR_WINDOW, default=3600): vol.All(
+                vol.Coerce(float), vol.Range(min=1)
+            ),
+            vol.Optional(ATTR_THRESHOLD): cv.small_float,
+        },
+        "async_get_volume_statistics",
+        supports_response=SupportsResponse.ONLY,
+    )
+
 
 class SamsungTVMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     """Samsung TV MediaPlayer entity with volume control."""
@@ -40,63 +110,135 @@ class SamsungTVMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Initialize the MediaPlayer entity."""
         super().__init__(coordinator)
         self._attr_name = coordinator.name
-        self._attr_unique_id = (
-            f"{DOMAIN}_{coordinator.location.replace(':', '_').replace('/', '_')}"
-        )
+        # The UDN stays the same when the TV moves to a new address
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.udn}"
         self._attr_supported_features = MediaPlayerEntityFeature.VOLUME_SET
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info for the Samsung TV."""
-        upnp_device_info = self.coordinator.get_device_info()
-        if not upnp_device_info:
-            return None
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._attr_unique_id)},
-            name=upnp_device_info["friendly_name"],
-            manufacturer=upnp_device_info["manufacturer"],
-            model=upnp_device_info["model_name"],
-            serial_number=upnp_device_info.get("serial_number"),
-            sw_version=upnp_device_info.get("model_number"),
-        )
+        self._upnp_device_info: UPnPDeviceInfo | None = None
+        self._update_snapshot()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return self._attr_available
 
-    @property
-    def state(self) -> str:
-        """Return the state of the media player."""
-        if self.available:
-            return STATE_ON
-        return STATE_OFF
-
-    @property
-    def volume_level(self) -> float | None:
-        """Return volume level of the media player (0..1)."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("volume_level")
-        return None
-
-    @property
-    def is_volume_muted(self) -> bool | None:
-        """Return True if volume is currently muted."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("is_volume_muted")
-        return None
+    @callback
+    def _update_snapshot(self) -> None:
+        """Precompute the state written for the current coordinator data."""
+        coordinator = self.coordinator
+        upnp_device_info = coordinator.get_device_info()
+        # Only rebuilt when the coordinator set up a new device
+        if upnp_device_info is not self._upnp_device_info:
+            self._upnp_device_info = upnp_device_info
+            self._attr_device_info = None
+            if upnp_device_info:
+                self._attr_device_info = DeviceInfo(
+                    identifiers={(DOMAIN, self._attr_unique_id)},
+                    name=upnp_device_info["friendly_name"],
+                    manufacturer=upnp_device_info["manufacturer"],
+                    model=upnp_device_info["model_name"],
+                    serial_number=upnp_device_info.get("serial_number"),
+                    sw_version=upnp_device_info.get("model_number"),
+                )
+
+        data = coordinator.data or {}
+        self._attr_available = coordinator.last_update_success
+        self._attr_state = STATE_ON if self._attr_available else STATE_OFF
+        self._attr_volume_level = data.get("volume_level")
+        self._attr_is_volume_muted = data.get("is_volume_muted")
+        self._attr_extra_state_attributes = {
+            ATTR_MIN_VOLUME_LEVEL: (
+                None if coordinator.min_volume is None else coordinator.min_volume / 100
+            ),
+            ATTR_MAX_VOLUME_LEVEL: (
+                None if coordinator.max_volume is None else coordinator.max_volume / 100
+            ),
+        }
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
         await self.coordinator.async_set_volume(volume)
 
+    async def async_set_volume_limits(
+        self,
+        min_volume_level: float | None = None,
+        max_volume_level: float | None = None,
+    ) -> None:
+        """Limit the volume of the TV, range 0..1."""
+        try:
+            self.coordinator.async_set_volume_limits(min_volume_level, max_volume_level)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        # Kept in the entry options so the limits survive restarts
+        if entry := self.coordinator.config_entry:
+            self.hass.config_entries.async_update_entry(
+                entry,
+                options={
+                    **entry.options,
+                    OPTION_MIN_VOLUME_LEVEL: min_volume_level,
+                    OPTION_MAX_VOLUME_LEVEL: max_volume_level,
+                },
+            )
+        self._update_snapshot()
+        self.async_write_ha_state()
+
+    async def async_set_volume_mirror(
+        self,
+        targets: list[str],
+        curve: list[tuple[float, float]] | None = None,
+    ) -> None:
+        """Forward volume changes of the TV to other media players."""
+        if self.entity_id in targets:
+            msg = "A TV cannot mirror its volume to itself"
+            raise ServiceValidationError(msg)
+        try:
+            await self.coordinator.async_set_volume_mirror(targets, curve)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        # Kept in the entry options, like the limits, to survive restarts
+        if entry := self.coordinator.config_entry:
+            self.hass.config_entries.async_update_entry(
+                entry,
+                options={
+                    **entry.options,
+                    OPTION_MIRROR_TARGETS: targets,
+                    OPTION_MIRROR_CURVE: (
+                        None if curve is None else [list(point) for point in curve]
+                    ),
+                },
+            )
+
+    async def async_get_volume_statistics(
+        self, window: float, threshold: float | None = None
+    ) -> ServiceResponse:
+        """Return statistics of the volume over the last window seconds."""
+        stats = self.coordinator.volume_history.statistics(
+            window, None if threshold is None else round(threshold * 100)
+        )
+        if stats is None:
+            msg = "No volume has been recorded yet"
+            raise ServiceValidationError(msg)
+        return {
+            "window": stats["window"],
+            "covered": stats["covered"],
+            "samples": stats["samples"],
+            "changes": stats["changes"],
+            "changes_per_minute": stats["changes_per_minute"],
+            "min_volume_level": stats["min"] / 100,
+            "max_volume_level": stats["max"] / 100,
+            "mean_volume_level": stats["mean"] / 100,
+            "volume_level": stats["last"] / 100,
+            "time_above_threshold": stats["time_above"],
+        }
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._update_snapshot()
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Called when entity is added to hass."""
         await super().async_added_to_hass()
+        # Data may have changed since the entity was created
+        self._update_snapshot()
         _LOGGER.debug("Samsung TV MediaPlayer entity added to Home Assistant")
@@ -0,0 +1,180 @@
+"""Mirroring of TV volume events to other media players."""
+
+import asyncio
+import logging
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import pairwise
+
+from homeassistant.components.media_player import (
+    ATTR_MEDIA_VOLUME_LEVEL,
+    SERVICE_VOLUME_SET,
+)
+from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .stats import summarize_latencies
+
+_LOGGER = logging.getLogger(__name__)
+
+# A TV event this soon after a forward is treated as a target reporting back
+ECHO_WINDOW = 1.0
+# ...if it maps to what each target was last asked for; half a TV volume step
+ECHO_TOLERANCE = 0.005
+# Levels closer than this to the last one sent are not sent again
+RESEND_TOLERANCE = 0.001
+# Fewest points of a volume curve, the two ends
+MIN_CURVE_POINTS = 2
+MIRROR_LATENCY_SAMPLES = 200
+
+
+class VolumeCurve:
+    """Piecewise linear mapping of TV volume level to target volume level."""
+
+    __slots__ = ("_xs", "_ys")
+
+    def __init__(self, points: Sequence[Sequence[float]] | None = None) -> None:
+        """Initialize from (tv_level, target_level) points, identity by default."""
+        points = [tuple(point) for point in points or ((0.0, 0.0), (1.0, 1.0))]
+        if len(points) < MIN_CURVE_POINTS:
+            msg = "A volume curve needs at least two points"
+            raise ValueError(msg)
+        xs = [float(x) for x, _ in points]
+        ys = [float(y) for _, y in points]
+        if any(b <= a for a, b in pairwise(xs)):
+            msg = "Volume curve points must have increasing TV levels"
+            raise ValueError(msg)
+        if not all(0.0 <= value <= 1.0 for value in (*xs, *ys)):
+            msg = "Volume curve levels must be within 0..1"
+            raise ValueError(msg)
+        self._xs = xs
+        self._ys = ys
+
+    def __call__(self, level: float) -> float:
+        """Map a TV volume level, holding the end values outside the curve."""
+        xs, ys = self._xs, self._ys
+        if level <= xs[0]:
+            return ys[0]
+        if level >= xs[-1]:
+            return ys[-1]
+        index = bisect_right(xs, level) - 1
+        fraction = (level - xs[index]) / (xs[index + 1] - xs[index])
+        return ys[index] + fraction * (ys[index + 1] - ys[index])
+
+
+@dataclass(slots=True)
+class _MirrorTarget:
+    """Forwarding state of one target entity."""
+
+    entity_id: str
+    # Latest (level, event time) not yet sent; older values are dropped
+    pending: tuple[float, float] | None = None
+    # Level of the service call in flight, and of the last completed one
+    sending: float | None = None
+    sent: float | None = None
+    task: asyncio.Task | None = None
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=MIRROR_LATENCY_SAMPLES)
+    )
+
+    @property
+    def requested(self) -> float | None:
+        """Return the level the target was last asked for, sent or not."""
+        if self.pending is not None:
+            return self.pending[0]
+        return self.sent if self.sending is None else self.sending
+
+
+class VolumeMirror:
+    """Forwards TV volume events to target media players."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_ids: Sequence[str],
+        curve: VolumeCurve | None = None,
+    ) -> None:
+        """Initialize the mirror."""
+        self.hass = hass
+        self.curve = curve or VolumeCurve()
+        self._targets = [_MirrorTarget(entity_id) for entity_id in entity_ids]
+        self._last_forward: float | None = None
+        self.echoes_suppressed = 0
+
+    @property
+    def entity_ids(self) -> list[str]:
+        """Return the target entity ids."""
+        return [target.entity_id for target in self._targets]
+
+    @property
+    def latency_stats(self) -> dict[str, dict[str, float] | None]:
+        """Return TV event to completed service call latency per target."""
+        return {
+            target.entity_id: summarize_latencies(target.latencies)
+            for target in self._targets
+        }
+
+    @callback
+    def async_forward(self, level: float, received: float) -> None:
+        """Forward a TV volume level received at a perf_counter time."""
+        mapped = self.curve(level)
+        if (
+            self._last_forward is not None
+            and received - self._last_forward < ECHO_WINDOW
+            and all(
+                (requested := target.requested) is not None
+                and abs(mapped - requested) <= ECHO_TOLERANCE
+                for target in self._targets
+            )
+        ):
+            # A target echoing our own change back through the TV; any other
+            # level, even one sent earlier, is a real change and goes out
+            self.echoes_suppressed += 1
+            return
+
+        self._last_forward = received
+        for target in self._targets:
+            target.pending = (mapped, received)
+            if target.task is None or target.task.done():
+                target.task = self.hass.async_create_background_task(
+                    self._async_drain(target),
+                    name=f"volume mirror to {target.entity_id}",
+                    eager_start=True,
+                )
+
+    async def _async_drain(self, target: _MirrorTarget) -> None:
+        """Send the latest pending level until none is left."""
+        while target.pending is not None:
+            level, received = target.pending
+            target.pending = None
+            if target.sent is not None and abs(level - target.sent) < RESEND_TOLERANCE:
+                continue
+            target.sending = level
+            try:
+                await self.hass.services.async_call(
+                    MEDIA_PLAYER_DOMAIN,
+                    SERVICE_VOLUME_SET,
+                    {ATTR_ENTITY_ID: target.entity_id, ATTR_MEDIA_VOLUME_LEVEL: level},
+                    blocking=True,
+                )
+            except HomeAssistantError as err:
+                _LOGGER.warning(
+                    "Failed to mirror volume to %s: %s", target.entity_id, err
+                )
+                continue
+            finally:
+                target.sending = None
+            target.sent = level
+            target.latencies.append(time.perf_counter() - received)
+
+    async def async_stop(self) -> None:
+        """Cancel forwards in flight."""
+        tasks = [target.task for target in self._targets if target.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
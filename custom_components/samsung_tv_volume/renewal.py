@@ -0,0 +1,232 @@
+"""Shared scheduler renewing the UPnP event subscriptions of all TVs."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import timedelta
+
+_LOGGER = logging.getLogger(__name__)
+
+# Renew when this fraction of the granted lifetime is left, at least RENEW_MIN_MARGIN
+RENEW_MARGIN = 0.2
+RENEW_MIN_MARGIN = 5.0
+# Renewals may move up to this many seconds earlier to avoid bursts
+RENEW_SPREAD = 30.0
+# Renewals are counted per slot of this many seconds when spreading
+RENEW_SLOT = 1.0
+# Retry delays after a failed renewal: 2, 4, 8, ... seconds, capped
+RETRY_BASE = 2.0
+RETRY_MAX = 300.0
+
+RenewCallback = Callable[[], Awaitable[timedelta | None]]
+FailureCallback = Callable[[Exception, int], None]
+
+
+@dataclass(slots=True, eq=False)
+class ScheduledRenewal:
+    """Renewal state of one device's subscriptions."""
+
+    key: Hashable
+    renew: RenewCallback
+    on_failure: FailureCallback | None
+    # Loop time at which the subscription expires, None while failing
+    expires: float | None = None
+    due: float = 0.0
+    slot: int | None = None
+    failures: int = 0
+    renewals: int = 0
+    # Duration of the last successful renewal in seconds
+    latency: float | None = None
+
+
+class SubscriptionRenewalScheduler:
+    """
+    Renews every registered subscription from one timer.
+
+    A renew callback renews the subscriptions of one device and returns the
+    time until they expire, or None if there is nothing left to renew.
+    Renewals are kept in a heap ordered by due time; a single loop timer
+    is armed for the earliest one.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        margin: float = RENEW_MARGIN,
+        min_margin: float = RENEW_MIN_MARGIN,
+        spread: float = RENEW_SPREAD,
+        slot: float = RENEW_SLOT,
+        retry_base: float = RETRY_BASE,
+        retry_max: float = RETRY_MAX,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._margin = margin
+        self._min_margin = min_margin
+        self._spread = spread
+        self._slot = slot
+        self._retry_base = retry_base
+        self._retry_max = retry_max
+        self._entries: dict[Hashable, ScheduledRenewal] = {}
+        self._heap: list[tuple[float, int, ScheduledRenewal]] = []
+        self._counter = itertools.count()
+        # Renewals per slot, used to spread them out
+        self._load: Counter[int] = Counter()
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        """Return the number of registered subscriptions."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> ScheduledRenewal | None:
+        """Return the renewal state registered under a key."""
+        return self._entries.get(key)
+
+    def expires_in(self, key: Hashable) -> float | None:
+        """Return seconds until the subscription under a key expires."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires is None:
+            return None
+        return max(0.0, entry.expires - asyncio.get_running_loop().time())
+
+    def add(
+        self,
+        key: Hashable,
+        renew: RenewCallback,
+        expires_in: timedelta,
+        on_failure: FailureCallback | None = None,
+    ) -> ScheduledRenewal:
+        """Register fresh subscriptions, replacing any under the same key."""
+        self.remove(key)
+        entry = ScheduledRenewal(key, renew, on_failure)
+        self._entries[key] = entry
+        self._schedule_renewal(entry, expires_in.total_seconds())
+        return entry
+
+    def remove(self, key: Hashable) -> None:
+        """Stop renewing the subscriptions under a key."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._release_slot(entry)
+            self._arm()
+
+    def renew_soon(self, key: Hashable) -> None:
+        """Renew the subscriptions under a key right away."""
+        entry = self._entries.get(key)
+        # A renewal already in flight reschedules itself when done
+        if entry is not None and entry.due != float("inf"):
+            self._schedule(entry, asyncio.get_running_loop().time())
+
+    async def async_stop(self) -> None:
+        """Drop all subscriptions and cancel pending renewals."""
+        for key in list(self._entries):
+            self.remove(key)
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _schedule_renewal(self, entry: ScheduledRenewal, expires_in: float) -> None:
+        """Schedule renewal before expiry, in the least busy slot available."""
+        now = asyncio.get_running_loop().time()
+        entry.expires = now + expires_in
+        latest = entry.expires - max(expires_in * self._margin, self._min_margin)
+        earliest = max(now, latest - min(self._spread, expires_in * self._margin))
+
+        first, last = int(earliest // self._slot), int(latest // self._slot)
+        # Least loaded slot, the latest one on ties
+        slot = min(range(last, first - 1, -1), key=lambda slot: self._load[slot])
+        self._schedule(entry, min(max(slot * self._slot, earliest), latest), slot)
+
+    def _schedule(
+        self, entry: ScheduledRenewal, due: float, slot: int | None = None
+    ) -> None:
+        """Put an entry on the heap; older heap items of it become stale."""
+        self._release_slot(entry)
+        entry.due = due
+        entry.slot = slot
+        if slot is not None:
+            self._load[slot] += 1
+        heapq.heappush(self._heap, (due, next(self._counter), entry))
+        self._arm()
+
+    def _release_slot(self, entry: ScheduledRenewal) -> None:
+        """Give up the spreading slot held by an entry."""
+        if entry.slot is not None:
+            self._load[entry.slot] -= 1
+            if not self._load[entry.slot]:
+                del self._load[entry.slot]
+            entry.slot = None
+
+    def _is_current(self, due: float, entry: ScheduledRenewal) -> bool:
+        """Return if a heap item is the live schedule of a registered entry."""
+        return self._entries.get(entry.key) is entry and entry.due == due
+
+    def _arm(self) -> None:
+        """Arm the timer for the earliest live renewal."""
+        while self._heap and not self._is_current(self._heap[0][0], self._heap[0][2]):
+            heapq.heappop(self._heap)
+
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._heap:
+            self._timer = asyncio.get_running_loop().call_at(
+                self._heap[0][0], self._fire
+            )
+
+    def _fire(self) -> None:
+        """Start every renewal that is due."""
+        self._timer = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._heap and self._heap[0][0] <= now:
+            due, _, entry = heapq.heappop(self._heap)
+            if not self._is_current(due, entry):
+                continue
+            self._release_slot(entry)
+            # Not on the heap while renewing, so it cannot fire twice
+            entry.due = float("inf")
+            task = loop.create_task(self._async_renew(entry))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        self._arm()
+
+    async def _async_renew(self, entry: ScheduledRenewal) -> None:
+        """Renew one device's subscriptions and schedule the next renewal."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            expires_in = await entry.renew()
+        except Exception as err:  # noqa: BLE001
+            entry.failures += 1
+            entry.expires = None
+            delay = min(self._retry_base * 2 ** (entry.failures - 1), self._retry_max)
+            _LOGGER.warning(
+                "Renewing subscription of %s failed (attempt %s), "
+                "retrying in %.0fs: %s",
+                entry.key,
+                entry.failures,
+                delay,
+                err,
+            )
+            if entry.on_failure:
+                entry.on_failure(err, entry.failures)
+            if self._entries.get(entry.key) is entry:
+                self._schedule(entry, loop.time() + delay)
+            return
+
+        entry.latency = loop.time() - started
+        entry.failures = 0
+        entry.renewals += 1
+        if self._entries.get(entry.key) is not entry:
+            return
+        if expires_in is None:
+            self.remove(entry.key)
+        else:
+            self._schedule_renewal(entry, expires_in.total_seconds())
@@ -0,0 +1,23 @@
+"""Latency statistics shared by the coordinator's measurements."""
+
+import statistics
+from collections.abc import Iterable
+
+
+def summarize_latencies(samples: Iterable[float]) -> dict[str, float] | None:
+    """Return count, p50, p90, p99 and max of latencies, None without samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    if len(ordered) == 1:
+        p50 = p90 = p99 = ordered[0]
+    else:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    return {
+        "count": len(ordered),
+        "p50": p50,
+        "p90": p90,
+        "p99": p99,
+        "max": ordered[-1],
+    }
@@ -0,0 +1,250 @@
+"""Record and replay of Samsung TV UPnP traffic."""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from async_upnp_client.aiohttp import AiohttpNotifyServer, AiohttpRequester
+from async_upnp_client.client import UpnpRequester
+from async_upnp_client.const import HttpRequest, HttpResponse
+from async_upnp_client.exceptions import UpnpConnectionError
+from async_upnp_client.utils import get_local_ip
+
+from .upnp_device import SamsungTVUPnPDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+TRAFFIC_FORMAT_VERSION = 1
+
+KIND_HTTP = "http"
+KIND_NOTIFY = "notify"
+
+
+@dataclass(slots=True)
+class TrafficRecord:
+    """Single captured exchange, relative to the start of the recording."""
+
+    kind: str
+    offset: float
+    method: str
+    url: str
+    request_headers: dict[str, str] = field(default_factory=dict)
+    request_body: str | None = None
+    status_code: int | None = None
+    response_headers: dict[str, str] = field(default_factory=dict)
+    response_body: str | None = None
+    duration: float = 0.0
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        """Return the key used to match a request against recorded traffic."""
+        return _request_key(self.method, self.url, self.request_headers)
+
+
+def _request_key(
+    method: str, url: str, headers: dict[str, str] | Any
+) -> tuple[str, str, str]:
+    """Build the match key for a request; SOAP actions share a control URL."""
+    soap_action = ""
+    for name, value in headers.items():
+        if name.upper() == "SOAPACTION":
+            soap_action = value.strip('"')
+            break
+    return method.upper(), url, soap_action
+
+
+def save_traffic(
+    path: str | Path, records: list[TrafficRecord], source: str | None = None
+) -> None:
+    """Write captured traffic to a JSON fixture file, noting where it came from."""
+    payload: dict[str, Any] = {"version": TRAFFIC_FORMAT_VERSION}
+    if source:
+        payload["source"] = source
+    payload["records"] = [asdict(record) for record in records]
+    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def load_traffic(path: str | Path) -> list[TrafficRecord]:
+    """Read captured traffic from a JSON fixture file."""
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if payload.get("version") != TRAFFIC_FORMAT_VERSION:
+        msg = f"Unsupported traffic format: {payload.get('version')}"
+        raise ValueError(msg)
+    return [TrafficRecord(**record) for record in payload["records"]]
+
+
+class RecordingRequester(UpnpRequester):
+    """Requester that captures every exchange made through another requester."""
+
+    def __init__(self, requester: UpnpRequester) -> None:
+        """Initialize the recorder around the requester doing the real I/O."""
+        self._requester = requester
+        self._started = time.monotonic()
+        self.records: list[TrafficRecord] = []
+
+    async def async_http_request(self, http_request: HttpRequest) -> HttpResponse:
+        """Perform the request and record it along with the response."""
+        offset = time.monotonic() - self._started
+        response = await self._requester.async_http_request(http_request)
+        self.records.append(
+            TrafficRecord(
+                kind=KIND_HTTP,
+                offset=offset,
+                method=http_request.method,
+                url=http_request.url,
+                request_headers=dict(http_request.headers),
+                request_body=http_request.body,
+                status_code=response.status_code,
+                response_headers=dict(response.headers),
+                response_body=response.body,
+                duration=time.monotonic() - self._started - offset,
+            )
+        )
+        return response
+
+    def on_pre_notify(self, http_request: HttpRequest) -> HttpRequest:
+        """Record an incoming NOTIFY; usable as UpnpEventHandler.on_pre_notify."""
+        self.records.append(
+            TrafficRecord(
+                kind=KIND_NOTIFY,
+                offset=time.monotonic() - self._started,
+                method=http_request.method,
+                url=http_request.url,
+                request_headers=dict(http_request.headers),
+                request_body=http_request.body,
+            )
+        )
+        return http_request
+
+    def save(self, path: str | Path, source: str | None = None) -> None:
+        """Write everything captured so far to a fixture file."""
+        save_traffic(path, self.records, source)
+
+    async def close(self) -> None:
+        """Close the wrapped requester, if it supports closing."""
+        close = getattr(self._requester, "close", None)
+        if close is not None:
+            await close()
+
+
+class ReplayRequester(UpnpRequester):
+    """Requester that serves previously captured traffic back to the client."""
+
+    def __init__(self, records: list[TrafficRecord], speed: float = 0.0) -> None:
+        """
+        Initialize the replay.
+
+        speed scales the recorded response durations and NOTIFY spacing:
+        1.0 replays with the original timing, 10.0 ten times faster and
+        0.0 without any delay at all.
+        """
+        if speed < 0:
+            msg = f"Replay speed must not be negative, got {speed}"
+            raise ValueError(msg)
+        self._speed = speed
+        self._responses: dict[tuple[str, str, str], list[TrafficRecord]] = {}
+        self._served: dict[tuple[str, str, str], int] = {}
+        self.notifies = [r for r in records if r.kind == KIND_NOTIFY]
+        self.requests: list[HttpRequest] = []
+        for record in records:
+            if record.kind == KIND_HTTP:
+                self._responses.setdefault(record.key, []).append(record)
+
+    @classmethod
+    def from_file(cls, path: str | Path, speed: float = 0.0) -> "ReplayRequester":
+        """Create a replay from a fixture file."""
+        return cls(load_traffic(path), speed)
+
+    async def _async_sleep(self, seconds: float) -> None:
+        """Sleep for a recorded interval, scaled to the replay speed."""
+        if self._speed and seconds > 0:
+            await asyncio.sleep(seconds / self._speed)
+
+    async def async_http_request(self, http_request: HttpRequest) -> HttpResponse:
+        """Serve the recorded response for a request."""
+        self.requests.append(http_request)
+        key = _request_key(http_request.method, http_request.url, http_request.headers)
+        candidates = self._responses.get(key)
+        if not candidates:
+            msg = f"No recorded response for {key}"
+            raise UpnpConnectionError(msg)
+
+        # Serve responses in recorded order, then keep repeating the last one
+        index = self._served.get(key, 0)
+        self._served[key] = index + 1
+        record = candidates[min(index, len(candidates) - 1)]
+
+        await self._async_sleep(record.duration)
+        return HttpResponse(
+            record.status_code or 200,
+            dict(record.response_headers),
+            record.response_body,
+        )
+
+    async def async_replay_notifies(
+        self, handle_notify: Callable[[HttpRequest], Awaitable[Any]]
+    ) -> None:
+        """Feed recorded NOTIFY requests to a handler, keeping relative timing."""
+        previous = self.notifies[0].offset if self.notifies else 0.0
+        for record in self.notifies:
+            await self._async_sleep(record.offset - previous)
+            previous = record.offset
+            await handle_notify(
+                HttpRequest(
+                    record.method,
+                    record.url,
+                    dict(record.request_headers),
+                    record.request_body,
+                )
+            )
+
+
+async def async_record_session(
+    location: str,
+    path: str | Path,
+    *,
+    polls: int = 1,
+    interval: float = 1.0,
+    events: bool = True,
+) -> list[TrafficRecord]:
+    """
+    Capture a live session with a TV: setup plus a number of volume polls.
+
+    With events, a NOTIFY server is run for the session, so the SUBSCRIBE
+    and UNSUBSCRIBE exchanges and the NOTIFYs received while polling are
+    captured as well.
+    """
+    recorder = RecordingRequester(AiohttpRequester(timeout=10))
+    server: AiohttpNotifyServer | None = None
+    if events:
+        server = AiohttpNotifyServer(recorder, source=(get_local_ip(location), 0))
+        await server.async_start_server()
+        server.event_handler.on_pre_notify = recorder.on_pre_notify
+    device = SamsungTVUPnPDevice(
+        location,
+        requester=recorder,
+        event_handler=server.event_handler if server else None,
+    )
+    try:
+        await device.async_setup()
+        if server and not await device.async_subscribe_events(lambda _volume: None):
+            _LOGGER.warning("Event subscription failed, recording polls only")
+        for poll in range(polls):
+            if poll:
+                await asyncio.sleep(interval)
+            await device.async_get_volume()
+    finally:
+        try:
+            await device.async_close()
+            if server:
+                await server.async_stop_server()
+        finally:
+            recorder.save(path, f"Recorded from {location}")
+
+    _LOGGER.debug("Recorded %s exchanges to %s", len(recorder.records), path)
+    return recorder.records
@@ -0,0 +1,353 @@
+"""Volume transports and latency-based backend selection."""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+WEBSOCKET_REMOTE_PORT = 8001
+WEBSOCKET_REMOTE_NAME = "Home Assistant"
+
+# The remote channel only presses keys, so large changes stay on UPnP
+MAX_KEY_STEPS = 5
+# Seconds to wait for a volume event confirming key presses took effect
+KEY_CONFIRM_TIMEOUT = 2.0
+
+# Weight of a new sample in the latency moving average
+LATENCY_SMOOTHING = 0.3
+# Every Nth operation probes a slower backend so its latency stays current
+PROBE_EVERY = 20
+
+
+class UnsupportedVolumeOperationError(Exception):
+    """Raised when a transport cannot perform an operation right now."""
+
+
+class VolumeTransport(Protocol):
+    """
+    Operations a volume backend offers to the coordinator.
+
+    Backends that deliver volume events also provide
+    async_subscribe_events(callback, resync_callback); backends that act
+    relative to the current volume provide note_volume(volume) and
+    events_available, and are told about every volume the TV reports.
+    """
+
+    name: str
+    supports_get: bool
+
+    async def async_get_volume(self) -> int:
+        """Get current volume level."""
+
+    async def async_set_volume(self, volume: int) -> None:
+        """Set volume level."""
+
+
+class SamsungTVWebSocketRemote:
+    """
+    Volume over the TV's local WebSocket remote-control channel (2016+ models).
+
+    The channel sends key presses only: there is no way to read the volume
+    and no volume events, so setting is done by stepping KEY_VOLUP or
+    KEY_VOLDOWN from the last volume known via UPnP. Key presses are not
+    acknowledged either; a set only completes once a UPnP volume event
+    shows the TV reached the level, so it needs events_available.
+    """
+
+    name = "websocket"
+    supports_get = False
+
+    def __init__(
+        self,
+        host: str,
+        port: int = WEBSOCKET_REMOTE_PORT,
+        client_name: str = WEBSOCKET_REMOTE_NAME,
+        timeout: float = 5,
+    ) -> None:
+        """Initialize the remote."""
+        encoded_name = base64.b64encode(client_name.encode()).decode()
+        self.url = (
+            f"ws://{host}:{port}/api/v2/channels/samsung.remote.control"
+            f"?name={encoded_name}"
+        )
+        self.known_volume: int | None = None
+        # Volume events are delivered to note_volume, so sets can be confirmed
+        self.events_available = False
+        # Level and confirmation of the key presses in progress
+        self._ramp: tuple[int, asyncio.Future[None]] | None = None
+        self._timeout = timeout
+        self._session: aiohttp.ClientSession | None = None
+        self._websocket: aiohttp.ClientWebSocketResponse | None = None
+        self._reader: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        """Return if the persistent connection is open."""
+        return self._websocket is not None and not self._websocket.closed
+
+    async def async_connect(self) -> None:
+        """Open the persistent connection and wait for the TV to accept it."""
+        if self.is_connected:
+            return
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        async with asyncio.timeout(self._timeout):
+            self._websocket = await self._session.ws_connect(self.url)
+        try:
+            message = await self._websocket.receive_json(timeout=self._timeout)
+        except (TypeError, ValueError, TimeoutError) as err:
+            await self._async_drop_connection()
+            msg = f"No handshake from {self.url}: {err}"
+            raise ConnectionError(msg) from err
+
+        if message.get("event") != "ms.channel.connect":
+            await self._async_drop_connection()
+            msg = f"Remote control refused by TV: {message.get('event')}"
+            raise ConnectionError(msg)
+        _LOGGER.debug("Connected to Samsung TV remote at %s", self.url)
+        self._reader = asyncio.create_task(self._async_read(self._websocket))
+
+    async def _async_read(self, websocket: aiohttp.ClientWebSocketResponse) -> None:
+        """Drain TV events so pings are answered and a close is noticed."""
+        async for message in websocket:
+            _LOGGER.debug("Samsung TV remote message: %s", message.data)
+        _LOGGER.debug("Samsung TV remote at %s closed the connection", self.url)
+
+    async def _async_drop_connection(self) -> None:
+        """Close the WebSocket, keeping the session for reconnects."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._websocket is not None:
+            websocket, self._websocket = self._websocket, None
+            await websocket.close()
+
+    async def _async_websocket(self) -> aiohttp.ClientWebSocketResponse:
+        """Return the open WebSocket, connecting first if needed."""
+        await self.async_connect()
+        if self._websocket is None:
+            msg = f"Samsung TV remote at {self.url} closed the connection"
+            raise ConnectionResetError(msg)
+        return self._websocket
+
+    async def async_send_key(self, key: str, times: int = 1) -> None:
+        """Press a remote key, reconnecting once if the connection dropped."""
+        payload = json.dumps(
+            {
+                "method": "ms.remote.control",
+                "params": {
+                    "Cmd": "Click",
+                    "DataOfCmd": key,
+                    "Option": "false",
+                    "TypeOfRemote": "SendRemoteKey",
+                },
+            }
+        )
+        async with self._lock:
+            for attempt in range(2):
+                try:
+                    websocket = await self._async_websocket()
+                    for _ in range(times):
+                        await websocket.send_str(payload)
+                except (aiohttp.ClientError, ConnectionResetError):
+                    await self._async_drop_connection()
+                    if attempt:
+                        raise
+                else:
+                    return
+
+    async def async_get_volume(self) -> int:
+        """Volume cannot be read over the remote channel."""
+        msg = "WebSocket remote cannot read volume"
+        raise UnsupportedVolumeOperationError(msg)
+
+    def note_volume(self, volume: int) -> None:
+        """Take a volume reported by the TV, confirming key presses reaching it."""
+        self.known_volume = volume
+        if self._ramp and self._ramp[0] == volume and not self._ramp[1].done():
+            self._ramp[1].set_result(None)
+
+    async def async_set_volume(self, volume: int) -> None:
+        """Step the volume to the requested level and wait until the TV reports it."""
+        if not self.events_available:
+            msg = "Key presses cannot be confirmed"
+            raise UnsupportedVolumeOperationError(msg)
+        if self._ramp is not None:
+            # Events of the presses in flight would make the start level wrong
+            msg = "Previous key presses not confirmed"
+            raise UnsupportedVolumeOperationError(msg)
+        if self.known_volume is None:
+            msg = "Current volume unknown"
+            raise UnsupportedVolumeOperationError(msg)
+
+        steps = volume - self.known_volume
+        if abs(steps) > MAX_KEY_STEPS:
+            msg = f"{abs(steps)} key presses needed"
+            raise UnsupportedVolumeOperationError(msg)
+        if not steps:
+            return
+
+        confirmed = asyncio.get_running_loop().create_future()
+        self._ramp = (volume, confirmed)
+        try:
+            await self.async_send_key(
+                "KEY_VOLUP" if steps > 0 else "KEY_VOLDOWN", abs(steps)
+            )
+            async with asyncio.timeout(KEY_CONFIRM_TIMEOUT):
+                await confirmed
+        except BaseException:
+            # Where the TV stopped is unknown until it reports a volume again
+            self.known_volume = None
+            raise
+        finally:
+            self._ramp = None
+
+    async def async_close(self, *, graceful: bool = True) -> None:
+        """
+        Close the connection and its session.
+
+        Not graceful skips the close handshake, for a TV that is gone; the
+        session is closed even if closing is cancelled.
+        """
+        try:
+            if graceful:
+                await self._async_drop_connection()
+        finally:
+            if self._reader is not None:
+                self._reader.cancel()
+                self._reader = None
+            self._websocket = None
+            if self._session is not None:
+                session, self._session = self._session, None
+                await session.close()
+
+
+class VolumeTransportSelector:
+    """Routes each operation to the fastest transport that supports it."""
+
+    def __init__(self, transports: list[VolumeTransport]) -> None:
+        """Initialize with transports in order of preference."""
+        self.transports = transports
+        # Smoothed latency in seconds per (transport name, operation)
+        self.latency: dict[tuple[str, str], float] = {}
+        self._operations = 0
+        # One set at a time, so key presses always start from a settled level
+        self._set_lock = asyncio.Lock()
+
+    def note_volume(self, volume: int) -> None:
+        """Record a volume observed elsewhere, e.g. from a UPnP event."""
+        for transport in self.transports:
+            if (note_volume := getattr(transport, "note_volume", None)) is not None:
+                note_volume(volume)
+
+    def _candidates(self, operation: str) -> list[VolumeTransport]:
+        """Order transports for an operation: fastest first, unmeasured ahead."""
+        transports = [
+            transport
+            for transport in self.transports
+            if operation != "get" or transport.supports_get
+        ]
+        unmeasured = [t for t in transports if (t.name, operation) not in self.latency]
+        measured = sorted(
+            (t for t in transports if (t.name, operation) in self.latency),
+            key=lambda t: self.latency[(t.name, operation)],
+        )
+        ordered = unmeasured + measured
+
+        # Periodically give the runner-up a go to keep its measurement fresh
+        self._operations += 1
+        if not unmeasured and len(ordered) > 1 and self._operations % PROBE_EVERY == 0:
+            ordered[0], ordered[1] = ordered[1], ordered[0]
+        return ordered
+
+    def _record(
+        self, transport: VolumeTransport, operation: str, elapsed: float
+    ) -> None:
+        """Fold a latency sample into the moving average."""
+        key = (transport.name, operation)
+        previous = self.latency.get(key)
+        self.latency[key] = (
+            elapsed
+            if previous is None
+            else previous + LATENCY_SMOOTHING * (elapsed - previous)
+        )
+
+    async def async_get_volume(self) -> int:
+        """Get volume from the fastest capable transport."""
+        last_error: Exception | None = None
+        for transport in self._candidates("get"):
+            started = time.perf_counter()
+            try:
+                volume = await transport.async_get_volume()
+            except UnsupportedVolumeOperationError as err:
+                last_error = err
+                continue
+            self._record(transport, "get", time.perf_counter() - started)
+            self.note_volume(volume)
+            return volume
+        msg = "No transport can get volume"
+        raise last_error or UnsupportedVolumeOperationError(msg)
+
+    async def async_set_volume(self, volume: int) -> None:
+        """Set volume via the fastest transport, falling back on failure."""
+        async with self._set_lock:
+            await self._async_set_volume(volume)
+
+    async def _async_set_volume(self, volume: int) -> None:
+        """Set volume via the fastest transport; called with the set lock held."""
+        candidates = self._candidates("set")
+        for index, transport in enumerate(candidates):
+            # A remote already at the level sends no keys; its time means nothing
+            idle = getattr(transport, "known_volume", None) == volume
+            started = time.perf_counter()
+            try:
+                await transport.async_set_volume(volume)
+            except UnsupportedVolumeOperationError:
+                continue
+            except Exception as err:
+                if index == len(candidates) - 1:
+                    raise
+                _LOGGER.debug("Set volume via %s failed: %s", transport.name, err)
+                # Make a failing transport look slow until it proves otherwise
+                self._record(transport, "set", self._timeout_penalty())
+                continue
+            if not idle:
+                self._record(transport, "set", time.perf_counter() - started)
+            self.note_volume(volume)
+            return
+        msg = "No transport can set volume"
+        raise UnsupportedVolumeOperationError(msg)
+
+    def _timeout_penalty(self) -> float:
+        """Return the latency charged for a failed operation."""
+        return max(self.latency.values(), default=1.0) * 10
+
+    async def async_subscribe_events(
+        self,
+        callback: Callable[[int], None],
+        resync_callback: Callable[[str], None] | None = None,
+    ) -> bool:
+        """Subscribe via the first transport that delivers volume events."""
+
+        def _on_volume(volume: int) -> None:
+            self.note_volume(volume)
+            callback(volume)
+
+        for transport in self.transports:
+            subscribe = getattr(transport, "async_subscribe_events", None)
+            if subscribe is not None:
+                subscribed = await subscribe(_on_volume, resync_callback)
+                for other in self.transports:
+                    if hasattr(other, "events_available"):
+                        other.events_available = subscribed
+                return subscribed
+        return False
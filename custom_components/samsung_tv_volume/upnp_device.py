@@ -1,15 +1,123 @@
 """UPnP device management for Samsung TV Volume Control."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from http import HTTPStatus
 from typing import TypedDict
+from urllib.parse import urlparse
+from xml.etree import ElementTree as ET
 
 from async_upnp_client.aiohttp import AiohttpRequester
-from async_upnp_client.client import UpnpDevice
+from async_upnp_client.client import UpnpDevice, UpnpRequester, UpnpService
 from async_upnp_client.client_factory import UpnpFactory
+from async_upnp_client.const import HttpRequest, HttpResponse, ServiceInfo
+from async_upnp_client.event_handler import UpnpEventHandler
+from async_upnp_client.exceptions import UpnpError
 from async_upnp_client.profiles.dlna import DmrDevice
+from async_upnp_client.profiles.profile import RESUBSCRIBE_TOLERANCE
+
+from .renewal import SubscriptionRenewalScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+RENDERING_CONTROL = "urn:schemas-upnp-org:service:RenderingControl:1"
+
+# UDA 1.1 headers of SSDP announcements and GENA NOTIFYs
+HEADER_BOOT_ID = "BOOTID.UPNP.ORG"
+HEADER_CONFIG_ID = "CONFIGID.UPNP.ORG"
+
+# Seconds to wait for the old address to take back subscriptions after a move
+STALE_UNSUBSCRIBE_TIMEOUT = 5
+
+# Error responses in a row after which the fast path is given up
+FAST_PATH_MAX_FAILURES = 3
+
+# GetVolume/SetVolume envelopes are fixed apart from the volume value
+# (see OLD_DOCS.md), so the fast path only substitutes that.
+_ENVELOPE_HEAD = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/"><s:Body>'
+)
+_ENVELOPE_TAIL = "</s:Body></s:Envelope>"
+_GET_VOLUME_ENVELOPE = (
+    f'{_ENVELOPE_HEAD}<u:GetVolume xmlns:u="{RENDERING_CONTROL}">'
+    "<InstanceID>0</InstanceID><Channel>Master</Channel>"
+    f"</u:GetVolume>{_ENVELOPE_TAIL}"
+)
+_SET_VOLUME_ENVELOPE_HEAD = (
+    f'{_ENVELOPE_HEAD}<u:SetVolume xmlns:u="{RENDERING_CONTROL}">'
+    "<InstanceID>0</InstanceID><DesiredVolume>"
+)
+_SET_VOLUME_ENVELOPE_TAIL = (
+    f"</DesiredVolume><Channel>Master</Channel></u:SetVolume>{_ENVELOPE_TAIL}"
+)
+_CURRENT_VOLUME_OPEN = "<CurrentVolume>"
+_CURRENT_VOLUME_CLOSE = "</CurrentVolume>"
+
+
+def _soap_headers(action: str) -> dict[str, str]:
+    """Return the headers for a RenderingControl SOAP action."""
+    return {
+        "Content-Type": 'text/xml; charset="utf-8"',
+        "SOAPAction": f'"{RENDERING_CONTROL}#{action}"',
+    }
+
+
+class VolumeSoapCodec:
+    """Precompiled SOAP requests and response scanning for Get/SetVolume."""
+
+    __slots__ = ("_get_volume_request", "_set_volume_headers", "control_url")
+
+    def __init__(self, control_url: str) -> None:
+        """Precompute the requests for a RenderingControl control URL."""
+        self.control_url = control_url
+        self._get_volume_request = HttpRequest(
+            "POST", control_url, _soap_headers("GetVolume"), _GET_VOLUME_ENVELOPE
+        )
+        self._set_volume_headers = _soap_headers("SetVolume")
+
+    def get_volume_request(self) -> HttpRequest:
+        """Return the (immutable, shared) GetVolume request."""
+        return self._get_volume_request
+
+    def set_volume_request(self, volume: int) -> HttpRequest:
+        """Return a SetVolume request for a validated 0-100 volume."""
+        return HttpRequest(
+            "POST",
+            self.control_url,
+            self._set_volume_headers,
+            f"{_SET_VOLUME_ENVELOPE_HEAD}{volume}{_SET_VOLUME_ENVELOPE_TAIL}",
+        )
+
+    @staticmethod
+    def parse_get_volume(response: HttpResponse) -> int | None:
+        """Extract CurrentVolume from a response, None if it looks unexpected."""
+        body = response.body
+        if response.status_code != HTTPStatus.OK or not body:
+            return None
+        start = body.find(_CURRENT_VOLUME_OPEN)
+        if start < 0:
+            return None
+        start += len(_CURRENT_VOLUME_OPEN)
+        end = body.find(_CURRENT_VOLUME_CLOSE, start)
+        value = body[start:end].strip() if end > 0 else ""
+        if not value.isdigit():
+            return None
+        return int(value)
+
+    @staticmethod
+    def is_set_volume_ok(response: HttpResponse) -> bool:
+        """Return True if a response acknowledges SetVolume."""
+        return (
+            response.status_code == HTTPStatus.OK
+            and response.body is not None
+            and "SetVolumeResponse" in response.body
+        )
+
 
 class DeviceInfo(TypedDict, total=False):
     """Type definition for UPnP device info."""
@@ -24,25 +132,199 @@ class DeviceInfo(TypedDict, total=False):
     presentation_url: str | None
 
 
+# GENA SEQ wraps from 2^32-1 back to 1; 0 is only used for the initial event
+EVENT_SEQ_MAX = 4294967295
+
+# What a slim device model keeps of RenderingControl
+_SLIM_ACTIONS = ("GetVolume", "SetVolume", "GetMute", "SetMute")
+_SLIM_EVENTED_VARIABLES = ("LastChange", "Volume", "Mute")
+
+
+def slim_rendering_control_device(device: UpnpDevice) -> UpnpDevice:
+    """
+    Return a copy of a parsed device model reduced to RenderingControl.
+
+    Other services, embedded devices, unused actions and state variables
+    and the retained description/SCPD XML trees are dropped, so they can
+    be garbage collected once the full model is released.
+    """
+    service = device.find_service(RENDERING_CONTROL)
+    if service is None:
+        msg = f"{device.device_url} has no RenderingControl service"
+        raise UpnpError(msg)
+
+    actions = [
+        service.actions[name] for name in _SLIM_ACTIONS if name in service.actions
+    ]
+    variable_names = {
+        argument.related_state_variable.name
+        for action in actions
+        for argument in action.arguments
+    }
+    variable_names.update(_SLIM_EVENTED_VARIABLES)
+    state_variables = [
+        variable
+        for name, variable in service.state_variables.items()
+        if name in variable_names
+    ]
+
+    slim_service = UpnpService(
+        service.requester,
+        ServiceInfo(
+            service_id=service.service_id,
+            service_type=service.service_type,
+            control_url=service.control_url,
+            event_sub_url=service.event_sub_url,
+            scpd_url=service.scpd_url,
+            xml=ET.Element("service"),
+        ),
+        state_variables,
+        actions,
+    )
+    owner = service.device
+    return UpnpDevice(
+        owner.requester,
+        owner.device_info._replace(icons=[], xml=ET.Element("device")),
+        [slim_service],
+        [],
+    )
+
+
+def _rebase_url(url: str | None, old_netloc: str, location: str) -> str | None:
+    """Move a URL on the old host onto the scheme and host of a location."""
+    if not url:
+        return url
+    parsed = urlparse(url)
+    if parsed.netloc != old_netloc:
+        return url
+    new = urlparse(location)
+    return parsed._replace(scheme=new.scheme, netloc=new.netloc).geturl()
+
+
+def rebase_device(device: UpnpDevice, location: str) -> UpnpDevice:
+    """
+    Return a copy of a parsed device model moved to a new location.
+
+    URLs on the host of the old location are moved to the host of the new
+    one. Actions and state variables are reused, so nothing is fetched;
+    this is only valid for the same description served from a new host.
+    """
+    old_netloc = urlparse(device.device_url).netloc
+
+    def _copy(owner: UpnpDevice) -> UpnpDevice:
+        services = [
+            UpnpService(
+                service.requester,
+                ServiceInfo(
+                    service_id=service.service_id,
+                    service_type=service.service_type,
+                    control_url=_rebase_url(service.control_url, old_netloc, location),
+                    event_sub_url=_rebase_url(
+                        service.event_sub_url, old_netloc, location
+                    ),
+                    scpd_url=_rebase_url(service.scpd_url, old_netloc, location),
+                    xml=service.xml,
+                ),
+                list(service.state_variables.values()),
+                list(service.actions.values()),
+            )
+            for service in owner.services.values()
+        ]
+        info = owner.device_info
+        return UpnpDevice(
+            owner.requester,
+            info._replace(
+                url=_rebase_url(info.url, old_netloc, location),
+                presentation_url=_rebase_url(
+                    info.presentation_url, old_netloc, location
+                ),
+                icons=[
+                    icon._replace(url=_rebase_url(icon.url, old_netloc, location))
+                    for icon in info.icons
+                ],
+            ),
+            services,
+            [_copy(embedded) for embedded in owner.embedded_devices.values()],
+        )
+
+    return _copy(device)
+
+
 class SamsungTVUPnPDevice:
     """Manages UPnP connection and volume control for Samsung TV."""
 
-    def __init__(self, location: str) -> None:
-        """Initialize the UPnP device manager."""
+    # VolumeTransport attributes, see transport.py
+    name = "upnp"
+    supports_get = True
+
+    def __init__(  # noqa: PLR0913
+        self,
+        location: str,
+        *,
+        requester: UpnpRequester | None = None,
+        event_handler: UpnpEventHandler | None = None,
+        fast_path: bool = False,
+        slim: bool = False,
+        renewal_scheduler: SubscriptionRenewalScheduler | None = None,
+        on_event_gap: Callable[[int], None] | None = None,
+        on_boot_ids: Callable[[str | None, str | None], None] | None = None,
+        config_id: str | None = None,
+    ) -> None:
+        """
+        Initialize the UPnP device manager.
+
+        With a renewal_scheduler, event subscriptions are renewed by that
+        shared scheduler instead of a renewal task of the DmrDevice.
+        on_event_gap is called with the number of NOTIFYs lost per gap.
+        on_boot_ids is called with the BOOTID and CONFIGID of each NOTIFY that
+        carries either. config_id is the CONFIGID of the description about
+        to be fetched, if the TV announced one.
+        """
         self.location = location
+        self._renewals = renewal_scheduler
+        self._renewal_failed = False
+        self._fast_path = fast_path
+        self._fast_path_failures = 0
+        self._slim = slim
+        self._event_callback: Callable[[int], None] | None = None
+        self._resync_callback: Callable[[str], None] | None = None
+        # Last SEQ seen per subscription SID
+        self._event_sequences: dict[str, int] = {}
+        self.event_gaps = 0
+        self.missed_events = 0
+        self._on_event_gap = on_event_gap
+        self._on_boot_ids = on_boot_ids
+        # CONFIGID of the description the device model was parsed from
+        self.config_id = config_id
+        self._volume_codec: VolumeSoapCodec | None = None
+        self._event_handler = event_handler
+        self._previous_on_pre_notify: Callable[[HttpRequest], HttpRequest] | None = None
         self._dmr_device: DmrDevice | None = None
-        self._requester: AiohttpRequester | None = None
+        # A supplied requester (e.g. a traffic replay) is owned by the caller
+        self._external_requester = requester
+        self._requester: UpnpRequester | None = None
         self._upnp_device: UpnpDevice | None = None
+        self._device_info: DeviceInfo | None = None
+        # UNSUBSCRIBEs sent to an address the TV moved away from
+        self._stale_unsubscribes: set[asyncio.Task] = set()
 
     async def async_setup(self) -> None:
         """Set up the UPnP device connection."""
         _LOGGER.debug("Setting up UPnP device at %s", self.location)
 
         try:
-            self._requester = AiohttpRequester(timeout=10)
+            self._requester = self._external_requester or AiohttpRequester(timeout=10)
             factory = UpnpFactory(self._requester)
             self._upnp_device = await factory.async_create_device(self.location)
-            self._dmr_device = DmrDevice(self._upnp_device, None)
+            self._device_info = None
+            if self._slim:
+                self._upnp_device = slim_rendering_control_device(self._upnp_device)
+            self._dmr_device = DmrDevice(self._upnp_device, self._event_handler)
+
+            if self._fast_path:
+                service = self._upnp_device.find_service(RENDERING_CONTROL)
+                if service and service.has_action("GetVolume"):
+                    self._volume_codec = VolumeSoapCodec(service.control_url)
 
             _LOGGER.debug("Successfully created DmrDevice for %s", self.location)
 
@@ -55,7 +337,16 @@ class SamsungTVUPnPDevice:
         if not self._dmr_device:
             raise RuntimeError("Device not set up")
 
+        if self._volume_codec:
+            volume = await self._async_fast_get_volume(self._volume_codec)
+            if volume is not None:
+                return volume
+
         try:
+            if self._slim:
+                # Without AVTransport DmrDevice.async_update won't poll RC
+                return await self._async_call_get_volume()
+
             # Update DmrDevice state before accessing properties
             await self._dmr_device.async_update()
 
@@ -78,6 +369,11 @@ class SamsungTVUPnPDevice:
         if not 0 <= volume <= 100:
             raise ValueError(f"Volume must be between 0 and 100, got {volume}")
 
+        if self._volume_codec and await self._async_fast_set_volume(
+            self._volume_codec, volume
+        ):
+            return
+
         try:
             # Convert 0-100 range to 0.0-1.0 for DmrDevice
             volume_level = volume / 100.0
@@ -87,20 +383,100 @@ class SamsungTVUPnPDevice:
             _LOGGER.error("Failed to set volume to %s: %s", volume, err)
             raise
 
-    async def async_subscribe_events(self, callback) -> bool:
-        """Subscribe to UPnP events from Samsung TV."""
+    async def _async_call_get_volume(self) -> int:
+        """Get volume by calling the RenderingControl action directly."""
+        if not self._upnp_device:
+            msg = "Device not set up"
+            raise RuntimeError(msg)
+        action = self._upnp_device.service(RENDERING_CONTROL).action("GetVolume")
+        result = await action.async_call(InstanceID=0, Channel="Master")
+        volume = int(result["CurrentVolume"])
+        _LOGGER.debug("Current volume: %s", volume)
+        return volume
+
+    def _fast_path_failed(self, action: str, response: HttpResponse) -> None:
+        """
+        Fall back to the generic action path after an unexpected response.
+
+        An error status, e.g. from a busy TV, only falls back for the call at
+        hand unless it keeps happening; a 200 the codec cannot read means
+        the TV answers differently and the fast path is given up at once.
+        """
+        self._fast_path_failures += 1
+        if (
+            response.status_code == HTTPStatus.OK
+            or self._fast_path_failures >= FAST_PATH_MAX_FAILURES
+        ):
+            _LOGGER.debug(
+                "Unexpected %s response from %s (status %s), using generic path",
+                action,
+                self.location,
+                response.status_code,
+            )
+            self._volume_codec = None
+        else:
+            _LOGGER.debug(
+                "%s on %s failed with status %s, using generic path for this call",
+                action,
+                self.location,
+                response.status_code,
+            )
+
+    async def _async_fast_get_volume(self, codec: VolumeSoapCodec) -> int | None:
+        """Get volume via the precompiled envelope, None to fall back."""
+        if not self._requester:
+            return None
+        response = await self._requester.async_http_request(codec.get_volume_request())
+        volume = codec.parse_get_volume(response)
+        if volume is None:
+            self._fast_path_failed("GetVolume", response)
+        else:
+            self._fast_path_failures = 0
+        return volume
+
+    async def _async_fast_set_volume(self, codec: VolumeSoapCodec, volume: int) -> bool:
+        """Set volume via the precompiled envelope, False to fall back."""
+        if not self._requester:
+            return False
+        response = await self._requester.async_http_request(
+            codec.set_volume_request(volume)
+        )
+        if not codec.is_set_volume_ok(response):
+            self._fast_path_failed("SetVolume", response)
+            return False
+        self._fast_path_failures = 0
+        _LOGGER.debug("Set volume to %s", volume)
+        return True
+
+    async def async_subscribe_events(
+        self,
+        callback: Callable[[int], None],
+        resync_callback: Callable[[str], None] | None = None,
+    ) -> bool:
+        """
+        Subscribe to UPnP events from Samsung TV.
+
+        resync_callback is called with a reason when events may have been
+        lost: a SEQ gap or reset, or a failed subscription renewal.
+        """
         if not self._dmr_device:
             raise RuntimeError("Device not set up")
 
         try:
-            # Store callback for later use
+            # Store callbacks for later use
             self._event_callback = callback
+            self._resync_callback = resync_callback
 
             # Set up event callback on DmrDevice
             self._dmr_device.on_event = self._handle_upnp_event
 
+            # Watch SEQ headers of incoming NOTIFYs
+            if self._event_handler and self._previous_on_pre_notify is None:
+                self._previous_on_pre_notify = self._event_handler.on_pre_notify
+                self._event_handler.on_pre_notify = self._on_pre_notify
+
             # Start event subscription on rendering control service
-            await self._dmr_device.async_subscribe_services(auto_resubscribe=True)
+            await self._async_subscribe_services()
 
             _LOGGER.debug("Subscribed to UPnP events")
             return True
@@ -108,6 +484,235 @@ class SamsungTVUPnPDevice:
             _LOGGER.error("Failed to subscribe to events: %s", err)
             return False
 
+    async def async_resubscribe_events(self) -> None:
+        """Subscribe again after a subscription was lost."""
+        if not self._dmr_device:
+            msg = "Device not set up"
+            raise RuntimeError(msg)
+
+        if self._renewals and self._renewals.get(self):
+            # The scheduler is already retrying; bring its next attempt forward
+            self._renewals.renew_soon(self)
+            return
+        await self._async_subscribe_services()
+
+    async def async_restore_subscription(self) -> None:
+        """
+        Subscribe again after the TV rebooted, keeping the parsed device model.
+
+        Only valid while the TV's description (CONFIGID) and location are
+        unchanged; the old SIDs died with the reboot.
+        """
+        if not self._dmr_device:
+            msg = "Device not set up"
+            raise RuntimeError(msg)
+
+        if self._renewals:
+            self._renewals.remove(self)
+        # Also forgets the stale SIDs if the TV rejects the UNSUBSCRIBE
+        await self._dmr_device.async_unsubscribe_services()
+        self._event_sequences.clear()
+        self._renewal_failed = False
+        if self._event_callback:
+            await self._async_subscribe_services()
+
+    async def async_relocate(self, location: str, config_id: str | None = None) -> bool:
+        """
+        Move to a new address of the same TV without setting it up again.
+
+        When only the host changed and the TV's CONFIGID, if it sent one, is
+        the one the model was parsed from, the parsed device model is
+        rebased onto the new location instead of fetching the description
+        again. Returns if the model was reused.
+        """
+        if not self._dmr_device or not self._upnp_device:
+            msg = "Device not set up"
+            raise RuntimeError(msg)
+
+        old, new = urlparse(self.location), urlparse(location)
+        reused = (old.path, old.query) == (new.path, new.query) and (
+            config_id is None or config_id == self.config_id
+        )
+        if reused:
+            upnp_device = rebase_device(self._upnp_device, location)
+        else:
+            upnp_device = await UpnpFactory(self._requester).async_create_device(
+                location
+            )
+            if self._slim:
+                upnp_device = slim_rendering_control_device(upnp_device)
+
+        # The old address may no longer answer; don't wait for it
+        if self._renewals:
+            self._renewals.remove(self)
+        stale = self._dmr_device
+        stale.on_event = None
+        if stale.is_subscribed:
+            task = asyncio.create_task(self._async_drop_stale_subscriptions(stale))
+            self._stale_unsubscribes.add(task)
+            task.add_done_callback(self._stale_unsubscribes.discard)
+
+        self.location = location
+        self._upnp_device = upnp_device
+        self._device_info = None
+        if config_id is not None:
+            self.config_id = config_id
+        self._dmr_device = DmrDevice(upnp_device, self._event_handler)
+        if self._volume_codec:
+            service = upnp_device.find_service(RENDERING_CONTROL)
+            self._volume_codec = None
+            if service and service.has_action("GetVolume"):
+                self._volume_codec = VolumeSoapCodec(service.control_url)
+        self._event_sequences.clear()
+        self._renewal_failed = False
+        if self._event_callback:
+            self._dmr_device.on_event = self._handle_upnp_event
+            await self._async_subscribe_services()
+
+        _LOGGER.debug(
+            "Moved to %s, %s the device model",
+            location,
+            "reusing" if reused else "fetching",
+        )
+        return reused
+
+    async def _async_drop_stale_subscriptions(self, dmr_device: DmrDevice) -> None:
+        """Unsubscribe the old address, giving up after a short while."""
+        try:
+            async with asyncio.timeout(STALE_UNSUBSCRIBE_TIMEOUT):
+                await dmr_device.async_unsubscribe_services()
+        except TimeoutError:
+            _LOGGER.debug("Old address of %s did not answer UNSUBSCRIBE", self.location)
+
+    async def _async_subscribe_services(self) -> None:
+        """Subscribe and hand renewal to the shared scheduler, if there is one."""
+        if not self._dmr_device:
+            msg = "Device not set up"
+            raise RuntimeError(msg)
+        if self._renewals is None:
+            await self._dmr_device.async_subscribe_services(auto_resubscribe=True)
+            return
+
+        if (expires_in := await self._async_renew_subscription()) is not None:
+            self._renewal_failed = False
+            self._renewals.add(
+                self,
+                self._async_renew_subscription,
+                expires_in,
+                self._on_renewal_failure,
+            )
+
+    async def _async_renew_subscription(self) -> timedelta | None:
+        """Subscribe or renew, returning the time until expiry."""
+        if not self._dmr_device:
+            return None
+
+        renew_in = await self._dmr_device.async_subscribe_services()
+        if renew_in is None:
+            return None
+        if self._renewal_failed:
+            self._renewal_failed = False
+            _LOGGER.info("Event subscription restored for %s", self.location)
+            if self._resync_callback:
+                self._resync_callback("subscription restored")
+        if (granted := self._granted_lifetime()) is not None:
+            return granted
+        return renew_in + RESUBSCRIBE_TOLERANCE
+
+    def _granted_lifetime(self) -> timedelta | None:
+        """Return the time until the earliest subscription the TV granted expires."""
+        if not self._dmr_device:
+            return None
+        # The DmrDevice answers with the time left minus its own tolerance,
+        # clamped at zero, which loses short timeouts; it keeps the expiries
+        expiries = self._dmr_device._subscriptions.values()  # noqa: SLF001
+        if not expiries:
+            return None
+        return timedelta(seconds=max(0.0, min(expiries) - time.monotonic()))
+
+    def _on_renewal_failure(self, _err: Exception, attempt: int) -> None:
+        """Report the first failed renewal; the scheduler keeps retrying."""
+        if attempt == 1:
+            self._renewal_failed = True
+            _LOGGER.info("Event subscription renewal failed for %s", self.location)
+            if self._resync_callback:
+                self._resync_callback("subscription renewal failed")
+
+    @property
+    def is_subscribed(self) -> bool:
+        """Return if there is a live event subscription."""
+        return bool(self._dmr_device and self._dmr_device.is_subscribed)
+
+    @property
+    def subscription_expires_in(self) -> float | None:
+        """Return seconds until the event subscription expires, if known."""
+        return self._renewals.expires_in(self) if self._renewals else None
+
+    @property
+    def renewal_latency(self) -> float | None:
+        """Return the duration of the last subscription renewal in seconds."""
+        entry = self._renewals.get(self) if self._renewals else None
+        return entry.latency if entry else None
+
+    def _on_pre_notify(self, http_request: HttpRequest) -> HttpRequest:
+        """Track the SEQ and IDs of an incoming NOTIFY before it is decoded."""
+        if self._previous_on_pre_notify:
+            http_request = self._previous_on_pre_notify(http_request)
+
+        headers = http_request.headers
+        boot_id = headers.get(HEADER_BOOT_ID)
+        config_id = headers.get(HEADER_CONFIG_ID)
+        if self._on_boot_ids and (boot_id or config_id):
+            self._on_boot_ids(boot_id, config_id)
+
+        sid = headers.get("SID")
+        seq = headers.get("SEQ", "")
+        if sid and seq.isdigit():
+            self._track_event_sequence(sid, int(seq))
+        return http_request
+
+    def _track_event_sequence(self, sid: str, seq: int) -> None:
+        """Detect lost or reset event sequences and request a resync."""
+        last = self._event_sequences.get(sid)
+        if last is None:
+            # A new SID starts at 0; forget sequences of replaced subscriptions
+            if self._event_handler:
+                for known_sid in list(self._event_sequences):
+                    if self._event_handler.service_for_sid(known_sid) is None:
+                        del self._event_sequences[known_sid]
+            self._event_sequences[sid] = seq
+            if seq == 0:
+                return
+            missed, reason = seq, "initial event missed"
+        else:
+            expected = 1 if last >= EVENT_SEQ_MAX else last + 1
+            if seq == expected:
+                self._event_sequences[sid] = seq
+                return
+            if seq == 0:
+                missed, reason = 0, "event sequence reset"
+            elif seq > expected:
+                missed, reason = seq - expected, "event sequence gap"
+            else:
+                # Duplicate or reordered NOTIFY, nothing was lost
+                return
+            self._event_sequences[sid] = seq
+
+        self.event_gaps += 1
+        self.missed_events += missed
+        if self._on_event_gap:
+            self._on_event_gap(missed)
+        _LOGGER.info(
+            "%s on %s (SID %s, SEQ %s, %s missed); resyncing",
+            reason,
+            self.location,
+            sid,
+            seq,
+            missed,
+        )
+        if self._resync_callback:
+            self._resync_callback(reason)
+
     def _handle_upnp_event(self, service, state_variables):
         """Handle UPnP event from Samsung TV."""
         _LOGGER.debug(
@@ -116,8 +721,15 @@ class SamsungTVUPnPDevice:
             state_variables,
         )
 
+        if not state_variables:
+            # DmrDevice signals a failed subscription renewal this way
+            _LOGGER.info("Event subscription renewal failed for %s", self.location)
+            if self._resync_callback:
+                self._resync_callback("subscription renewal failed")
+            return
+
         # Look for volume changes in RenderingControl service
-        if service.service_type == "urn:schemas-upnp-org:service:RenderingControl:1":
+        if service.service_type == RENDERING_CONTROL:
             for state_var in state_variables:
                 if state_var.name == "Volume":
                     volume = int(state_var.value)
@@ -131,46 +743,66 @@ class SamsungTVUPnPDevice:
             if self._dmr_device:
                 # Unsubscribe from services
                 await self._dmr_device.async_unsubscribe_services()
-
-                # Clear event callback
-                self._dmr_device.on_event = None
-
-            self._event_callback = None
             _LOGGER.debug("Unsubscribed from UPnP events")
         except Exception as err:
             _LOGGER.error("Failed to unsubscribe from events: %s", err)
+        finally:
+            self._release_events()
+
+    def _release_events(self) -> None:
+        """Drop event callbacks and hooks without contacting the TV."""
+        if self._renewals:
+            self._renewals.remove(self)
+        if self._dmr_device:
+            self._dmr_device.on_event = None
+        self._event_callback = None
+        self._resync_callback = None
+        if self._event_handler and self._previous_on_pre_notify:
+            self._event_handler.on_pre_notify = self._previous_on_pre_notify
+            self._previous_on_pre_notify = None
 
     def get_device_info(self) -> DeviceInfo | None:
         """Return device info from UPnP device."""
         if not self._upnp_device:
             return None
 
-        # Extract real device info from UPnP device
-        device_info = DeviceInfo(
-            friendly_name=self._upnp_device.friendly_name,
-            manufacturer=self._upnp_device.manufacturer,
-            model_name=self._upnp_device.model_name,
-            model_number=self._upnp_device.model_number,
-            serial_number=self._upnp_device.serial_number,
-            udn=self._upnp_device.udn,
-            device_type=self._upnp_device.device_type,
-            presentation_url=self._upnp_device.presentation_url,
-        )
-
-        return device_info
+        # The description does not change while the device is set up
+        if self._device_info is None:
+            self._device_info = DeviceInfo(
+                friendly_name=self._upnp_device.friendly_name,
+                manufacturer=self._upnp_device.manufacturer,
+                model_name=self._upnp_device.model_name,
+                model_number=self._upnp_device.model_number,
+                serial_number=self._upnp_device.serial_number,
+                udn=self._upnp_device.udn,
+                device_type=self._upnp_device.device_type,
+                presentation_url=self._upnp_device.presentation_url,
+            )
+
+        return self._device_info
 
     async def async_close(self) -> None:
-        """Close the UPnP device connection."""
-        # Unsubscribe from events before closing
-        if hasattr(self, "_event_callback") and self._event_callback:
-            await self.async_unsubscribe_events()
-
-        if self._requester:
-            await self._requester.close()
-            self._requester = None
-        self._dmr_device = None
-        self._upnp_device = None
-        _LOGGER.debug("Closed UPnP device connection")
+        """Close the UPnP device connection, releasing it even if cancelled."""
+        try:
+            # Unsubscribe from events before closing
+            if self._event_callback:
+                await self.async_unsubscribe_events()
+        finally:
+            self._release_events()
+            for task in self._stale_unsubscribes:
+                task.cancel()
+            await asyncio.gather(*self._stale_unsubscribes, return_exceptions=True)
+
+            requester, self._requester = self._requester, None
+            self._dmr_device = None
+            self._upnp_device = None
+            self._device_info = None
+            self._volume_codec = None
+            # AiohttpRequester opens a session per request and has no close()
+            close = getattr(requester, "close", None)
+            if close and requester is not self._external_requester:
+                await close()
+            _LOGGER.debug("Closed UPnP device connection")
 
     @property
     def is_connected(self) -> bool:
@@ -1,11 +1,17 @@
 """Test configuration and fixtures."""
 
 import pytest
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.samsung_tv_volume.const import DOMAIN
+from custom_components.samsung_tv_volume.traffic import ReplayRequester
 
 
 @pytest.fixture
@@ -62,8 +68,25 @@ def mock_upnp_device():
     return device
 
 
+@pytest.fixture
+def mock_notify_server():
+    """Mock the coordinator's UPnP NOTIFY server so no socket is opened."""
+    with patch('custom_components.samsung_tv_volume.coordinator.AiohttpNotifyServer', autospec=True) as mock_server_class, \
+         patch('custom_components.samsung_tv_volume.coordinator.get_local_ip', return_value="192.168.1.10"):
+        server = mock_server_class.return_value
+        server.async_start_server = AsyncMock()
+        server.async_stop_server = AsyncMock()
+        server.event_handler = MagicMock()
+        server.event_handler.on_pre_notify = lambda http_request: http_request
+        server.event_handler.async_subscribe = AsyncMock(
+            return_value=("uuid:rc-subscription-1", timedelta(seconds=300))
+        )
+        server.event_handler.async_unsubscribe = AsyncMock()
+        yield server
+
+
 @pytest.fixture  
-def mock_upnp_factory():
+def mock_upnp_factory(mock_notify_server):
     """Mock the UPnP factory and related components."""
     with patch('custom_components.samsung_tv_volume.upnp_device.AiohttpRequester', autospec=True) as mock_requester_class, \
          patch('custom_components.samsung_tv_volume.upnp_device.UpnpFactory', autospec=True) as mock_factory_class, \
@@ -97,6 +120,8 @@ def mock_upnp_factory():
         dmr_device.async_update = AsyncMock()
         dmr_device.async_subscribe_services = AsyncMock()
         dmr_device.async_unsubscribe_services = AsyncMock()
+        # Expiries of granted subscriptions, by SID
+        dmr_device._subscriptions = {}
         dmr_device.on_event = None
         dmr_device.has_volume_level = True
         dmr_device.has_volume_mute = True
@@ -111,4 +136,63 @@ def mock_upnp_factory():
             "AiohttpRequester": mock_requester_class,
             "UpnpFactory": mock_factory_class,
             "DmrDevice": mock_dmr_class
-        }
\ No newline at end of file
+        }
+
+TRAFFIC_FIXTURE = Path(__file__).parent / "fixtures" / "samsung_un60h7100.json"
+
+
+@pytest.fixture
+def replay_requester():
+    """Replay of synthetic UPnP traffic modelled on a Samsung UN60H7100."""
+    return ReplayRequester.from_file(TRAFFIC_FIXTURE)
+
+
+class StandInRemoteTV:
+    """Local stand-in for a TV's WebSocket remote-control channel."""
+
+    def __init__(self) -> None:
+        """Initialize with a TV that accepts every client."""
+        self.accept = True
+        self.connections = 0
+        self.keys: list[str] = []
+        # Volume the keys act on, reported to listeners like UPnP events
+        self.volume = 20
+        self.listeners: list[Callable[[int], None]] = []
+        self.websockets: list[web.WebSocketResponse] = []
+        self.server: TestServer | None = None
+
+    async def handle(self, request: web.Request) -> web.WebSocketResponse:
+        """Handshake, then record every key pressed."""
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.connections += 1
+        self.websockets.append(websocket)
+        await websocket.send_json(
+            {"event": "ms.channel.connect" if self.accept else "ms.channel.unauthorized"}
+        )
+        async for message in websocket:
+            key = message.json()["params"]["DataOfCmd"]
+            self.keys.append(key)
+            if key in ("KEY_VOLUP", "KEY_VOLDOWN"):
+                self.volume += 1 if key == "KEY_VOLUP" else -1
+                for listener in self.listeners:
+                    listener(self.volume)
+        return websocket
+
+    async def async_drop_clients(self) -> None:
+        """Close all client connections, as a TV going to standby does."""
+        for websocket in self.websockets:
+            await websocket.close()
+        self.websockets.clear()
+
+
+@pytest.fixture
+async def remote_tv():
+    """Stand-in WebSocket remote served on localhost."""
+    tv = StandInRemoteTV()
+    app = web.Application()
+    app.router.add_get("/api/v2/channels/samsung.remote.control", tv.handle)
+    tv.server = TestServer(app, host="127.0.0.1")
+    await tv.server.start_server()
+    yield tv
+    await tv.server.close()
@@ -0,0 +1,118 @@
+"""Test the standalone command line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from async_upnp_client.exceptions import UpnpConnectionError
+
+from custom_components.samsung_tv_volume import cli
+from custom_components.samsung_tv_volume.upnp_device import SamsungTVUPnPDevice
+
+LOCATION = "http://192.168.1.219:7676/smp_14_"
+
+
+@pytest.fixture
+def replay_devices(replay_requester, monkeypatch):
+    """Make the CLI talk to recorded traffic instead of a TV."""
+    monkeypatch.setattr(
+        cli,
+        "SamsungTVUPnPDevice",
+        lambda location, **kwargs: SamsungTVUPnPDevice(
+            location, requester=replay_requester
+        ),
+    )
+    return replay_requester
+
+
+class TestCli:
+    """Test CLI subcommands and benchmark reporting."""
+
+    def test_import_does_not_load_home_assistant(self):
+        """Test the CLI can start without importing Home Assistant."""
+        code = (
+            "import sys, custom_components.samsung_tv_volume.cli; "
+            "sys.exit(any(m.startswith('homeassistant') for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            check=False,
+        )
+        assert result.returncode == 0
+
+    def test_parser(self):
+        """Test bench arguments are parsed."""
+        args = cli.build_parser().parse_args(
+            ["bench", "-n", "10", "-c", "2", LOCATION, LOCATION]
+        )
+        assert args.command == "bench"
+        assert args.count == 10
+        assert args.concurrency == 2
+        assert args.locations == [LOCATION, LOCATION]
+
+    def test_record_command(self, monkeypatch, tmp_path, capsys):
+        """Test record captures a session with events to the given file."""
+        calls = []
+
+        async def _record(*args, **kwargs):
+            calls.append((args, kwargs))
+            return []
+
+        monkeypatch.setattr(cli, "async_record_session", _record)
+        output = str(tmp_path / "tv.json")
+
+        assert cli.main(["record", "--polls", "3", LOCATION, output]) == 0
+
+        assert calls == [
+            ((LOCATION, output), {"polls": 3, "interval": 1.0, "events": True})
+        ]
+        assert capsys.readouterr().out.strip() == f"recorded 0 exchanges to {output}"
+
+    def test_bench_result_statistics(self):
+        """Test percentiles and error rate."""
+        result = cli.BenchResult(latencies=[0.01 * i for i in range(1, 101)], errors=25)
+
+        assert result.count == 125
+        assert result.error_rate == 0.2
+        assert result.percentile(50) == pytest.approx(0.505)
+        assert cli.BenchResult().percentile(50) is None
+
+    async def test_bench_against_replay(self, replay_devices):
+        """Test bench drives the requested number of operations."""
+        results = await cli.async_bench([LOCATION], operations=20, concurrency=4)
+
+        assert results["get"].count == 10
+        assert results["set"].count == 10
+        assert results["get"].errors == 0
+        assert results["set"].errors == 0
+
+    async def test_bench_closes_devices_after_failed_setup(
+        self, replay_devices, monkeypatch
+    ):
+        """Test a TV failing setup does not leave the others open."""
+        closed = []
+        close = SamsungTVUPnPDevice.async_close
+
+        async def _close(device):
+            closed.append(device.location)
+            await close(device)
+
+        monkeypatch.setattr(SamsungTVUPnPDevice, "async_close", _close)
+        unknown = "http://192.168.1.99:7676/smp_14_"
+
+        with pytest.raises(UpnpConnectionError):
+            await cli.async_bench([LOCATION, unknown], operations=4, concurrency=2)
+
+        assert sorted(closed) == sorted([LOCATION, unknown])
+
+    def test_get_command(self, replay_devices, capsys):
+        """Test get prints the current volume."""
+        assert cli.main(["get", LOCATION]) == 0
+        assert capsys.readouterr().out.strip() == "17"
+
+    def test_error_exit_code(self, replay_devices, capsys):
+        """Test failures are reported without a traceback."""
+        assert cli.main(["set", LOCATION, "101"]) == 1
+        assert "Volume must be between 0 and 100" in capsys.readouterr().err
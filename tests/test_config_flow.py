@@ -14,7 +14,7 @@ class TestSamsungTVVolumeConfigFlow:
 
     async def test_ssdp_discovery_success(self, enable_custom_integrations, hass, mock_ssdp_info):
         """Test successful SSDP discovery creates config entry."""
-        with patch('custom_components.samsung_tv_volume.config_flow.UpnpFactory') as mock_factory:
+        with patch('async_upnp_client.client_factory.UpnpFactory') as mock_factory:
             mock_device = AsyncMock()
             mock_device.device_info = {
                 "friendly_name": "[TV]Samsung LED60",
@@ -52,7 +52,7 @@ class TestSamsungTVVolumeConfigFlow:
         mock_entry.add_to_hass(hass)
         
         # Mock the UPnP factory to avoid network call
-        with patch('custom_components.samsung_tv_volume.config_flow.UpnpFactory') as mock_factory:
+        with patch('async_upnp_client.client_factory.UpnpFactory') as mock_factory:
             mock_factory.return_value.async_create_device.side_effect = Exception("Should not reach here")
             
             # Use proper HA flow manager initialization (like other integrations)
@@ -94,7 +94,7 @@ class TestSamsungTVVolumeConfigFlow:
 
     async def test_ssdp_discovery_connection_error(self, enable_custom_integrations, hass, mock_ssdp_info):
         """Test SSDP discovery handles connection errors gracefully."""
-        with patch('custom_components.samsung_tv_volume.config_flow.UpnpFactory') as mock_factory:
+        with patch('async_upnp_client.client_factory.UpnpFactory') as mock_factory:
             mock_factory.return_value.async_create_device.side_effect = ConnectionError("Device unreachable")
             
             # Use proper HA flow manager initialization
@@ -109,7 +109,7 @@ class TestSamsungTVVolumeConfigFlow:
 
     async def test_ssdp_discovery_invalid_device(self, enable_custom_integrations, hass, mock_ssdp_info):
         """Test SSDP discovery handles invalid UPnP devices."""
-        with patch('custom_components.samsung_tv_volume.config_flow.UpnpFactory') as mock_factory:
+        with patch('async_upnp_client.client_factory.UpnpFactory') as mock_factory:
             mock_factory.return_value.async_create_device.side_effect = Exception("Invalid device description")
             
             # Use proper HA flow manager initialization
@@ -120,4 +120,42 @@ class TestSamsungTVVolumeConfigFlow:
             )
             
             assert result["type"] == data_entry_flow.FlowResultType.ABORT
-            assert result["reason"] == "invalid_device"
\ No newline at end of file
+            assert result["reason"] == "invalid_device"
+
+    async def test_ssdp_discovery_failure_cached(self, enable_custom_integrations, hass, mock_ssdp_info):
+        """Test repeated announcements of a failing TV cost one probe per TTL."""
+        with patch('async_upnp_client.client_factory.UpnpFactory') as mock_factory, \
+             patch('custom_components.samsung_tv_volume.config_flow.time.monotonic', return_value=1000.0) as mock_time:
+            mock_factory.return_value.async_create_device.side_effect = ConnectionError("Device unreachable")
+
+            for _ in range(3):
+                result = await hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": config_entries.SOURCE_SSDP},
+                    data=mock_ssdp_info
+                )
+                assert result["reason"] == "cannot_connect"
+            assert mock_factory.return_value.async_create_device.call_count == 1
+
+            # Probed again once the failure expired
+            mock_time.return_value = 1000.0 + config_flow.PROBE_FAILURE_TTL + 1
+            await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_SSDP},
+                data=mock_ssdp_info
+            )
+            assert mock_factory.return_value.async_create_device.call_count == 2
+
+    async def test_failure_cached_per_location(self, hass):
+        """Test a TV failing at one address is probed at its new address."""
+        cache = config_flow.DeviceProbeCache(hass)
+        with patch('async_upnp_client.client_factory.UpnpFactory') as mock_factory:
+            mock_factory.return_value.async_create_device.side_effect = [
+                ConnectionError("Device unreachable"),
+                MagicMock(),
+            ]
+
+            assert await cache.async_probe("uuid:tv", "http://192.168.1.219:7676/smp_14_") == "cannot_connect"
+            assert await cache.async_probe("uuid:tv", "http://192.168.1.219:7676/smp_14_") == "cannot_connect"
+            assert await cache.async_probe("uuid:tv", "http://192.168.1.220:7676/smp_14_") is None
+            assert cache.probes == 2
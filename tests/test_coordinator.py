@@ -1,9 +1,19 @@
 """Test Samsung TV coordinator for managing device and data updates."""
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from async_upnp_client.const import HttpRequest
+from async_upnp_client.exceptions import UpnpConnectionError
+from homeassistant.components import ssdp
+from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.samsung_tv_volume.coordinator import SamsungTVCoordinator
+from custom_components.samsung_tv_volume.coordinator import (
+    SamsungTVCoordinator,
+    async_shutdown_coordinators,
+)
 
 
 class TestSamsungTVCoordinator:
@@ -143,6 +153,83 @@ class TestSamsungTVCoordinator:
         # Verify device was closed
         mock_upnp_factory["requester"].close.assert_called_once()
 
+    async def test_shutdown_bounded_by_deadline(self, hass, mock_upnp_factory):
+        """Test TVs that hang on unsubscribe are shut down together by the deadline."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinators = [
+            SamsungTVCoordinator(hass, location, f"TV {index}", f"uuid:test-{index}")
+            for index in range(3)
+        ]
+        for coordinator in coordinators:
+            await coordinator.async_refresh()
+
+        async def _hang():
+            await asyncio.Event().wait()
+
+        mock_upnp_factory["dmr_device"].async_unsubscribe_services.side_effect = _hang
+        started = time.perf_counter()
+
+        durations = await async_shutdown_coordinators(coordinators, timeout=0.2)
+
+        # One shared deadline, not one timeout per TV
+        assert time.perf_counter() - started < 0.5
+        assert sorted(durations) == ["TV 0", "TV 1", "TV 2"]
+        assert all(0.15 < duration < 0.5 for duration in durations.values())
+        # Sockets and the NOTIFY server are released regardless
+        assert mock_upnp_factory["requester"].close.call_count == 3
+        assert all(coordinator._notify_server is None for coordinator in coordinators)
+
+    async def test_shutdown_stops_polling(self, hass, mock_upnp_factory):
+        """Test a shut down coordinator no longer polls while entities listen."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        coordinator.async_add_listener(lambda: None)
+        await coordinator.async_refresh()
+        assert coordinator._unsub_refresh is not None
+
+        await coordinator.async_shutdown()
+
+        assert coordinator._unsub_refresh is None
+
+    async def test_shutdown_continues_after_failure(self, hass, mock_upnp_factory):
+        """Test one TV failing to shut down does not stop the others."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinators = [
+            SamsungTVCoordinator(hass, location, f"TV {index}", f"uuid:test-{index}")
+            for index in range(2)
+        ]
+        for coordinator in coordinators:
+            await coordinator.async_refresh()
+        coordinators[0].async_shutdown = AsyncMock(side_effect=RuntimeError("boom"))
+
+        durations = await async_shutdown_coordinators(coordinators)
+
+        assert durations["TV 1"] is not None
+        assert coordinators[1]._notify_server is None
+
+    async def test_shutdown_skips_unreachable_tv(
+        self, hass, mock_upnp_factory, mock_notify_server
+    ):
+        """Test a TV that failed its last poll is not contacted on shutdown."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+        event_requester = coordinator._event_requester
+        mock_upnp_factory["dmr_device"].volume_level = None
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+
+        await coordinator.async_shutdown()
+
+        # Leftover subscriptions are dropped without an UNSUBSCRIBE to the TV
+        assert event_requester.offline
+        with pytest.raises(UpnpConnectionError):
+            await event_requester.async_http_request(
+                HttpRequest("UNSUBSCRIBE", location, {}, None)
+            )
+        mock_notify_server.async_stop_server.assert_called_once()
+        assert coordinator.shutdown_duration is not None
+
     async def test_coordinator_event_subscription(self, hass, mock_upnp_factory):
         """Test coordinator subscribes to UPnP events during setup."""
         location = "http://192.168.1.219:7676/smp_14_"
@@ -197,4 +284,318 @@ class TestSamsungTVCoordinator:
         assert coordinator.last_update_success  # Should remain successful
         
         # Verify the update was immediate (no polling interval reset needed)
-        # This is the key benefit of using async_set_updated_data for push events
\ No newline at end of file
+        # This is the key benefit of using async_set_updated_data for push events
+
+    async def test_coordinator_starts_notify_server(self, hass, mock_upnp_factory, mock_notify_server):
+        """Test coordinator receives events through its own notify server."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+
+        await coordinator.async_refresh()
+
+        mock_notify_server.async_start_server.assert_called_once()
+        mock_upnp_factory["DmrDevice"].assert_called_once_with(
+            mock_upnp_factory["upnp_device"], mock_notify_server.event_handler
+        )
+
+        await coordinator.async_shutdown()
+        mock_notify_server.async_stop_server.assert_called_once()
+
+    async def test_coordinator_resync_after_event_gap(self, hass, mock_upnp_factory):
+        """Test a lost event triggers an immediate out-of-band volume fetch."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+
+        # Volume changed while the NOTIFY got lost
+        mock_upnp_factory["dmr_device"].volume_level = 0.3
+        coordinator.handle_event_resync("event sequence gap")
+        # Further gaps while a resync is running are coalesced
+        resync_task = coordinator._resync_task
+        coordinator.handle_event_resync("event sequence gap")
+        assert coordinator._resync_task is resync_task
+        await resync_task
+
+        assert coordinator.data["volume_level"] == 0.3
+        mock_upnp_factory["dmr_device"].async_subscribe_services.assert_called_once()
+
+    async def test_coordinator_resubscribes_after_failed_renewal(self, hass, mock_upnp_factory):
+        """Test resync subscribes again when the subscription was lost."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+
+        mock_upnp_factory["dmr_device"].is_subscribed = False
+        coordinator.handle_event_resync("subscription renewal failed")
+        await coordinator._resync_task
+
+        assert mock_upnp_factory["dmr_device"].async_subscribe_services.call_count == 2
+
+    async def test_coordinator_websocket_remote_unavailable(
+        self, hass, mock_upnp_factory, monkeypatch
+    ):
+        """Test a TV without the WebSocket remote keeps working over UPnP."""
+        remote = MagicMock(async_connect=AsyncMock(side_effect=OSError("refused")))
+        remote.async_close = AsyncMock()
+        monkeypatch.setattr(
+            "custom_components.samsung_tv_volume.coordinator.SamsungTVWebSocketRemote",
+            MagicMock(return_value=remote),
+        )
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        coordinator.websocket_remote = True
+        mock_upnp_factory["dmr_device"].volume_level = 0.5
+
+        await coordinator.async_refresh()
+        await coordinator.async_set_volume(0.55)
+
+        assert coordinator.last_update_success
+        mock_upnp_factory["dmr_device"].async_set_volume_level.assert_called_with(0.55)
+        assert list(coordinator.transport_latency) == [("upnp", "get"), ("upnp", "set")]
+
+        await coordinator.async_shutdown()
+        remote.async_close.assert_called_once()
+
+    async def test_coordinator_device_options(self, hass, mock_notify_server, monkeypatch):
+        """Test the fast path and slim model options reach the UPnP device."""
+        device = AsyncMock(supports_get=True, is_subscribed=True)
+        device.name = "upnp"
+        device.async_get_volume.return_value = 30
+        device.get_device_info = MagicMock(return_value=None)
+        device_class = MagicMock(return_value=device)
+        monkeypatch.setattr(
+            "custom_components.samsung_tv_volume.coordinator.SamsungTVUPnPDevice",
+            device_class,
+        )
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        coordinator.fast_path = True
+        coordinator.slim = True
+
+        await coordinator.async_refresh()
+
+        assert coordinator.data["volume_level"] == 0.3
+        assert device_class.call_args.kwargs["fast_path"] is True
+        assert device_class.call_args.kwargs["slim"] is True
+        await coordinator.async_shutdown()
+
+    async def test_coordinator_reboot_same_config_resubscribes(self, hass, mock_upnp_factory):
+        """Test a reboot with unchanged CONFIGID only re-establishes events."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+
+        coordinator.handle_ssdp_announcement(
+            _announcement(location, boot_id="1", config_id="7"), ssdp.SsdpChange.ALIVE
+        )
+        coordinator.handle_ssdp_announcement(
+            _announcement(location, boot_id="2", config_id="7"), ssdp.SsdpChange.ALIVE
+        )
+        await coordinator._reconnect_task
+
+        mock_upnp_factory["DmrDevice"].assert_called_once()
+        assert mock_upnp_factory["dmr_device"].async_subscribe_services.call_count == 2
+        assert "resubscribe" in coordinator.reconnect_durations
+
+    async def test_coordinator_reboot_new_config_rebuilds(self, hass, mock_upnp_factory):
+        """Test a reboot with a new CONFIGID rebuilds the device model."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+
+        coordinator.handle_ssdp_announcement(
+            _announcement(location, boot_id="1", config_id="7"), ssdp.SsdpChange.ALIVE
+        )
+        coordinator.handle_ssdp_announcement(
+            _announcement(location, boot_id="2", config_id="8"), ssdp.SsdpChange.ALIVE
+        )
+        await coordinator._reconnect_task
+
+        assert mock_upnp_factory["DmrDevice"].call_count == 2
+        assert "rebuild" in coordinator.reconnect_durations
+
+    async def test_coordinator_notify_new_config_rebuilds(
+        self, hass, mock_upnp_factory, mock_notify_server
+    ):
+        """Test a NOTIFY carrying a new CONFIGID rebuilds the device model."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+
+        for seq, config_id in enumerate(("7", "8")):
+            mock_notify_server.event_handler.on_pre_notify(
+                HttpRequest(
+                    "NOTIFY",
+                    "/notify",
+                    {
+                        "SID": "uuid:rc-subscription-1",
+                        "SEQ": str(seq),
+                        "BOOTID.UPNP.ORG": "1",
+                        "CONFIGID.UPNP.ORG": config_id,
+                    },
+                    "",
+                )
+            )
+        await coordinator._reconnect_task
+
+        assert mock_upnp_factory["DmrDevice"].call_count == 2
+        assert "rebuild" in coordinator.reconnect_durations
+        await coordinator.async_shutdown()
+
+    async def test_coordinator_location_update_relocates(
+        self, hass, mock_upnp_factory, monkeypatch
+    ):
+        """Test a new address is taken over in place, reusing the device model."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        moved = "http://192.168.1.42:7676/smp_14_"
+        mock_rebase = MagicMock(return_value=mock_upnp_factory["upnp_device"])
+        monkeypatch.setattr(
+            "custom_components.samsung_tv_volume.upnp_device.rebase_device", mock_rebase
+        )
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+        device_info = coordinator.get_device_info()
+
+        coordinator.async_update_location(moved)
+        await coordinator._reconnect_task
+
+        mock_rebase.assert_called_once_with(mock_upnp_factory["upnp_device"], moved)
+        # The description was not fetched again
+        mock_upnp_factory["factory"].async_create_device.assert_called_once()
+        assert coordinator.location == moved
+        assert coordinator.get_device_info() is device_info
+        assert coordinator.last_update_success
+        assert "relocate" in coordinator.reconnect_durations
+        await coordinator.async_shutdown()
+
+    async def test_coordinator_relocate_waits_for_connect(
+        self, hass, mock_upnp_factory, monkeypatch
+    ):
+        """Test a relocate during the first connect runs once the device is set up."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        moved = "http://192.168.1.42:7676/smp_14_"
+        monkeypatch.setattr(
+            "custom_components.samsung_tv_volume.upnp_device.rebase_device",
+            MagicMock(return_value=mock_upnp_factory["upnp_device"]),
+        )
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        release = asyncio.Event()
+        create_device = mock_upnp_factory["factory"].async_create_device
+        upnp_device = create_device.return_value
+
+        async def _slow_create_device(_location):
+            await release.wait()
+            return upnp_device
+
+        create_device.side_effect = _slow_create_device
+
+        refresh = hass.async_create_task(coordinator.async_refresh())
+        while not create_device.called:
+            await asyncio.sleep(0)
+        coordinator.async_update_location(moved)
+        await asyncio.sleep(0)
+        # Nothing half set up is visible to the relocate
+        assert coordinator._device is None
+        release.set()
+        await refresh
+        await coordinator._reconnect_task
+
+        assert coordinator.location == moved
+        assert coordinator.get_device_info() is not None
+        assert "relocate" in coordinator.reconnect_durations
+        await coordinator.async_shutdown()
+
+    async def test_coordinator_volume_guard_corrects_event(self, hass, mock_upnp_factory):
+        """Test an event above the limit is corrected through SetVolume."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        mock_upnp_factory["dmr_device"].volume_level = 0.3
+        await coordinator.async_refresh()
+        coordinator.async_set_volume_limits(max_level=0.4)
+
+        coordinator.handle_volume_event(90)
+        await coordinator._guard_task
+
+        mock_upnp_factory["dmr_device"].async_set_volume_level.assert_called_once_with(0.4)
+        assert coordinator.data["volume_level"] == 0.4
+        stats = coordinator.guard_reaction_stats
+        assert stats["count"] == 1
+        assert 0 < stats["p50"] == stats["max"]
+
+    async def test_coordinator_volume_guard_keeps_exact_step(self, hass, mock_upnp_factory):
+        """Test a correction to a limit such as 29 is not truncated to 28."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+        coordinator.async_set_volume_limits(max_level=0.29)
+
+        coordinator.handle_volume_event(57)
+        await coordinator._guard_task
+
+        mock_upnp_factory["dmr_device"].async_set_volume_level.assert_called_once_with(0.29)
+        assert coordinator.data["volume_level"] == 0.29
+
+    async def test_coordinator_volume_guard_rechecks_after_correction(
+        self, hass, mock_upnp_factory
+    ):
+        """Test a volume leaving the range during a correction is corrected too."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+        coordinator.async_set_volume_limits(max_level=0.4)
+        release = asyncio.Event()
+
+        async def _slow_set_volume(level):
+            await release.wait()
+
+        set_volume = mock_upnp_factory["dmr_device"].async_set_volume_level
+        set_volume.side_effect = _slow_set_volume
+
+        coordinator.handle_volume_event(90)
+        first = coordinator._guard_task
+        # The TV is turned up again before the first correction lands
+        coordinator.handle_volume_event(80)
+        release.set()
+        await first
+        await coordinator._guard_task
+
+        assert set_volume.call_count == 2
+        assert coordinator.guard_reaction_stats["count"] == 2
+
+    async def test_coordinator_volume_guard_corrects_poll(self, hass, mock_upnp_factory):
+        """Test a polled volume below the limit is corrected."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        coordinator.async_set_volume_limits(min_level=0.1)
+        mock_upnp_factory["dmr_device"].volume_level = 0.02
+
+        await coordinator.async_refresh()
+        await coordinator._guard_task
+
+        mock_upnp_factory["dmr_device"].async_set_volume_level.assert_called_once_with(0.1)
+
+    async def test_coordinator_volume_guard_clamps_writes(self, hass, mock_upnp_factory):
+        """Test volume writes are clamped and in-range events left alone."""
+        location = "http://192.168.1.219:7676/smp_14_"
+        coordinator = SamsungTVCoordinator(hass, location, "Test TV", "uuid:test-udn")
+        await coordinator.async_refresh()
+        coordinator.async_set_volume_limits(0.2, 0.6)
+
+        await coordinator.async_set_volume(0.9)
+        coordinator.handle_volume_event(45)
+
+        mock_upnp_factory["dmr_device"].async_set_volume_level.assert_called_once_with(0.6)
+        assert coordinator._guard_task is None
+        with pytest.raises(ValueError):
+            coordinator.async_set_volume_limits(0.7, 0.6)
+
+
+def _announcement(location: str, boot_id: str, config_id: str) -> SsdpServiceInfo:
+    """Build an SSDP announcement carrying UDA 1.1 boot and config ids."""
+    return SsdpServiceInfo(
+        ssdp_usn="uuid:test-udn::urn:schemas-upnp-org:service:RenderingControl:1",
+        ssdp_st="urn:schemas-upnp-org:service:RenderingControl:1",
+        ssdp_location=location,
+        upnp={},
+        ssdp_headers={"BOOTID.UPNP.ORG": boot_id, "CONFIGID.UPNP.ORG": config_id},
+    )
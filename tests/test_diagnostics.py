@@ -0,0 +1,51 @@
+"""Test Samsung TV Volume Control diagnostics."""
+
+from async_upnp_client.const import HttpRequest
+
+from custom_components.samsung_tv_volume.const import DOMAIN
+from custom_components.samsung_tv_volume.coordinator import SamsungTVCoordinator
+from custom_components.samsung_tv_volume.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+def _notify(seq: int) -> HttpRequest:
+    """Build a NOTIFY of the TV's RenderingControl subscription."""
+    return HttpRequest(
+        "NOTIFY", "/notify", {"SID": "uuid:rc-subscription-1", "SEQ": str(seq)}, ""
+    )
+
+
+class TestDiagnostics:
+    """Test the config entry diagnostics."""
+
+    async def test_event_losses_survive_rebuild(
+        self, hass, mock_config_entry, mock_upnp_factory, mock_notify_server
+    ):
+        """Test lost events are counted across device rebuilds and reported."""
+        mock_config_entry.add_to_hass(hass)
+        coordinator = SamsungTVCoordinator(
+            hass, mock_config_entry.data["location"], "Test TV", "uuid:test-udn"
+        )
+        hass.data[DOMAIN] = {mock_config_entry.entry_id: {"coordinator": coordinator}}
+        await coordinator.async_refresh()
+
+        event_handler = mock_notify_server.event_handler
+        for seq in (0, 3):
+            event_handler.on_pre_notify(_notify(seq))
+        await coordinator._async_reconnect("rebuild", None)
+        await hass.async_block_till_done()
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+        assert diagnostics["events"] == {"gaps": 1, "missed": 2}
+        assert diagnostics["available"] is True
+        assert diagnostics["subscription"] == {
+            "expires_in": None,
+            "renewal_latency": None,
+        }
+        assert set(diagnostics["reconnect_durations"]) == {"rebuild"}
+        assert diagnostics["guard_reaction"] is None
+        assert diagnostics["mirror"] is None
+        assert diagnostics["entry"]["location"] == "**REDACTED**"
+        await coordinator.async_shutdown()
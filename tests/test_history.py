@@ -0,0 +1,64 @@
+"""Test the per-TV volume history."""
+
+import pytest
+
+from custom_components.samsung_tv_volume.history import VolumeHistory
+
+
+class TestVolumeHistory:
+    """Test recording volume changes and computing statistics."""
+
+    def test_drops_repeated_samples(self):
+        """Test polls confirming the level are not stored."""
+        history = VolumeHistory(8)
+
+        assert history.record(20, timestamp=1.0)
+        assert not history.record(20, timestamp=2.0)
+        assert history.record(25, timestamp=3.0)
+
+        assert history.samples() == [(1.0, 20), (3.0, 25)]
+
+    def test_memory_stays_constant(self):
+        """Test the oldest samples are overwritten once the buffer is full."""
+        history = VolumeHistory(16)
+        nbytes = history.nbytes
+
+        for step in range(1000):
+            history.record(step % 100, timestamp=float(step))
+
+        assert len(history) == 16
+        assert history.nbytes == nbytes == 16 * 9
+        assert [sample[0] for sample in history.samples()] == [
+            float(step) for step in range(984, 1000)
+        ]
+
+    def test_statistics_over_window(self):
+        """Test time-weighted statistics with the level carried into the window."""
+        history = VolumeHistory()
+        history.record(10, timestamp=0.0)
+        history.record(50, timestamp=70.0)
+        history.record(30, timestamp=90.0)
+
+        # Window 40..100: 10 for 30s, 50 for 20s, 30 for 10s
+        stats = history.statistics(60, above=20, now=100.0)
+
+        assert stats["covered"] == 60
+        assert stats["samples"] == 2
+        assert stats["changes"] == 2
+        assert stats["changes_per_minute"] == 2
+        assert (stats["min"], stats["max"], stats["last"]) == (10, 50, 30)
+        assert stats["mean"] == pytest.approx((10 * 30 + 50 * 20 + 30 * 10) / 60)
+        assert stats["time_above"] == 30
+
+    def test_statistics_before_first_sample(self):
+        """Test windows reaching past the history only cover recorded time."""
+        history = VolumeHistory()
+
+        assert history.statistics(60) is None
+
+        history.record(25, timestamp=80.0)
+        stats = history.statistics(60, now=100.0)
+
+        assert stats["covered"] == 20
+        assert stats["mean"] == 25
+        assert stats["time_above"] is None
@@ -0,0 +1,131 @@
+"""Test shared polling of all Samsung TVs from one hub."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+
+from custom_components.samsung_tv_volume import async_setup, async_setup_entry
+from custom_components.samsung_tv_volume.const import DATA_HUB, DOMAIN
+from custom_components.samsung_tv_volume.hub import SamsungTVHub
+
+
+def mock_coordinator():
+    """Create a coordinator stand-in with a refresh method."""
+    coordinator = MagicMock()
+    coordinator.async_refresh = AsyncMock()
+    return coordinator
+
+
+class TestSamsungTVHub:
+    """Test the shared polling hub."""
+
+    async def test_add_takes_over_polling(self, hass: HomeAssistant):
+        """Test coordinators lose their own timer and share one hub timer."""
+        hub = SamsungTVHub(hass)
+        coordinators = [mock_coordinator() for _ in range(3)]
+
+        with patch(
+            "custom_components.samsung_tv_volume.hub.async_track_time_interval"
+        ) as mock_track:
+            for coordinator in coordinators:
+                hub.async_add(coordinator)
+
+            mock_track.assert_called_once()
+            assert all(c.update_interval is None for c in coordinators)
+
+            for coordinator in coordinators:
+                hub.async_remove(coordinator)
+            mock_track.return_value.assert_called_once()
+
+    async def test_devices_spread_across_slots(self, hass: HomeAssistant):
+        """Test each tick polls only its slot and every device once per interval."""
+        hub = SamsungTVHub(
+            hass, interval=timedelta(seconds=15), tick=timedelta(seconds=5)
+        )
+        coordinators = [mock_coordinator() for _ in range(6)]
+        with patch("custom_components.samsung_tv_volume.hub.async_track_time_interval"):
+            for coordinator in coordinators:
+                hub.async_add(coordinator)
+
+        polled_per_tick = []
+        for _ in range(3):
+            before = sum(c.async_refresh.call_count for c in coordinators)
+            await hub._async_tick()
+            polled_per_tick.append(
+                sum(c.async_refresh.call_count for c in coordinators) - before
+            )
+
+        assert polled_per_tick == [2, 2, 2]
+        assert all(c.async_refresh.call_count == 1 for c in coordinators)
+
+    async def test_global_concurrency_limit(self, hass: HomeAssistant):
+        """Test no more than max_concurrent_polls refreshes run at once."""
+        hub = SamsungTVHub(
+            hass,
+            max_concurrent_polls=2,
+            interval=timedelta(seconds=5),
+            tick=timedelta(seconds=5),
+        )
+        in_flight = 0
+        peak = 0
+
+        async def slow_refresh():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        coordinators = [mock_coordinator() for _ in range(5)]
+        with patch("custom_components.samsung_tv_volume.hub.async_track_time_interval"):
+            for coordinator in coordinators:
+                coordinator.async_refresh.side_effect = slow_refresh
+                hub.async_add(coordinator)
+
+        await hub._async_tick()
+
+        assert peak == 2
+        assert all(c.async_refresh.call_count == 1 for c in coordinators)
+
+    async def test_setup_entry_registers_with_hub(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test entries are polled by the hub when shared polling is configured."""
+        mock_config_entry.add_to_hass(hass)
+        assert await async_setup(
+            hass, {DOMAIN: {"shared_polling": True, "max_concurrent_polls": 4}}
+        )
+        hub = hass.data[DATA_HUB]
+
+        with (
+            patch(
+                "custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator"
+            ) as mock_coordinator_class,
+            patch.object(hass.config_entries, "async_forward_entry_setups"),
+            patch.object(hub, "async_add") as mock_add,
+        ):
+            mock_coordinator_class.return_value.async_config_entry_first_refresh = (
+                AsyncMock()
+            )
+            assert await async_setup_entry(hass, mock_config_entry)
+
+        mock_add.assert_called_once_with(mock_coordinator_class.return_value)
+
+    async def test_hub_stops_with_home_assistant(self, hass: HomeAssistant):
+        """Test the hub timer is stopped before the TVs are shut down."""
+        assert await async_setup(
+            hass, {DOMAIN: {"shared_polling": True, "max_concurrent_polls": 4}}
+        )
+        hub = hass.data[DATA_HUB]
+        with patch(
+            "custom_components.samsung_tv_volume.hub.async_track_time_interval"
+        ) as mock_track:
+            hub.async_add(mock_coordinator())
+
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+            await hass.async_block_till_done()
+
+        mock_track.return_value.assert_called_once()
+        assert hub.coordinators == []
@@ -0,0 +1,71 @@
+"""Test the integration stays cheap to import."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Loaded by Home Assistant core before any integration is imported
+PRELOADED = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+)
+
+# Only needed once a TV is set up or probed
+HEAVY = (
+    "custom_components.samsung_tv_volume.coordinator",
+    "custom_components.samsung_tv_volume.transport",
+    "custom_components.samsung_tv_volume.mirror",
+    "custom_components.samsung_tv_volume.upnp_device",
+    "homeassistant.components.ssdp",
+    "async_upnp_client",
+)
+
+LOADED = """
+import importlib, json, sys
+for module in {preloaded!r}:
+    importlib.import_module(module)
+for module in {modules!r}:
+    importlib.import_module(module)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _loaded_after_import(*modules: str) -> set[str]:
+    """Import modules in a fresh interpreter; return everything in sys.modules."""
+    code = LOADED.format(preloaded=PRELOADED, modules=modules)
+    return set(
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=Path(__file__).parent.parent,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+    )
+
+
+class TestImportTime:
+    """Test the integration stays cheap to import."""
+
+    def test_heavy_modules_stay_unloaded(self):
+        """Test loading the integration leaves the coordinator and UPnP client out."""
+        # What Home Assistant imports before the first entry is set up
+        loaded = _loaded_after_import(
+            "custom_components.samsung_tv_volume",
+            "custom_components.samsung_tv_volume.config_flow",
+            "custom_components.samsung_tv_volume.diagnostics",
+            "custom_components.samsung_tv_volume.hub",
+        )
+
+        for heavy in HEAVY:
+            assert not {
+                module
+                for module in loaded
+                if module == heavy or module.startswith(f"{heavy}.")
+            }, f"{heavy} loaded on import"
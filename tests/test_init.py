@@ -1,11 +1,17 @@
 """Test Samsung TV Volume Control integration setup."""
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
-from custom_components.samsung_tv_volume import async_setup_entry, async_unload_entry
+from custom_components.samsung_tv_volume import (
+    CONFIG_SCHEMA,
+    async_setup,
+    async_setup_entry,
+    async_unload_entry,
+)
 from custom_components.samsung_tv_volume.const import DOMAIN
 
 
@@ -16,7 +22,7 @@ class TestSamsungTVVolumeInit:
         """Test config entry setup creates coordinator."""
         mock_config_entry.add_to_hass(hass)
         
-        with patch('custom_components.samsung_tv_volume.SamsungTVCoordinator') as mock_coordinator_class:
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator') as mock_coordinator_class:
             mock_coordinator = AsyncMock()
             mock_coordinator.async_config_entry_first_refresh = AsyncMock()
             mock_coordinator_class.return_value = mock_coordinator
@@ -50,7 +56,7 @@ class TestSamsungTVVolumeInit:
         """Test config entry setup forwards to media_player platform."""
         mock_config_entry.add_to_hass(hass)
         
-        with patch('custom_components.samsung_tv_volume.SamsungTVCoordinator') as mock_coordinator_class:
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator') as mock_coordinator_class:
             mock_coordinator = AsyncMock()
             mock_coordinator.async_config_entry_first_refresh = AsyncMock()
             mock_coordinator_class.return_value = mock_coordinator
@@ -68,7 +74,7 @@ class TestSamsungTVVolumeInit:
         """Test config entry setup handles coordinator setup errors."""
         mock_config_entry.add_to_hass(hass)
         
-        with patch('custom_components.samsung_tv_volume.SamsungTVCoordinator') as mock_coordinator_class:
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator') as mock_coordinator_class:
             mock_coordinator = AsyncMock()
             mock_coordinator.async_config_entry_first_refresh = AsyncMock(side_effect=Exception("Setup failed"))
             mock_coordinator_class.return_value = mock_coordinator
@@ -80,6 +86,114 @@ class TestSamsungTVVolumeInit:
                 # Setup should fail gracefully
                 assert result is False
 
+    async def test_yaml_device_options(self, hass: HomeAssistant, mock_config_entry):
+        """Test YAML options are applied to the coordinators of all TVs."""
+        config = CONFIG_SCHEMA(
+            {DOMAIN: {"fast_path": True, "slim_model": True, "websocket_remote": True}}
+        )
+        assert await async_setup(hass, config)
+        mock_config_entry.add_to_hass(hass)
+
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator') as mock_coordinator_class:
+            mock_coordinator = AsyncMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            with patch.object(hass.config_entries, 'async_forward_entry_setups'):
+                assert await async_setup_entry(hass, mock_config_entry)
+
+        assert mock_coordinator.fast_path is True
+        assert mock_coordinator.slim is True
+        assert mock_coordinator.websocket_remote is True
+
+    async def test_setup_entry_restores_volume_limits(self, hass: HomeAssistant, mock_config_entry):
+        """Test volume limits kept in the entry options are applied on setup."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry,
+            options={"min_volume_level": 0.1, "max_volume_level": 0.6},
+        )
+
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator') as mock_coordinator_class:
+            mock_coordinator = AsyncMock()
+            mock_coordinator.async_set_volume_limits = MagicMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            with patch.object(hass.config_entries, 'async_forward_entry_setups'):
+                assert await async_setup_entry(hass, mock_config_entry)
+
+        mock_coordinator.async_set_volume_limits.assert_called_once_with(0.1, 0.6)
+
+    async def test_setup_entry_restores_volume_mirror(self, hass: HomeAssistant, mock_config_entry):
+        """Test the volume mirror kept in the entry options is started on setup."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry,
+            options={
+                "mirror_targets": ["media_player.soundbar"],
+                "mirror_curve": [[0.0, 0.0], [1.0, 0.5]],
+            },
+        )
+
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator') as mock_coordinator_class:
+            mock_coordinator = AsyncMock()
+            mock_coordinator.async_set_volume_limits = MagicMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            with patch.object(hass.config_entries, 'async_forward_entry_setups'):
+                assert await async_setup_entry(hass, mock_config_entry)
+
+        mock_coordinator.async_set_volume_mirror.assert_awaited_once_with(
+            ["media_player.soundbar"], [[0.0, 0.0], [1.0, 0.5]]
+        )
+
+    async def test_setup_entry_migrates_unique_id(self, hass: HomeAssistant, mock_config_entry):
+        """Test an entity keyed on the TV's first location is rekeyed on its UDN."""
+        mock_config_entry.add_to_hass(hass)
+        old_unique_id = f"{DOMAIN}_http___192.168.1.219_7676_smp_14_"
+        unique_id = f"{DOMAIN}_{mock_config_entry.data['udn']}"
+        device = dr.async_get(hass).async_get_or_create(
+            config_entry_id=mock_config_entry.entry_id,
+            identifiers={(DOMAIN, old_unique_id)},
+        )
+        entity = er.async_get(hass).async_get_or_create(
+            "media_player", DOMAIN, old_unique_id, config_entry=mock_config_entry
+        )
+
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator'):
+            with patch.object(hass.config_entries, 'async_forward_entry_setups'):
+                assert await async_setup_entry(hass, mock_config_entry)
+
+        assert er.async_get(hass).async_get(entity.entity_id).unique_id == unique_id
+        assert dr.async_get(hass).async_get(device.id).identifiers == {(DOMAIN, unique_id)}
+
+    async def test_location_update_moves_coordinator(self, hass: HomeAssistant, mock_config_entry):
+        """Test a new location in the entry is pushed into the running coordinator."""
+        mock_config_entry.add_to_hass(hass)
+        
+        with patch('custom_components.samsung_tv_volume.coordinator.SamsungTVCoordinator') as mock_coordinator_class:
+            mock_coordinator = AsyncMock()
+            mock_coordinator.async_update_location = MagicMock()
+            mock_coordinator_class.return_value = mock_coordinator
+            
+            with patch.object(hass.config_entries, 'async_forward_entry_setups'), \
+                 patch.object(hass.config_entries, 'async_schedule_reload') as mock_reload:
+                assert await async_setup_entry(hass, mock_config_entry)
+                
+                hass.config_entries.async_update_entry(
+                    mock_config_entry,
+                    data={
+                        **mock_config_entry.data,
+                        CONF_HOST: "192.168.1.42",
+                        "location": "http://192.168.1.42:7676/smp_14_",
+                    },
+                )
+                await hass.async_block_till_done()
+                
+                mock_coordinator.async_update_location.assert_called_with(
+                    "http://192.168.1.42:7676/smp_14_"
+                )
+                mock_reload.assert_not_called()
+
     async def test_unload_entry_success(self, hass: HomeAssistant, mock_config_entry):
         """Test config entry unload success."""
         # First set up the entry
@@ -1,9 +1,12 @@
 """Test Samsung TV MediaPlayer entity."""
 
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from homeassistant.components.media_player import MediaPlayerEntityFeature
 from homeassistant.const import STATE_ON, STATE_OFF
+from homeassistant.exceptions import ServiceValidationError
 
 from custom_components.samsung_tv_volume.media_player import SamsungTVMediaPlayer
 from custom_components.samsung_tv_volume.coordinator import SamsungTVCoordinator
@@ -23,7 +26,7 @@ class TestSamsungTVMediaPlayer:
         # Test initial state
         assert entity.coordinator == coordinator
         assert entity.name == "Test TV"
-        assert entity.unique_id is not None
+        assert entity.unique_id == "samsung_tv_volume_uuid:test-udn"
         assert entity.supported_features == MediaPlayerEntityFeature.VOLUME_SET
 
     async def test_media_player_volume_level(self, hass, mock_upnp_factory):
@@ -45,6 +48,8 @@ class TestSamsungTVMediaPlayer:
             hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
         )
         entity = SamsungTVMediaPlayer(coordinator)
+        entity.async_write_ha_state = MagicMock()
+        coordinator.async_add_listener(entity._handle_coordinator_update)
         
         # Test successful state
         await coordinator.async_refresh()
@@ -65,6 +70,8 @@ class TestSamsungTVMediaPlayer:
             hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
         )
         entity = SamsungTVMediaPlayer(coordinator)
+        entity.async_write_ha_state = MagicMock()
+        coordinator.async_add_listener(entity._handle_coordinator_update)
 
         # Test available state
         await coordinator.async_refresh()
@@ -161,6 +168,7 @@ class TestSamsungTVMediaPlayer:
 
         entity = SamsungTVMediaPlayer(coordinator)
         entity.async_write_ha_state = MagicMock()
+        coordinator.async_add_listener(entity._handle_coordinator_update)
 
         # Simulate real-time volume event from TV
         coordinator.handle_volume_event(85)
@@ -183,3 +191,134 @@ class TestSamsungTVMediaPlayer:
         with pytest.raises(Exception, match="Device error"):
             await entity.async_set_volume_level(0.5)
 
+
+    async def test_media_player_volume_limits(
+        self, hass, mock_upnp_factory, mock_config_entry
+    ):
+        """Test the set_volume_limits service handler and attributes."""
+        mock_config_entry.add_to_hass(hass)
+        coordinator = SamsungTVCoordinator(
+            hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
+        )
+        coordinator.config_entry = mock_config_entry
+        entity = SamsungTVMediaPlayer(coordinator)
+        entity.hass = hass
+        entity.entity_id = "media_player.test_tv"
+
+        await entity.async_set_volume_limits(max_volume_level=0.35)
+
+        assert coordinator.max_volume == 35
+        assert entity.extra_state_attributes == {
+            "min_volume_level": None,
+            "max_volume_level": 0.35,
+        }
+        assert mock_config_entry.options == {
+            "min_volume_level": None,
+            "max_volume_level": 0.35,
+        }
+        with pytest.raises(ServiceValidationError):
+            await entity.async_set_volume_limits(0.5, 0.4)
+        assert mock_config_entry.options["max_volume_level"] == 0.35
+
+    async def test_media_player_volume_mirror(
+        self, hass, mock_upnp_factory, mock_config_entry
+    ):
+        """Test the set_volume_mirror service handler keeps its settings."""
+        mock_config_entry.add_to_hass(hass)
+        coordinator = SamsungTVCoordinator(
+            hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
+        )
+        coordinator.config_entry = mock_config_entry
+        entity = SamsungTVMediaPlayer(coordinator)
+        entity.hass = hass
+        entity.entity_id = "media_player.test_tv"
+
+        await entity.async_set_volume_mirror(
+            ["media_player.soundbar"], [(0.0, 0.0), (1.0, 0.5)]
+        )
+
+        assert coordinator.volume_mirror is not None
+        assert mock_config_entry.options == {
+            "mirror_targets": ["media_player.soundbar"],
+            "mirror_curve": [[0.0, 0.0], [1.0, 0.5]],
+        }
+        with pytest.raises(ServiceValidationError):
+            await entity.async_set_volume_mirror(["media_player.soundbar"], [(0.0, 0.0)])
+        assert mock_config_entry.options["mirror_curve"] == [[0.0, 0.0], [1.0, 0.5]]
+
+        await entity.async_set_volume_mirror([])
+        assert coordinator.volume_mirror is None
+        assert mock_config_entry.options["mirror_targets"] == []
+        await coordinator.async_shutdown()
+
+    async def test_media_player_volume_statistics(self, hass, mock_upnp_factory):
+        """Test the get_volume_statistics service handler."""
+        coordinator = SamsungTVCoordinator(
+            hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
+        )
+        entity = SamsungTVMediaPlayer(coordinator)
+
+        with pytest.raises(ServiceValidationError):
+            await entity.async_get_volume_statistics(60)
+
+        coordinator.handle_volume_event(20)
+        coordinator.handle_volume_event(40)
+        response = await entity.async_get_volume_statistics(60, threshold=0.3)
+
+        assert response["samples"] == 2
+        assert response["changes"] == 1
+        assert response["min_volume_level"] == 0.2
+        assert response["max_volume_level"] == 0.4
+        assert response["volume_level"] == 0.4
+        assert response["time_above_threshold"] >= 0
+
+    @pytest.mark.parametrize("expected_lingering_timers", [True])
+    async def test_media_player_device_info_cached(self, hass, mock_upnp_factory):
+        """Test device info is built once per device set up."""
+        coordinator = SamsungTVCoordinator(
+            hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
+        )
+        await coordinator.async_refresh()
+        entity = SamsungTVMediaPlayer(coordinator)
+        entity.async_write_ha_state = MagicMock()
+        device_info = entity.device_info
+
+        coordinator.handle_volume_event(30)
+        entity._handle_coordinator_update()
+
+        assert coordinator.get_device_info() is coordinator.get_device_info()
+        assert entity.device_info is device_info
+
+        # A new device brings a new description
+        await coordinator._async_connect()
+        entity._handle_coordinator_update()
+
+        assert entity.device_info is not device_info
+        assert entity.device_info == device_info
+        await coordinator.async_shutdown()
+
+    @pytest.mark.parametrize("expected_lingering_timers", [True])
+    async def test_media_player_state_write_cost(
+        self, hass, mock_upnp_factory, record_property
+    ):
+        """Benchmark the state write following each volume event."""
+        coordinator = SamsungTVCoordinator(
+            hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
+        )
+        await coordinator.async_refresh()
+        entity = SamsungTVMediaPlayer(coordinator)
+        entity.hass = hass
+        entity.entity_id = "media_player.test_tv"
+        coordinator.async_add_listener(entity._handle_coordinator_update)
+
+        events = 2000
+        started = time.perf_counter()
+        for event in range(events):
+            coordinator.handle_volume_event(event % 100)
+        per_event = (time.perf_counter() - started) / events
+        record_property("state_write_us_per_event", per_event * 1e6)
+
+        assert hass.states.get("media_player.test_tv").attributes["volume_level"] == 0.99
+        # Generous bound; the recorded figure is what to compare
+        assert per_event < 0.005
+        await coordinator.async_shutdown()
@@ -0,0 +1,150 @@
+"""Test mirroring TV volume to other media players."""
+
+import asyncio
+import time
+
+import pytest
+from homeassistant.core import ServiceCall
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.samsung_tv_volume.coordinator import SamsungTVCoordinator
+from custom_components.samsung_tv_volume.mirror import VolumeCurve, VolumeMirror
+
+
+class TestVolumeCurve:
+    """Test mapping TV volume to target volume."""
+
+    def test_identity_by_default(self):
+        """Test targets get the TV level without a curve."""
+        assert VolumeCurve()(0.42) == 0.42
+
+    def test_interpolates_points(self):
+        """Test levels between points are interpolated linearly."""
+        curve = VolumeCurve([[0, 0], [0.5, 0.3], [1, 0.8]])
+
+        assert curve(0.25) == pytest.approx(0.15)
+        assert curve(0.75) == pytest.approx(0.55)
+        assert curve(1.0) == 0.8
+
+    def test_rejects_invalid_points(self):
+        """Test unordered or out-of-range points are rejected."""
+        with pytest.raises(ValueError):
+            VolumeCurve([[0.5, 0.2], [0.1, 0.3]])
+        with pytest.raises(ValueError):
+            VolumeCurve([[0, 0], [1, 1.5]])
+
+
+class TestVolumeMirror:
+    """Test forwarding TV volume events to targets."""
+
+    async def test_forwards_mapped_level(self, hass):
+        """Test an event reaches every target through volume_set."""
+        calls = async_mock_service(hass, "media_player", "volume_set")
+        mirror = VolumeMirror(
+            hass,
+            ["media_player.soundbar", "media_player.zone"],
+            VolumeCurve([[0, 0], [1, 0.5]]),
+        )
+
+        mirror.async_forward(0.4, time.perf_counter())
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert sorted(call.data["entity_id"] for call in calls) == [
+            "media_player.soundbar",
+            "media_player.zone",
+        ]
+        assert all(call.data["volume_level"] == pytest.approx(0.2) for call in calls)
+        stats = mirror.latency_stats["media_player.soundbar"]
+        assert stats["count"] == 1
+        assert stats["max"] > 0
+
+    async def test_coalesces_bursts(self, hass):
+        """Test a target busy with a call only gets the latest level next."""
+        levels = []
+        release = asyncio.Event()
+
+        async def _slow_volume_set(call: ServiceCall) -> None:
+            levels.append(call.data["volume_level"])
+            await release.wait()
+
+        hass.services.async_register("media_player", "volume_set", _slow_volume_set)
+        mirror = VolumeMirror(hass, ["media_player.soundbar"])
+
+        for level in (0.1, 0.2, 0.3, 0.4):
+            mirror.async_forward(level, time.perf_counter())
+            await asyncio.sleep(0)
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert levels == [0.1, 0.4]
+
+    async def test_suppresses_echo(self, hass):
+        """Test a target reporting our level back through the TV is not resent."""
+        calls = async_mock_service(hass, "media_player", "volume_set")
+        mirror = VolumeMirror(hass, ["media_player.soundbar"])
+
+        mirror.async_forward(0.33, time.perf_counter())
+        await hass.async_block_till_done(wait_background_tasks=True)
+        # The soundbar syncs the TV to the level it was sent
+        mirror.async_forward(0.33, time.perf_counter())
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert len(calls) == 1
+        assert mirror.echoes_suppressed == 1
+
+    async def test_forwards_small_steps(self, hass):
+        """Test single-step changes right after a forward still reach targets."""
+        calls = async_mock_service(hass, "media_player", "volume_set")
+        mirror = VolumeMirror(hass, ["media_player.soundbar"])
+
+        for level in (0.33, 0.34, 0.35):
+            mirror.async_forward(level, time.perf_counter())
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert [call.data["volume_level"] for call in calls] == [0.33, 0.34, 0.35]
+        assert mirror.echoes_suppressed == 0
+
+    async def test_forwards_return_to_earlier_level(self, hass):
+        """Test going back to a sent level while another is in flight is forwarded."""
+        levels = []
+        release = asyncio.Event()
+
+        async def _slow_volume_set(call: ServiceCall) -> None:
+            levels.append(call.data["volume_level"])
+            if len(levels) == 2:
+                await release.wait()
+
+        hass.services.async_register("media_player", "volume_set", _slow_volume_set)
+        mirror = VolumeMirror(hass, ["media_player.soundbar"])
+
+        mirror.async_forward(0.5, time.perf_counter())
+        await hass.async_block_till_done(wait_background_tasks=True)
+        mirror.async_forward(0.6, time.perf_counter())
+        await asyncio.sleep(0)
+        mirror.async_forward(0.5, time.perf_counter())
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert levels == [0.5, 0.6, 0.5]
+        assert mirror.echoes_suppressed == 0
+
+    async def test_coordinator_mirrors_events(self, hass, mock_upnp_factory):
+        """Test the coordinator forwards volume events to mirror targets."""
+        calls = async_mock_service(hass, "media_player", "volume_set")
+        coordinator = SamsungTVCoordinator(
+            hass, "http://192.168.1.219:7676/smp_14_", "Test TV", "uuid:test-udn"
+        )
+        await coordinator.async_refresh()
+        await coordinator.async_set_volume_mirror(["media_player.soundbar"])
+
+        coordinator.handle_volume_event(25)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert [call.data["volume_level"] for call in calls] == [0.25]
+
+        await coordinator.async_set_volume_mirror([])
+        coordinator.handle_volume_event(60)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert len(calls) == 1
+        await coordinator.async_shutdown()
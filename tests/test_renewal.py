@@ -0,0 +1,187 @@
+"""Test the shared subscription renewal scheduler."""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from async_upnp_client.exceptions import UpnpConnectionError
+from async_upnp_client.profiles.profile import RESUBSCRIBE_TOLERANCE
+
+from custom_components.samsung_tv_volume.renewal import SubscriptionRenewalScheduler
+from custom_components.samsung_tv_volume.upnp_device import SamsungTVUPnPDevice
+
+LIFETIME = timedelta(seconds=0.5)
+
+
+def _scheduler() -> SubscriptionRenewalScheduler:
+    """Create a scheduler working in tens of milliseconds."""
+    return SubscriptionRenewalScheduler(
+        min_margin=0.05, spread=0.1, slot=0.01, retry_base=0.02, retry_max=0.1
+    )
+
+
+def _grant(dmr_device, seconds: float):
+    """Build a subscribe mock granting a subscription of a number of seconds."""
+
+    async def subscribe() -> timedelta:
+        dmr_device._subscriptions = {
+            "uuid:rc-subscription-1": time.monotonic() + seconds
+        }
+        # Like the DmrDevice: the time left minus its tolerance, clamped at zero
+        return max(timedelta(seconds=seconds) - RESUBSCRIBE_TOLERANCE, timedelta(0))
+
+    return subscribe
+
+
+class RenewalRecorder:
+    """Renew callback recording when it was called."""
+
+    def __init__(self, failures: int = 0) -> None:
+        """Initialize, failing a number of times first."""
+        self.failures = failures
+        self.calls: list[float] = []
+
+    async def __call__(self) -> timedelta:
+        """Renew, or fail while failures are left."""
+        self.calls.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(0.005)
+        if self.failures:
+            self.failures -= 1
+            raise UpnpConnectionError("TV unreachable")
+        return LIFETIME
+
+
+class TestSubscriptionRenewalScheduler:
+    """Test renewing subscriptions from one timer."""
+
+    async def test_renews_before_expiry(self):
+        """Test subscriptions are renewed ahead of expiry, repeatedly."""
+        scheduler = _scheduler()
+        renew = RenewalRecorder()
+        started = asyncio.get_running_loop().time()
+        scheduler.add("tv", renew, LIFETIME)
+
+        await asyncio.sleep(1.0)
+
+        # Renewed once the margin (20% of the lifetime) was reached
+        assert len(renew.calls) >= 2
+        assert renew.calls[0] - started < LIFETIME.total_seconds() * 0.8 + 0.02
+        entry = scheduler.get("tv")
+        assert entry.renewals == len(renew.calls)
+        assert entry.latency >= 0.005
+        assert 0 < scheduler.expires_in("tv") <= LIFETIME.total_seconds()
+        await scheduler.async_stop()
+
+    async def test_spreads_renewals(self):
+        """Test subscriptions expiring together are renewed in different slots."""
+        scheduler = _scheduler()
+        for key in range(5):
+            scheduler.add(key, RenewalRecorder(), LIFETIME)
+
+        dues = sorted(scheduler.get(key).due for key in range(5))
+
+        assert len({round(due, 3) for due in dues}) == 5
+        assert dues[-1] - dues[0] <= 0.1
+        await scheduler.async_stop()
+
+    async def test_retries_with_backoff(self):
+        """Test failed renewals are retried with growing delays and reported."""
+        scheduler = _scheduler()
+        renew = RenewalRecorder(failures=3)
+        on_failure = MagicMock()
+        scheduler.add("tv", renew, timedelta(seconds=0.1), on_failure)
+
+        await asyncio.sleep(0.5)
+
+        assert [call.args[1] for call in on_failure.call_args_list] == [1, 2, 3]
+        gaps = [b - a for a, b in zip(renew.calls, renew.calls[1:4])]
+        assert gaps[0] < gaps[1] < gaps[2]
+        entry = scheduler.get("tv")
+        assert entry.failures == 0
+        assert entry.renewals == 1
+        await scheduler.async_stop()
+
+    async def test_remove_stops_renewals(self):
+        """Test removed subscriptions are no longer renewed."""
+        scheduler = _scheduler()
+        renew = RenewalRecorder()
+        scheduler.add("tv", renew, LIFETIME)
+        scheduler.remove("tv")
+
+        await asyncio.sleep(0.6)
+
+        assert renew.calls == []
+        assert len(scheduler) == 0
+        assert scheduler.expires_in("tv") is None
+
+
+class TestDeviceRenewal:
+    """Test devices handing subscription renewal to the scheduler."""
+
+    async def test_device_uses_scheduler(self, mock_upnp_factory):
+        """Test subscribing registers with the scheduler instead of auto-renewal."""
+        dmr_device = mock_upnp_factory["dmr_device"]
+        dmr_device.async_subscribe_services.side_effect = _grant(dmr_device, 300)
+        scheduler = _scheduler()
+        device = SamsungTVUPnPDevice(
+            "http://192.168.1.219:7676/smp_14_", renewal_scheduler=scheduler
+        )
+        await device.async_setup()
+
+        assert await device.async_subscribe_events(MagicMock())
+
+        dmr_device.async_subscribe_services.assert_called_once_with()
+        assert device.subscription_expires_in == pytest.approx(300, abs=1)
+
+        await device.async_unsubscribe_events()
+        assert len(scheduler) == 0
+
+    async def test_device_keeps_short_granted_timeout(self, mock_upnp_factory):
+        """Test a TV granting less than the DmrDevice tolerance is renewed in time."""
+        dmr_device = mock_upnp_factory["dmr_device"]
+        dmr_device.async_subscribe_services.side_effect = _grant(dmr_device, 30)
+        scheduler = _scheduler()
+        device = SamsungTVUPnPDevice(
+            "http://192.168.1.219:7676/smp_14_", renewal_scheduler=scheduler
+        )
+        await device.async_setup()
+
+        assert await device.async_subscribe_events(MagicMock())
+
+        # Not the clamped zero plus a minute of tolerance
+        assert device.subscription_expires_in == pytest.approx(30, abs=1)
+        await device.async_unsubscribe_events()
+
+    async def test_device_reports_failure_and_recovery(self, mock_upnp_factory):
+        """Test the coordinator hears about a failed and a restored subscription."""
+        dmr_device = mock_upnp_factory["dmr_device"]
+        granted = iter(
+            [0.1, UpnpConnectionError("gone"), UpnpConnectionError("gone"), 300]
+        )
+
+        async def subscribe() -> timedelta:
+            outcome = next(granted)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return await _grant(dmr_device, outcome)()
+
+        dmr_device.async_subscribe_services = AsyncMock(side_effect=subscribe)
+        scheduler = _scheduler()
+        device = SamsungTVUPnPDevice(
+            "http://192.168.1.219:7676/smp_14_", renewal_scheduler=scheduler
+        )
+        await device.async_setup()
+        resync = MagicMock()
+        await device.async_subscribe_events(MagicMock(), resync)
+
+        await asyncio.sleep(0.3)
+
+        assert [call.args[0] for call in resync.call_args_list] == [
+            "subscription renewal failed",
+            "subscription restored",
+        ]
+        assert device.renewal_latency is not None
+        await scheduler.async_stop()
@@ -0,0 +1,233 @@
+"""Test recording and replay of Samsung TV UPnP traffic."""
+
+import dataclasses
+import time
+from datetime import timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from async_upnp_client.const import HttpRequest, HttpResponse
+from async_upnp_client.exceptions import UpnpConnectionError
+
+from custom_components.samsung_tv_volume.coordinator import SamsungTVCoordinator
+from custom_components.samsung_tv_volume.traffic import (
+    RecordingRequester,
+    ReplayRequester,
+    load_traffic,
+)
+from custom_components.samsung_tv_volume.upnp_device import SamsungTVUPnPDevice
+
+from .conftest import TRAFFIC_FIXTURE
+
+LOCATION = "http://192.168.1.219:7676/smp_14_"
+MOVED_LOCATION = "http://192.168.1.42:7676/smp_14_"
+
+
+class TestTrafficReplay:
+    """Test running the integration against replayed TV traffic."""
+
+    async def test_device_against_replay(self, replay_requester):
+        """Test device setup, get and set against recorded traffic."""
+        device = SamsungTVUPnPDevice(LOCATION, requester=replay_requester)
+        await device.async_setup()
+
+        assert device.get_device_info()["model_name"] == "UN60H7100"
+        assert await device.async_get_volume() == 17
+
+        await device.async_set_volume(25)
+        assert await device.async_get_volume() == 27
+
+        await device.async_close()
+
+    async def test_requests_per_poll(self, replay_requester):
+        """Test the number of round trips per volume poll does not regress."""
+        device = SamsungTVUPnPDevice(LOCATION, requester=replay_requester)
+        await device.async_setup()
+        setup_requests = len(replay_requester.requests)
+
+        await device.async_get_volume()
+
+        # Description plus one SCPD per service
+        assert setup_requests == 4
+        assert len(replay_requester.requests) - setup_requests <= 4
+
+    async def test_coordinator_against_replay(
+        self, hass, replay_requester, mock_notify_server, monkeypatch
+    ):
+        """Test coordinator refresh against recorded traffic."""
+        monkeypatch.setattr(
+            "custom_components.samsung_tv_volume.coordinator.SamsungTVUPnPDevice",
+            lambda location, **kwargs: SamsungTVUPnPDevice(
+                location, requester=replay_requester, **kwargs
+            ),
+        )
+        coordinator = SamsungTVCoordinator(hass, LOCATION, "Test TV", "uuid:test-udn")
+
+        await coordinator.async_refresh()
+
+        assert coordinator.last_update_success
+        assert coordinator.data["volume_level"] == 0.17
+        await coordinator.async_shutdown()
+
+    async def test_reconnect_paths(self):
+        """Test resubscribing after a reboot skips the description fetches."""
+        replay = ReplayRequester.from_file(TRAFFIC_FIXTURE, speed=1.0)
+        event_handler = MagicMock(on_pre_notify=lambda request: request)
+        event_handler.async_subscribe = AsyncMock(
+            return_value=("uuid:rc-subscription-1", timedelta(seconds=300))
+        )
+        event_handler.async_unsubscribe = AsyncMock()
+        device = SamsungTVUPnPDevice(
+            LOCATION, requester=replay, event_handler=event_handler
+        )
+        await device.async_setup()
+        await device.async_subscribe_events(MagicMock())
+        setup_requests = len(replay.requests)
+
+        # Same CONFIGID: keep the parsed model, subscribe again
+        started = time.monotonic()
+        await device.async_restore_subscription()
+        resubscribe = time.monotonic() - started
+
+        assert len(replay.requests) == setup_requests
+        assert device.is_subscribed
+
+        # New CONFIGID: description and SCPDs are fetched again
+        started = time.monotonic()
+        rebuilt = SamsungTVUPnPDevice(
+            LOCATION, requester=replay, event_handler=event_handler
+        )
+        await rebuilt.async_setup()
+        await rebuilt.async_subscribe_events(MagicMock())
+        rebuild = time.monotonic() - started
+
+        assert len(replay.requests) == setup_requests + 4
+        assert resubscribe < rebuild
+
+    async def test_relocate_paths(self, record_property):
+        """Test moving to a new address reuses the parsed model and is controllable."""
+        records = load_traffic(TRAFFIC_FIXTURE)
+        # The same TV answering at its new address
+        moved = [
+            dataclasses.replace(
+                record, url=record.url.replace("192.168.1.219", "192.168.1.42")
+            )
+            for record in records
+        ]
+        replay = ReplayRequester(records + moved, speed=1.0)
+        event_handler = MagicMock(on_pre_notify=lambda request: request)
+        event_handler.async_subscribe = AsyncMock(
+            return_value=("uuid:rc-subscription-1", timedelta(seconds=300))
+        )
+        event_handler.async_unsubscribe = AsyncMock()
+        device = SamsungTVUPnPDevice(
+            LOCATION, requester=replay, event_handler=event_handler
+        )
+        await device.async_setup()
+        await device.async_subscribe_events(MagicMock())
+        setup_requests = len(replay.requests)
+
+        # Only the host changed: rebase the model, subscribe at the new address
+        started = time.monotonic()
+        assert await device.async_relocate(MOVED_LOCATION)
+        assert await device.async_get_volume() == 17
+        relocate = time.monotonic() - started
+
+        # Only control requests went out, all to the new host
+        moved_requests = replay.requests[setup_requests:]
+        assert moved_requests
+        assert all(request.method == "POST" for request in moved_requests)
+        assert all("192.168.1.42" in request.url for request in moved_requests)
+        assert device.location == MOVED_LOCATION
+        assert device.is_subscribed
+        # The old subscription is dropped in the background
+        await device.async_close()
+        event_handler.async_unsubscribe.assert_called()
+
+        # A full setup at the new address fetches description and SCPDs
+        started = time.monotonic()
+        rebuilt = SamsungTVUPnPDevice(
+            MOVED_LOCATION, requester=replay, event_handler=event_handler
+        )
+        await rebuilt.async_setup()
+        await rebuilt.async_subscribe_events(MagicMock())
+        await rebuilt.async_get_volume()
+        rebuild = time.monotonic() - started
+
+        assert relocate < rebuild
+        record_property("relocate_ms", relocate * 1000)
+        record_property("full_setup_ms", rebuild * 1000)
+
+    async def test_relocate_refetches_changed_description(self):
+        """Test a move with a new CONFIGID fetches the description again."""
+        records = load_traffic(TRAFFIC_FIXTURE)
+        moved = [
+            dataclasses.replace(
+                record, url=record.url.replace("192.168.1.219", "192.168.1.42")
+            )
+            for record in records
+        ]
+        replay = ReplayRequester(records + moved)
+        device = SamsungTVUPnPDevice(LOCATION, requester=replay, config_id="7")
+        await device.async_setup()
+        setup_requests = len(replay.requests)
+
+        assert not await device.async_relocate(MOVED_LOCATION, config_id="8")
+
+        assert [request.method for request in replay.requests[setup_requests:]] == [
+            request.method for request in replay.requests[:setup_requests]
+        ]
+        assert device.config_id == "8"
+        assert await device.async_get_volume() == 17
+        await device.async_close()
+
+    async def test_unknown_request_fails_like_offline_tv(self, replay_requester):
+        """Test requests missing from the recording look like a connection error."""
+        with pytest.raises(UpnpConnectionError):
+            await replay_requester.async_http_request(
+                HttpRequest("GET", "http://192.168.1.219:7676/unknown", {}, None)
+            )
+
+    async def test_replay_timing(self):
+        """Test replay honours recorded durations scaled by speed."""
+        records = load_traffic(TRAFFIC_FIXTURE)
+        description = records[0]
+
+        replay = ReplayRequester(records, speed=10.0)
+        started = time.monotonic()
+        await replay.async_http_request(HttpRequest("GET", description.url, {}, None))
+
+        assert time.monotonic() - started >= description.duration / 10.0
+
+    async def test_replay_notifies(self, replay_requester):
+        """Test recorded NOTIFY bodies are fed to the handler in order."""
+        handle_notify = AsyncMock()
+
+        await replay_requester.async_replay_notifies(handle_notify)
+
+        seqs = [call.args[0].headers["SEQ"] for call in handle_notify.call_args_list]
+        assert seqs == ["0", "1", "2"]
+        assert "LastChange" in handle_notify.call_args_list[0].args[0].body
+
+
+class TestTrafficRecording:
+    """Test capturing traffic from a live session."""
+
+    async def test_record_and_reload(self, tmp_path):
+        """Test recorded exchanges round-trip through a fixture file."""
+        inner = MagicMock()
+        inner.async_http_request = AsyncMock(
+            return_value=HttpResponse(200, {"SERVER": "Samsung"}, "<root/>")
+        )
+        recorder = RecordingRequester(inner)
+
+        await recorder.async_http_request(HttpRequest("GET", LOCATION, {}, None))
+        recorder.on_pre_notify(
+            HttpRequest("NOTIFY", "http://192.168.1.10/notify", {"SEQ": "0"}, "<e/>")
+        )
+        recorder.save(tmp_path / "traffic.json")
+
+        records = load_traffic(tmp_path / "traffic.json")
+        assert [record.kind for record in records] == ["http", "notify"]
+        assert records[0].response_body == "<root/>"
+        assert records[1].offset >= records[0].offset
@@ -0,0 +1,278 @@
+"""Test volume transports and backend selection."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from custom_components.samsung_tv_volume import transport
+from custom_components.samsung_tv_volume.transport import (
+    SamsungTVWebSocketRemote,
+    UnsupportedVolumeOperationError,
+    VolumeTransportSelector,
+)
+
+
+class FakeUPnPTransport:
+    """UPnP stand-in with a fixed round-trip time."""
+
+    name = "upnp"
+    supports_get = True
+
+    def __init__(self, volume: int = 20, delay: float = 0.02, tv=None) -> None:
+        """Initialize with a starting volume and a stand-in TV to keep in step."""
+        self.volume = volume
+        self.delay = delay
+        self.tv = tv
+        self.sets = 0
+        self.async_subscribe_events = AsyncMock(return_value=True)
+
+    async def async_get_volume(self) -> int:
+        """Get volume after one round trip."""
+        await asyncio.sleep(self.delay)
+        return self.volume
+
+    async def async_set_volume(self, volume: int) -> None:
+        """Set volume after one round trip."""
+        await asyncio.sleep(self.delay)
+        self.sets += 1
+        self.volume = volume
+        if self.tv:
+            self.tv.volume = volume
+
+
+async def _wait_for_keys(remote_tv, count: int) -> None:
+    """Wait until the stand-in TV received a number of key presses."""
+    for _ in range(100):
+        if len(remote_tv.keys) >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+def _remote(remote_tv) -> SamsungTVWebSocketRemote:
+    """Create a remote pointing at the stand-in TV."""
+    return SamsungTVWebSocketRemote(
+        remote_tv.server.host, port=remote_tv.server.port, timeout=1
+    )
+
+
+def _confirmed_remote(remote_tv) -> SamsungTVWebSocketRemote:
+    """Create a remote that hears the stand-in TV's volume events."""
+    remote = _remote(remote_tv)
+    remote.events_available = True
+    remote.known_volume = remote_tv.volume
+    remote_tv.listeners.append(remote.note_volume)
+    return remote
+
+
+class TestWebSocketRemote:
+    """Test the WebSocket remote-control backend."""
+
+    async def test_set_volume_steps_keys(self, remote_tv):
+        """Test setting volume presses keys and waits for the TV to get there."""
+        remote = _confirmed_remote(remote_tv)
+
+        await remote.async_set_volume(23)
+        assert remote_tv.volume == 23
+        await remote.async_set_volume(21)
+
+        assert remote_tv.keys == ["KEY_VOLUP"] * 3 + ["KEY_VOLDOWN"] * 2
+        assert remote.known_volume == 21
+        assert remote_tv.volume == 21
+        # One persistent connection for all key presses
+        assert remote_tv.connections == 1
+        await remote.async_close()
+
+    async def test_unsupported_operations(self, remote_tv):
+        """Test reads, unknown levels and large jumps are left to UPnP."""
+        remote = _remote(remote_tv)
+
+        with pytest.raises(UnsupportedVolumeOperationError):
+            await remote.async_get_volume()
+        with pytest.raises(UnsupportedVolumeOperationError):
+            await remote.async_set_volume(10)
+
+        # Without volume events nothing could confirm the key presses
+        remote.known_volume = 10
+        with pytest.raises(UnsupportedVolumeOperationError):
+            await remote.async_set_volume(12)
+
+        remote.events_available = True
+        with pytest.raises(UnsupportedVolumeOperationError):
+            await remote.async_set_volume(40)
+
+        assert remote_tv.connections == 0
+        await remote.async_close()
+
+    async def test_no_steps_during_unconfirmed_presses(self, remote_tv, monkeypatch):
+        """Test a set is refused while earlier presses await their event."""
+        monkeypatch.setattr(transport, "KEY_CONFIRM_TIMEOUT", 0.2)
+        remote = _remote(remote_tv)
+        remote.events_available = True
+        remote.known_volume = 20
+        # The TV reports nothing, so the presses are never confirmed
+        ramp = asyncio.create_task(remote.async_set_volume(23))
+        await _wait_for_keys(remote_tv, 3)
+
+        # An event of one press in flight must not become a new start level
+        remote.note_volume(21)
+        with pytest.raises(UnsupportedVolumeOperationError):
+            await remote.async_set_volume(22)
+        with pytest.raises(TimeoutError):
+            await ramp
+
+        assert remote.known_volume is None
+        assert remote_tv.keys == ["KEY_VOLUP"] * 3
+        await remote.async_close()
+
+    async def test_refused_by_tv(self, remote_tv):
+        """Test a client not allowed on the TV fails to connect."""
+        remote_tv.accept = False
+        remote = _remote(remote_tv)
+
+        with pytest.raises(ConnectionError):
+            await remote.async_connect()
+
+        assert not remote.is_connected
+        await remote.async_close()
+
+    async def test_reconnects_after_drop(self, remote_tv):
+        """Test a dropped connection is reopened on the next key press."""
+        remote = _remote(remote_tv)
+        await remote.async_connect()
+
+        await remote_tv.async_drop_clients()
+        for _ in range(100):
+            if not remote.is_connected:
+                break
+            await asyncio.sleep(0.01)
+        assert not remote.is_connected
+
+        await remote.async_send_key("KEY_MUTE")
+        await _wait_for_keys(remote_tv, 1)
+
+        assert remote_tv.keys == ["KEY_MUTE"]
+        assert remote_tv.connections == 2
+        await remote.async_close()
+
+    async def test_close_without_handshake(self, remote_tv):
+        """Test closing for a TV that is gone releases the connection at once."""
+        remote = _remote(remote_tv)
+        await remote.async_connect()
+
+        await remote.async_close(graceful=False)
+
+        assert not remote.is_connected
+        assert remote._session is None
+        assert remote._reader is None
+
+
+class TestVolumeTransportSelector:
+    """Test routing volume operations to the fastest backend."""
+
+    async def test_prefers_faster_backend(self, remote_tv):
+        """Test sets move to the WebSocket remote once it measures faster."""
+        upnp = FakeUPnPTransport(tv=remote_tv)
+        remote = _remote(remote_tv)
+        selector = VolumeTransportSelector([upnp, remote])
+        assert await selector.async_subscribe_events(lambda volume: None)
+        remote_tv.listeners.append(selector.note_volume)
+
+        assert await selector.async_get_volume() == 20
+        assert remote.known_volume == 20
+
+        # Each backend gets measured once, then the faster one wins
+        for volume in (21, 22, 23, 24):
+            await selector.async_set_volume(volume)
+
+        assert upnp.sets == 1
+        assert remote_tv.keys == ["KEY_VOLUP"] * 3
+        assert remote_tv.volume == 24
+        # Timed until the TV confirmed the level, like a SOAP round trip
+        assert (
+            selector.latency[("websocket", "set")] < selector.latency[("upnp", "set")]
+        )
+        # Reads always go over UPnP
+        assert ("websocket", "get") not in selector.latency
+        await remote.async_close()
+
+    async def test_falls_back_to_upnp(self, remote_tv):
+        """Test large jumps and remote failures are served by UPnP."""
+        upnp = FakeUPnPTransport()
+        remote = _remote(remote_tv)
+        remote.events_available = True
+        selector = VolumeTransportSelector([remote, upnp])
+        selector.note_volume(20)
+
+        await selector.async_set_volume(60)
+        assert upnp.sets == 1
+
+        remote.async_send_key = AsyncMock(side_effect=ConnectionResetError)
+        await selector.async_set_volume(61)
+
+        assert upnp.volume == 61
+        assert upnp.sets == 2
+        await remote.async_close()
+
+    async def test_unconfirmed_presses_fall_back(self, remote_tv, monkeypatch):
+        """Test presses the TV never confirms are corrected over UPnP."""
+        monkeypatch.setattr(transport, "KEY_CONFIRM_TIMEOUT", 0.05)
+        upnp = FakeUPnPTransport(tv=remote_tv)
+        remote = _remote(remote_tv)
+        remote.events_available = True
+        selector = VolumeTransportSelector([remote, upnp])
+        selector.note_volume(20)
+
+        await selector.async_set_volume(22)
+
+        assert remote_tv.keys == ["KEY_VOLUP"] * 2
+        assert upnp.volume == 22
+        assert upnp.sets == 1
+        await remote.async_close()
+
+    async def test_concurrent_sets_do_not_overshoot(self, remote_tv):
+        """Test a set issued during a key ramp starts from the confirmed level."""
+        remote = _confirmed_remote(remote_tv)
+        selector = VolumeTransportSelector([remote])
+
+        try:
+            await asyncio.gather(
+                selector.async_set_volume(24), selector.async_set_volume(22)
+            )
+        finally:
+            await remote.async_close()
+
+        assert remote_tv.keys == ["KEY_VOLUP"] * 4 + ["KEY_VOLDOWN"] * 2
+        assert remote_tv.volume == 22
+
+    async def test_no_op_set_not_timed(self, remote_tv):
+        """Test a set to the level the remote already has leaves its latency alone."""
+        remote = _confirmed_remote(remote_tv)
+        selector = VolumeTransportSelector([remote])
+
+        try:
+            await selector.async_set_volume(20)
+            assert ("websocket", "set") not in selector.latency
+            await selector.async_set_volume(21)
+            latency = selector.latency[("websocket", "set")]
+            await selector.async_set_volume(21)
+        finally:
+            await remote.async_close()
+
+        assert remote_tv.keys == ["KEY_VOLUP"]
+        assert selector.latency[("websocket", "set")] == latency
+
+    async def test_events_update_known_volume(self):
+        """Test volume events keep the key-stepping backend in sync."""
+        upnp = FakeUPnPTransport()
+        remote = SamsungTVWebSocketRemote("127.0.0.1")
+        selector = VolumeTransportSelector([upnp, remote])
+        received = []
+
+        assert await selector.async_subscribe_events(received.append)
+        callback = upnp.async_subscribe_events.call_args[0][0]
+        callback(35)
+
+        assert received == [35]
+        assert remote.known_volume == 35
+        assert remote.events_available
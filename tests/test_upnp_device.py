@@ -1,6 +1,20 @@
 """Test UPnP device setup and volume control."""
+import asyncio
+import gc
+import time
+import tracemalloc
+
 import pytest
-from custom_components.samsung_tv_volume.upnp_device import SamsungTVUPnPDevice
+from unittest.mock import MagicMock
+from async_upnp_client.const import HttpRequest, HttpResponse
+
+from custom_components.samsung_tv_volume.upnp_device import (
+    EVENT_SEQ_MAX,
+    FAST_PATH_MAX_FAILURES,
+    RENDERING_CONTROL,
+    SamsungTVUPnPDevice,
+    VolumeSoapCodec,
+)
 
 
 class TestUpnpDevice:
@@ -90,4 +104,278 @@ class TestUpnpDevice:
         await device.async_close()
         
         mock_upnp_factory["requester"].close.assert_called_once()
-        assert not device.is_connected
\ No newline at end of file
+        assert not device.is_connected
+
+class TestVolumeSoapFastPath:
+    """Test the precompiled Get/SetVolume envelopes against recorded traffic."""
+
+    LOCATION = "http://192.168.1.219:7676/smp_14_"
+
+    async def test_fast_path_round_trips(self, replay_requester):
+        """Test fast path gets and sets volume with one request each."""
+        device = SamsungTVUPnPDevice(
+            self.LOCATION, requester=replay_requester, fast_path=True
+        )
+        await device.async_setup()
+        setup_requests = len(replay_requester.requests)
+
+        assert await device.async_get_volume() == 17
+        await device.async_set_volume(25)
+
+        requests = replay_requester.requests[setup_requests:]
+        assert [r.headers["SOAPAction"] for r in requests] == [
+            '"urn:schemas-upnp-org:service:RenderingControl:1#GetVolume"',
+            '"urn:schemas-upnp-org:service:RenderingControl:1#SetVolume"',
+        ]
+        assert "<DesiredVolume>25</DesiredVolume>" in requests[1].body
+
+    def test_codec_rejects_unexpected_responses(self):
+        """Test the response scanner refuses anything but a clean volume."""
+        codec = VolumeSoapCodec("http://192.168.1.219:7676/smp_16_")
+
+        assert codec.parse_get_volume(
+            HttpResponse(200, {}, "<CurrentVolume> 42 </CurrentVolume>")
+        ) == 42
+        assert codec.parse_get_volume(HttpResponse(500, {}, "<UPnPError/>")) is None
+        assert codec.parse_get_volume(HttpResponse(200, {}, "<Volume>4</Volume>")) is None
+        assert codec.parse_get_volume(
+            HttpResponse(200, {}, "<CurrentVolume>-1</CurrentVolume>")
+        ) is None
+        assert not codec.is_set_volume_ok(HttpResponse(200, {}, None))
+
+    async def test_fast_path_falls_back(self, replay_requester):
+        """Test a malformed response falls back to the generic path for good."""
+        device = SamsungTVUPnPDevice(
+            self.LOCATION, requester=replay_requester, fast_path=True
+        )
+        await device.async_setup()
+        original = replay_requester.async_http_request
+
+        async def garbled_once(http_request):
+            replay_requester.async_http_request = original
+            await original(http_request)
+            return HttpResponse(200, {}, "<garbled/>")
+
+        replay_requester.async_http_request = garbled_once
+        setup_requests = len(replay_requester.requests)
+
+        # Falls back within the same call, then stays on the generic path
+        assert await device.async_get_volume() == 27
+        assert await device.async_get_volume() == 27
+        # Only the first generic poll also fetches ConnectionManager protocol info
+        assert len(replay_requester.requests) - setup_requests == 1 + 4 + 3
+
+    async def test_fast_path_survives_transient_errors(self, replay_requester):
+        """Test error statuses fall back per call until they keep happening."""
+        device = SamsungTVUPnPDevice(
+            self.LOCATION, requester=replay_requester, fast_path=True
+        )
+        await device.async_setup()
+        fast_request = device._volume_codec.get_volume_request()
+        original = replay_requester.async_http_request
+        busy = True
+
+        async def busy_tv(http_request):
+            response = await original(http_request)
+            if busy and http_request is fast_request:
+                return HttpResponse(500, {}, "<UPnPError/>")
+            return response
+
+        replay_requester.async_http_request = busy_tv
+        # Served by the generic path instead
+        assert await device.async_get_volume() == 27
+
+        busy = False
+        setup_requests = len(replay_requester.requests)
+        await device.async_get_volume()
+        # The busy answer only cost that one call its fast path
+        assert len(replay_requester.requests) - setup_requests == 1
+
+        busy = True
+        for _ in range(FAST_PATH_MAX_FAILURES):
+            await device.async_get_volume()
+        assert device._volume_codec is None
+
+    async def test_fast_path_benchmark(self, replay_requester, record_property):
+        """Benchmark fast path against the generic action machinery."""
+        rounds = 200
+        timings = {}
+        for fast_path in (False, True):
+            device = SamsungTVUPnPDevice(
+                self.LOCATION, requester=replay_requester, fast_path=fast_path
+            )
+            await device.async_setup()
+            started = time.perf_counter()
+            for _ in range(rounds):
+                await device.async_get_volume()
+                await device.async_set_volume(25)
+            timings[fast_path] = time.perf_counter() - started
+
+        record_property("generic_us_per_round", timings[False] / rounds * 1e6)
+        record_property("fast_us_per_round", timings[True] / rounds * 1e6)
+        assert timings[True] < timings[False]
+
+
+class TestSlimDeviceModel:
+    """Test the RenderingControl-only device model."""
+
+    LOCATION = "http://192.168.1.219:7676/smp_14_"
+
+    async def test_slim_device_controls_volume(self, replay_requester):
+        """Test a slim device keeps only RenderingControl and still works."""
+        device = SamsungTVUPnPDevice(
+            self.LOCATION, requester=replay_requester, slim=True
+        )
+        await device.async_setup()
+
+        upnp_device = device._upnp_device
+        assert list(upnp_device.services) == [RENDERING_CONTROL]
+        assert set(upnp_device.service(RENDERING_CONTROL).actions) == {
+            "GetVolume",
+            "SetVolume",
+            "GetMute",
+            "SetMute",
+        }
+        assert device.get_device_info()["friendly_name"] == "[TV]Samsung LED60"
+        # Built once per setup
+        assert device.get_device_info() is device.get_device_info()
+
+        assert await device.async_get_volume() == 17
+        await device.async_set_volume(25)
+
+    async def test_slim_device_memory(self, replay_requester, record_property):
+        """Report per-device memory of the full and slim models."""
+        devices_per_run = 10
+        per_device = {}
+        for slim in (False, True):
+            devices = []
+            gc.collect()
+            tracemalloc.start()
+            try:
+                before = tracemalloc.get_traced_memory()[0]
+                for _ in range(devices_per_run):
+                    device = SamsungTVUPnPDevice(
+                        self.LOCATION, requester=replay_requester, slim=slim
+                    )
+                    await device.async_setup()
+                    devices.append(device)
+                gc.collect()
+                after = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            per_device[slim] = (after - before) / devices_per_run
+
+        record_property("full_model_kib_per_device", per_device[False] / 1024)
+        record_property("slim_model_kib_per_device", per_device[True] / 1024)
+        assert per_device[True] < per_device[False] * 0.75
+
+
+class TestEventSequenceTracking:
+    """Test GENA SEQ gap detection."""
+
+    LOCATION = "http://192.168.1.219:7676/smp_14_"
+
+    @pytest.fixture
+    def event_handler(self):
+        """Event handler stand-in exposing the on_pre_notify hook."""
+        handler = MagicMock()
+        handler.on_pre_notify = lambda http_request: http_request
+        return handler
+
+    @staticmethod
+    def notify(event_handler, seq, sid="uuid:rc-subscription-1"):
+        """Pass a NOTIFY with the given SEQ through the event handler hook."""
+        event_handler.on_pre_notify(
+            HttpRequest("NOTIFY", "/notify", {"SID": sid, "SEQ": str(seq)}, "")
+        )
+
+    async def subscribed_device(self, event_handler):
+        """Set up a device subscribed with a resync callback."""
+        device = SamsungTVUPnPDevice(self.LOCATION, event_handler=event_handler)
+        await device.async_setup()
+        resync = MagicMock()
+        assert await device.async_subscribe_events(MagicMock(), resync)
+        return device, resync
+
+    async def test_replayed_events_have_no_gaps(
+        self, mock_upnp_factory, event_handler, replay_requester
+    ):
+        """Test a clean recorded event sequence does not trigger a resync."""
+        device, resync = await self.subscribed_device(event_handler)
+
+        async def handle_notify(http_request):
+            event_handler.on_pre_notify(http_request)
+
+        await replay_requester.async_replay_notifies(handle_notify)
+
+        resync.assert_not_called()
+        assert device.event_gaps == 0
+
+    async def test_gap_and_reset_trigger_resync(self, mock_upnp_factory, event_handler):
+        """Test missing SEQs and a reset are counted and trigger a resync."""
+        device, resync = await self.subscribed_device(event_handler)
+
+        for seq in (0, 1, 4):
+            self.notify(event_handler, seq)
+        assert device.event_gaps == 1
+        assert device.missed_events == 2
+        resync.assert_called_once_with("event sequence gap")
+
+        # Duplicates are ignored
+        self.notify(event_handler, 3)
+        assert device.event_gaps == 1
+
+        self.notify(event_handler, 0)
+        assert device.event_gaps == 2
+        resync.assert_called_with("event sequence reset")
+
+    async def test_seq_wraps_without_gap(self, mock_upnp_factory, event_handler):
+        """Test SEQ wrapping from 2^32-1 to 1 is not a gap."""
+        device, resync = await self.subscribed_device(event_handler)
+        device._event_sequences["uuid:rc-subscription-1"] = EVENT_SEQ_MAX - 1
+
+        self.notify(event_handler, EVENT_SEQ_MAX)
+        self.notify(event_handler, 1)
+
+        resync.assert_not_called()
+
+    async def test_failed_renewal_triggers_resync(self, mock_upnp_factory, event_handler):
+        """Test DmrDevice's empty event after a failed renewal triggers a resync."""
+        device, resync = await self.subscribed_device(event_handler)
+
+        device._handle_upnp_event(MagicMock(service_type=RENDERING_CONTROL), [])
+
+        resync.assert_called_once_with("subscription renewal failed")
+
+    async def test_unsubscribe_restores_hook(self, mock_upnp_factory, event_handler):
+        """Test the NOTIFY hook is removed when unsubscribing."""
+        original = event_handler.on_pre_notify
+        device, _ = await self.subscribed_device(event_handler)
+        assert event_handler.on_pre_notify != original
+
+        await device.async_unsubscribe_events()
+
+        assert event_handler.on_pre_notify is original
+
+    async def test_close_cut_short_releases_device(
+        self, mock_upnp_factory, event_handler
+    ):
+        """Test a close cancelled while the TV hangs still drops hooks and state."""
+        original = event_handler.on_pre_notify
+        device, _ = await self.subscribed_device(event_handler)
+        unsubscribing = asyncio.Event()
+
+        async def _hang():
+            unsubscribing.set()
+            await asyncio.Event().wait()
+
+        mock_upnp_factory["dmr_device"].async_unsubscribe_services.side_effect = _hang
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await device.async_close()
+
+        assert unsubscribing.is_set()
+        assert event_handler.on_pre_notify is original
+        assert mock_upnp_factory["dmr_device"].on_event is None
+        assert not device.is_connected